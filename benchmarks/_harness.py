@@ -0,0 +1,148 @@
+"""
+Shared timing / allocation helpers for the SuperKit benchmarks.
+
+Run any benchmark from the repository root, e.g.:
+
+    python benchmarks/bench_log_api.py
+"""
+
+import gc
+import json
+import time
+import platform
+import subprocess
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+def measure(fn, *, iterations: int = 20_000, warmup: int = 1_000) -> dict:
+    """
+    Time `fn()` per call and measure its allocations.
+
+    Returns ops/sec, p50/p99 latency (µs), peak bytes allocated while a
+    single call runs (allocation pressure) and bytes still retained per
+    op afterwards (leaks).
+    """
+    for _ in range(warmup):
+        fn()
+
+    # Latency
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        clock = time.perf_counter_ns
+        for _ in range(iterations):
+            start = clock()
+            fn()
+            samples.append(clock() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    samples.sort()
+    total_ns = sum(samples)
+
+    # Allocations (separate pass; tracing skews timings)
+    alloc_iterations = min(iterations, 2_000)
+    peak_total = 0
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        for _ in range(alloc_iterations):
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            fn()
+            peak_total += tracemalloc.get_traced_memory()[1] - base
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(max(s.size_diff, 0) for s in stats)
+
+    return {
+        "ops_per_sec": round(iterations / (total_ns / 1e9), 1) if total_ns else 0.0,
+        "p50_us": round(samples[len(samples) // 2] / 1e3, 3),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] / 1e3, 3),
+        "peak_bytes_per_op": round(peak_total / alloc_iterations, 1),
+        "retained_bytes_per_op": round(retained / alloc_iterations, 1),
+    }
+
+
+def report(name: str, result: dict) -> None:
+    print(
+        f"{name:<40} "
+        f"{result['ops_per_sec']:>12,.0f} ops/s  "
+        f"p50 {result['p50_us']:>8.2f}µs  "
+        f"p99 {result['p99_us']:>8.2f}µs  "
+        f"{result['peak_bytes_per_op']:>8.1f} B/op peak  "
+        f"{result['retained_bytes_per_op']:>8.1f} B/op retained"
+    )
+
+
+# ---------- stored results ----------
+
+def environment() -> dict:
+    """
+    Where a result was measured: commit, Python and machine.
+    """
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def save_results(path, suite: str, results: dict, **params) -> Path:
+    """
+    Write `{"suite", "environment", "params", "results"}` as JSON.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(
+        {"suite": suite, "environment": environment(), "params": params, "results": results},
+        indent=2,
+    ) + "\n")
+    return path
+
+
+def compare(baseline_path, results: dict, *, threshold: float = 0.10) -> int:
+    """
+    Print throughput and p99 changes against a stored run.
+
+    Returns the number of cases slower than `threshold` (a fraction) in
+    either metric.
+    """
+    baseline = json.loads(Path(baseline_path).read_text())
+    before = baseline["results"]
+    print(f"\ncompared with {baseline['environment'].get('commit') or baseline_path}")
+
+    regressions = 0
+    for name, result in results.items():
+        old = before.get(name)
+        if old is None:
+            continue
+
+        ops = result["ops_per_sec"] / old["ops_per_sec"] - 1 if old["ops_per_sec"] else 0.0
+        p99 = result["p99_us"] / old["p99_us"] - 1 if old["p99_us"] else 0.0
+        slower = ops < -threshold or p99 > threshold
+        regressions += slower
+
+        print(
+            f"{name:<40} ops/s {ops:>+7.1%}  p99 {p99:>+7.1%}"
+            f"{'  REGRESSION' if slower else ''}"
+        )
+    return regressions
@@ -0,0 +1,116 @@
+"""
+Boot and first `/openapi.json` latency with and without `superkit build`.
+
+Generates projects of increasing size (see bench_mount_apps.py) and, in
+fresh interpreters, boots `create_app(environment="production")` eager
+and lazy, from sources and from a build artifact:
+
+    python benchmarks/bench_build.py --apps 10 40 --controllers 8
+"""
+
+import sys
+import json
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+from _harness import environment, save_results
+from bench_mount_apps import generate
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_BOOT = """
+import asyncio, json, os, sys, time
+os.chdir(sys.argv[1])
+sys.path.insert(0, "src")
+mode, lazy = sys.argv[2], sys.argv[3] == "1"
+if mode != "build":
+    os.environ["SUPERKIT_BUILD"] = "off"
+
+start = time.perf_counter()
+from superkit import create_app
+app = create_app(environment="production").mount_apps(include_all=True, lazy=lazy)
+boot_ms = (time.perf_counter() - start) * 1000
+
+if mode == "write":
+    from pathlib import Path
+    from superkit.runtime.build import write_build
+    write_build(app, Path.cwd())
+    print(json.dumps({}))
+    sys.exit()
+
+
+async def get(path):
+    sent = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": None, "server": None,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    assert sent[0]["status"] == 200, sent[0]
+    return (time.perf_counter() - start) * 1000
+
+
+print(json.dumps({
+    "boot_ms": boot_ms,
+    "openapi_ms": asyncio.run(get("/openapi.json")),
+    "used_build": app.state.build is not None,
+}))
+"""
+
+
+def run(root: Path, mode: str, lazy: bool) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", _BOOT, str(root), mode, "1" if lazy else "0"],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--apps", type=int, nargs="+", default=[10, 40])
+    parser.add_argument("--controllers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="JSON results file")
+    args = parser.parse_args()
+
+    results = {}
+    for apps in args.apps:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            generate(root, apps, args.controllers)
+            run(root, "write", lazy=False)
+
+            for lazy in (False, True):
+                for mode in ("sources", "build"):
+                    name = f"{apps} apps, {'lazy' if lazy else 'eager'}, {mode}"
+                    runs = [run(root, mode, lazy) for _ in range(args.runs)]
+                    assert all(r["used_build"] == (mode == "build") for r in runs), name
+                    results[name] = {
+                        "boot_ms_p50": round(statistics.median(r["boot_ms"] for r in runs), 1),
+                        "openapi_ms_p50": round(statistics.median(r["openapi_ms"] for r in runs), 1),
+                    }
+                    r = results[name]
+                    print(
+                        f"{name:<28} boot p50 {r['boot_ms_p50']:>8.1f} ms  "
+                        f"first /openapi.json {r['openapi_ms_p50']:>8.1f} ms"
+                    )
+
+    output = args.output or RESULTS_DIR / f"build-{environment()['commit'] or 'local'}.json"
+    print(f"results: {save_results(output, 'build', results, apps=args.apps, controllers=args.controllers)}")
+
+
+if __name__ == "__main__":
+    main()
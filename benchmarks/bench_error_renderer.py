@@ -0,0 +1,60 @@
+"""
+ErrorPanelRenderer throughput during an error storm.
+
+Renders the same deep traceback 10k times (as when every request fails
+with the same bug) and prints it to a null console.
+
+    python benchmarks/bench_error_renderer.py
+"""
+
+import os
+import sys
+import time
+
+from rich.console import Console
+
+from superkit.logging.renderers.error import ErrorPanelRenderer
+
+TRACEBACKS = 10_000
+# Printing is dominated by Rich layout; a smaller sample is enough
+PRINTED = 1_000
+DEPTH = 30
+
+
+def _recurse(depth: int):
+    if depth == 0:
+        raise ValueError("database unavailable")
+    _recurse(depth - 1)
+
+
+def _capture():
+    try:
+        _recurse(DEPTH)
+    except ValueError:
+        return sys.exc_info()
+
+
+def main():
+    exc_info = _capture()
+    renderer = ErrorPanelRenderer()
+
+    with open(os.devnull, "w") as devnull:
+        console = Console(file=devnull, width=120)
+
+        start = time.perf_counter()
+        for _ in range(TRACEBACKS):
+            renderer.render(*exc_info)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(PRINTED):
+            console.print(renderer.render(*exc_info))
+        total = time.perf_counter() - start
+
+    print(f"tracebacks:          {TRACEBACKS} (depth {DEPTH})")
+    print(f"build panels:        {TRACEBACKS / build:>10,.0f} /s")
+    print(f"build + print:       {PRINTED / total:>10,.0f} /s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Latency and allocation rate of the `log.*` entry API.
+
+The `superkit.apps` logger is pointed at a discarding handler so only the
+entry/record path is measured, not rendering. Before timing, the entry
+lifecycle is checked: held entries stay open while others are logged, and
+adding to an emitted entry does nothing.
+
+    python benchmarks/bench_log_api.py
+"""
+
+import logging
+
+from _harness import measure, report
+
+from superkit.logging import log
+
+
+class _DiscardHandler(logging.Handler):
+    def emit(self, record):
+        pass
+
+
+class _CollectHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append((record.msg.message, len(record.msg.attachments)))
+
+
+def check_lifecycle(logger):
+    collect = _CollectHandler()
+    logger.handlers[:] = [collect]
+
+    with log.info("outer") as outer:
+        log.info("inner")
+        outer.add_json({"id": 1})
+
+    first = log.info("first")
+    second = log.info("second")
+    first.add_json({"id": 1})
+    first.emit()
+    first.add_json({"id": 2})
+    second.emit()
+
+    expected = [("inner", 0), ("outer", 1), ("first", 1), ("second", 0)]
+    assert collect.records == expected, collect.records
+
+
+def main():
+    logger = logging.getLogger("superkit.apps")
+    logger.handlers[:] = [_DiscardHandler()]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    check_lifecycle(logger)
+    logger.handlers[:] = [_DiscardHandler()]
+
+    payload = {"id": 1, "name": "Alice"}
+
+    def implicit():
+        log.info("hello")
+
+    def explicit():
+        log.info("hello").emit()
+
+    def with_block():
+        with log.info("hello") as entry:
+            entry.add_json(payload)
+
+    def pooled():
+        log.info("hello", pooled=True).add_json(payload).emit()
+
+    def disabled():
+        log.debug(lambda: f"state {payload}").add_json(lambda: dict(payload))
+
+    for name, fn in (
+        ("log.info (implicit)", implicit),
+        ("log.info().emit()", explicit),
+        ("with log.info() + add_json", with_block),
+        ("pooled + add_json + emit", pooled),
+        ("log.debug (disabled) + lazy add_json", disabled),
+    ):
+        report(name, measure(fn))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+End-to-end cost of `superkit.logging` per record.
+
+Every path runs through a synchronous `SuperKitPanelHandler` (no writer
+thread, so the whole cost lands on the measured call) against three
+consoles:
+
+- null: plain console writing to /dev/null (layout only)
+- file: plain console writing to a real file
+- tty:  80x24 truecolor terminal writing to /dev/null (layout + ANSI)
+
+Paths:
+
+- `log.info`, `log.warning` + `add_json`, `log.critical` + `add_table`
+- an access record from `AccessLogMiddleware` with two grouped entries
+- a raw uvicorn access record (what uvicorn itself would log)
+- a 30-frame traceback through `ErrorPanelRenderer`, dedup disabled
+
+Results (records/sec, p50/p99 latency, bytes allocated per record) are
+printed and stored as JSON so runs can be compared between commits:
+
+    python benchmarks/bench_logging_suite.py
+    python benchmarks/bench_logging_suite.py --compare benchmarks/results/logging-<commit>.json
+"""
+
+import os
+import sys
+import logging
+import argparse
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+from rich.console import Console
+
+from _harness import measure, report, environment, save_results, compare
+
+from superkit.logging import log
+from superkit.logging.config import configure
+from superkit.logging.handler import SuperKitPanelHandler
+from superkit.logging.record import SuperKitLogRecord
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+# Printing is dominated by Rich layout; a few thousand records are enough
+ITERATIONS = 2_000
+WARMUP = 100
+DEPTH = 30
+
+
+def _recurse(depth: int):
+    if depth == 0:
+        raise ValueError("database unavailable")
+    _recurse(depth - 1)
+
+
+def _capture():
+    try:
+        _recurse(DEPTH)
+    except ValueError:
+        return sys.exc_info()
+
+
+def _consoles(directory: str) -> dict[str, Console]:
+    return {
+        "null": Console(file=open(os.devnull, "w"), width=100),
+        "file": Console(file=open(os.path.join(directory, "console.log"), "w"), width=100),
+        "tty": Console(
+            file=open(os.devnull, "w"),
+            width=80,
+            height=24,
+            force_terminal=True,
+            color_system="truecolor",
+        ),
+    }
+
+
+def _paths(handler: SuperKitPanelHandler) -> dict:
+    apps = logging.getLogger("superkit.apps")
+    apps.handlers[:] = [handler]
+    apps.propagate = False
+    apps.setLevel(logging.INFO)
+
+    payload = {"order": {"id": 42, "items": [{"sku": "A-1", "qty": 2}, {"sku": "B-7", "qty": 1}]}}
+    rows = [["id", "name", "score"]] + [[i, f"user-{i}", i * 0.5] for i in range(200)]
+
+    access = SuperKitLogRecord(
+        kind="http",
+        level="INFO",
+        title="GET /api/orders?page=2",
+        meta={
+            "method": "GET",
+            "path": "/api/orders?page=2",
+            "status": 200,
+            "client": "127.0.0.1:54321",
+            "protocol": "HTTP/1.1",
+            "duration_ms": 3.2,
+            "bytes": 512,
+            "request_id": "5f0c1e",
+        },
+        entries=[
+            SuperKitLogRecord(kind="user", level="INFO", title="INFO", message="loading orders"),
+            SuperKitLogRecord(kind="user", level="WARNING", title="WARNING", message="cache miss"),
+        ],
+    )
+    access_record = logging.LogRecord("superkit.http", logging.INFO, __file__, 0, access, None, None)
+
+    raw_access = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0,
+        '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:54321", "GET", "/api/orders?page=2", "1.1", 200),
+        None,
+    )
+
+    error_record = logging.LogRecord(
+        "uvicorn.error", logging.ERROR, __file__, 0,
+        "Exception in ASGI application", None, _capture(),
+    )
+
+    return {
+        "log.info": lambda: log.info("order created").emit(),
+        "log.warning + add_json": lambda: log.warning("slow order").add_json(payload).emit(),
+        "log.critical + add_table": lambda: log.critical("bad scores").add_table(rows).emit(),
+        "access record (middleware)": lambda: handler.handle(access_record),
+        "access record (raw uvicorn)": lambda: handler.handle(raw_access),
+        f"error panel (depth {DEPTH})": lambda: handler.handle(error_record),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=ITERATIONS)
+    parser.add_argument("--output", type=Path, help="JSON results file")
+    parser.add_argument("--compare", type=Path, help="Earlier JSON results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Regression threshold (fraction)")
+    args = parser.parse_args()
+
+    # Inline handlers; every error renders instead of collapsing
+    configure(SimpleNamespace(log_async_writer=False, log_error_window=0))
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for console_name, console in _consoles(directory).items():
+            handler = SuperKitPanelHandler(console=console)
+            for path_name, fn in _paths(handler).items():
+                name = f"{path_name} [{console_name}]"
+                results[name] = measure(fn, iterations=args.iterations, warmup=WARMUP)
+                report(name, results[name])
+            handler.close()
+            console.file.close()
+
+    output = args.output or RESULTS_DIR / f"logging-{environment()['commit'] or 'local'}.json"
+    print(f"\nresults: {save_results(output, 'logging', results, iterations=args.iterations)}")
+
+    if args.compare:
+        regressions = compare(args.compare, results, threshold=args.threshold)
+        sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""
+Boot cost of `mount_apps()` for a generated project with many apps.
+
+Each run is a fresh interpreter that mounts every app. Runs are "cold"
+(all __pycache__ directories removed first) or "warm", each eager
+(with and without `prefetch=True`) and lazy (`lazy=True`, plus the
+first request to one app). Reports the median mount time and the
+slowest modules, and stores JSON results like the other suites:
+
+    python benchmarks/bench_mount_apps.py --apps 40 --controllers 8
+"""
+
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+import statistics
+import subprocess
+from pathlib import Path
+
+from _harness import environment, save_results
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+_MOUNT = """
+import asyncio, json, os, sys, time
+os.chdir(sys.argv[1])
+sys.path.insert(0, "src")
+from superkit.api.application import SuperKitApp
+
+mode = sys.argv[2]
+app = SuperKitApp()
+start = time.perf_counter()
+app.mount_apps(include_all=True, prefetch=mode == "prefetch", lazy=mode == "lazy")
+mount_ms = (time.perf_counter() - start) * 1000
+
+
+async def first_request():
+    sent = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/app000/resource00", "raw_path": b"/app000/resource00", "root_path": "",
+        "query_string": b"", "headers": [], "client": None, "server": None,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    assert sent[0]["status"] == 200, sent[0]
+    return (time.perf_counter() - start) * 1000
+
+
+request_ms = asyncio.run(first_request())
+report = app.state.import_report
+print(json.dumps({
+    "mount_ms": mount_ms,
+    "first_request_ms": request_ms,
+    "prefetch_ms": report.prefetch_ms,
+    "import_ms": report.import_ms,
+    "modules": sum(1 for t in report.modules.values() if t.total_ms),
+    "slowest": [[t.module, t.self_ms] for t in report.slowest(3)],
+}))
+"""
+
+_CONTROLLER = '''from apps.{app}.controllers import router
+from apps.{app}.schemas import {model}
+
+
+@router.get("/{name}")
+def list_{name}(limit: int = 10, offset: int = 0):
+    """List {name}."""
+    return {{"app": "{app}", "items": [], "limit": limit, "offset": offset}}
+
+
+@router.get("/{name}/{{item_id}}")
+def get_{name}(item_id: int) -> {model}:
+    return {model}(id=item_id, title="{name}")
+
+
+@router.post("/{name}")
+def create_{name}(item: {model}) -> {model}:
+    return item
+'''
+
+
+def generate(root: Path, apps: int, controllers: int) -> None:
+    """
+    A src-layout project shaped like `superkit apps init` output.
+    """
+    apps_dir = root / "src" / "apps"
+    apps_dir.mkdir(parents=True)
+    (apps_dir / "__init__.py").write_text("")
+
+    for a in range(apps):
+        app = f"app{a:03d}"
+        model = f"Item{a:03d}"
+        app_dir = apps_dir / app
+        for package in ("controllers", "schemas", "services", "models"):
+            (app_dir / package).mkdir(parents=True)
+        (app_dir / "__init__.py").write_text("")
+
+        (app_dir / "app.py").write_text(
+            "from superkit.apps import AppConfig\n"
+            f"from apps.{app}.controllers import router as {app}_router\n\n\n"
+            f"class App{a:03d}(AppConfig):\n"
+            f'    name = "{app}"\n'
+            f'    url_prefix = "/{app}"\n'
+            f'    tags = ["{app}"]\n\n'
+            f"    routers = [{app}_router]\n"
+        )
+        (app_dir / "controllers" / "__init__.py").write_text(
+            "from superkit.routing import ControllerGroup\n\n"
+            "router = ControllerGroup()\n\n"
+            "router.mount_controllers(__name__, __path__, recursive=False)\n"
+        )
+        (app_dir / "schemas" / "__init__.py").write_text(
+            "from pydantic import BaseModel\n\n\n"
+            f"class {model}(BaseModel):\n"
+            "    id: int\n"
+            "    title: str\n"
+            "    description: str | None = None\n"
+        )
+        (app_dir / "services" / "__init__.py").write_text("")
+        (app_dir / "models" / "__init__.py").write_text("")
+
+        for c in range(controllers):
+            name = f"resource{c:02d}"
+            (app_dir / "controllers" / f"{name}.py").write_text(
+                _CONTROLLER.format(app=app, model=model, name=name)
+            )
+
+
+def run(root: Path, *, mode: str, cold: bool) -> dict:
+    if cold:
+        for cache in root.rglob("__pycache__"):
+            shutil.rmtree(cache)
+    output = subprocess.run(
+        [sys.executable, "-c", _MOUNT, str(root), mode],
+        capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--apps", type=int, default=40)
+    parser.add_argument("--controllers", type=int, default=8)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="JSON results file")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        root = Path(directory)
+        generate(root, args.apps, args.controllers)
+        # Builds the discovery manifest, so runs measure mounting only
+        run(root, mode="eager", cold=False)
+
+        for cold in (True, False):
+            for mode in ("eager", "prefetch", "lazy"):
+                name = f"{'cold' if cold else 'warm'} cache, {mode}"
+                runs = [run(root, mode=mode, cold=cold) for _ in range(args.runs)]
+                mount = sorted(r["mount_ms"] for r in runs)
+                results[name] = {
+                    "mount_ms_p50": round(statistics.median(mount), 1),
+                    "mount_ms_min": round(mount[0], 1),
+                    "first_request_ms_p50": round(statistics.median(r["first_request_ms"] for r in runs), 1),
+                    "prefetch_ms_p50": round(statistics.median(r["prefetch_ms"] for r in runs), 1),
+                    "modules": runs[0]["modules"],
+                }
+                r = results[name]
+                print(
+                    f"{name:<22} mount p50 {r['mount_ms_p50']:>8.1f} ms  "
+                    f"min {r['mount_ms_min']:>8.1f} ms  "
+                    f"first request {r['first_request_ms_p50']:>7.1f} ms  "
+                    f"prefetch {r['prefetch_ms_p50']:>7.1f} ms  "
+                    f"({r['modules']} modules imported)"
+                )
+                if mode == "prefetch":
+                    slowest = runs[-1]["slowest"]
+
+        slowest = ", ".join(f"{m} {ms:.1f} ms" for m, ms in slowest)
+        print(f"\nslowest modules (self time): {slowest}")
+
+    output = args.output or RESULTS_DIR / f"mount-{environment()['commit'] or 'local'}.json"
+    print(f"results: {save_results(output, 'mount', results, apps=args.apps, controllers=args.controllers)}")
+
+
+if __name__ == "__main__":
+    main()
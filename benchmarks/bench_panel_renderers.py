@@ -0,0 +1,68 @@
+"""
+Panel renderer throughput, in panels per second.
+
+Measures building the Rich panel for typical user / http / json records
+(render only) and rendering plus printing it to a null console, which
+is the console path a loaded dev server spends its time in.
+
+    python benchmarks/bench_panel_renderers.py
+"""
+
+import os
+
+from rich.console import Console
+
+from _harness import measure, report
+
+from superkit.logging.record import SuperKitLogRecord
+from superkit.logging.renderers.user import UserPanelRenderer
+from superkit.logging.renderers.http import HttpPanelRenderer
+from superkit.logging.renderers.json import JsonPanelRenderer
+
+RENDER_ITERATIONS = 20_000
+# Printing is dominated by Rich layout; a smaller sample is enough
+PRINT_ITERATIONS = 2_000
+
+
+def main():
+    console = Console(file=open(os.devnull, "w"), width=100, force_terminal=True)
+
+    user = UserPanelRenderer()
+    http = HttpPanelRenderer()
+    json = JsonPanelRenderer()
+
+    user_record = SuperKitLogRecord(kind="user", level="INFO", title="INFO", message="order created")
+    http_record = SuperKitLogRecord(
+        kind="http",
+        level="INFO",
+        title="GET /api/orders",
+        meta={
+            "method": "GET",
+            "path": "/api/orders",
+            "status": 200,
+            "client": "127.0.0.1:54321",
+            "protocol": "HTTP/1.1",
+            "duration_ms": 3.2,
+            "bytes": 512,
+        },
+    )
+    json_record = SuperKitLogRecord(kind="json", level="INFO", title="JSON", data={"id": 1, "items": [1, 2, 3]})
+
+    cases = (
+        ("user panel", user, user_record),
+        ("http panel", http, http_record),
+        ("json panel", json, json_record),
+    )
+
+    for name, renderer, record in cases:
+        report(f"{name} (render)", measure(lambda: renderer.render(record), iterations=RENDER_ITERATIONS))
+
+    for name, renderer, record in cases:
+        report(
+            f"{name} (render + print)",
+            measure(lambda: console.print(renderer.render(record)), iterations=PRINT_ITERATIONS, warmup=100),
+        )
+
+
+if __name__ == "__main__":
+    main()
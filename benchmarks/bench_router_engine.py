@@ -0,0 +1,78 @@
+"""
+Request routing cost with N routes, default vs radix router engine.
+
+The default engine tries an app's routes in order; with
+`SuperKitApp(router_engine="radix")` the route is looked up in a tree of
+path segments. Routes come from a superkit `Router` included in the app,
+half static (`/api/resource0007`), half with an int parameter
+(`/api/resource0007/{item_id}`). Each case sends full ASGI requests to
+the first, middle and last route, to a wrong method and to an unknown
+path:
+
+    python benchmarks/bench_router_engine.py --routes 10 100 1000
+"""
+
+import time
+import argparse
+from pathlib import Path
+
+from _harness import environment, measure, report, save_results
+from bench_routing import requester
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def build(routes: int, engine: str):
+    from superkit.api.application import SuperKitApp
+    from superkit.routing import Router
+
+    router = Router(path="/api")
+    for i in range(routes // 2):
+        router.add_api_route(f"/resource{i:04d}", lambda: {}, methods=["GET"], name=f"list{i}")
+        router.add_api_route(f"/resource{i:04d}/{{item_id}}", lambda item_id: {"id": item_id}, methods=["GET"], name=f"get{i}")
+    router.add_api_route("/submit", lambda: {}, methods=["POST"])
+
+    app = SuperKitApp(router_engine=engine)
+    app.include_router(router)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--routes", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--iterations", type=int, default=3_000)
+    parser.add_argument("--output", type=Path, help="JSON results file")
+    args = parser.parse_args()
+
+    results = {}
+    for routes in args.routes:
+        instances = {engine: build(routes, engine) for engine in ("default", "radix")}
+
+        start = time.perf_counter()
+        instances["radix"].state.route_matcher.compile()
+        print(f"\n{routes} routes (radix index: {(time.perf_counter() - start) * 1000:.1f} ms)")
+
+        last = routes // 2 - 1
+        targets = {
+            "first route": ("/api/resource0000", 200),
+            "middle route": (f"/api/resource{last // 2:04d}/7", 200),
+            "last route": (f"/api/resource{last:04d}/7", 200),
+            "wrong method": ("/api/submit", 405),
+            "not found": ("/missing/path", 404),
+        }
+        for target, (path, status) in targets.items():
+            for engine, app in instances.items():
+                name = f"{routes} routes, {target}, {engine}"
+                results[name] = measure(
+                    requester(app, path, status),
+                    iterations=args.iterations,
+                    warmup=args.iterations // 10,
+                )
+                report(name, results[name])
+
+    output = args.output or RESULTS_DIR / f"router-engine-{environment()['commit'] or 'local'}.json"
+    print(f"\nresults: {save_results(output, 'router_engine', results, routes=args.routes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Request routing cost with N apps x M routes, eager vs isolated mounts.
+
+Eager mounts put every app's routes in one list that Starlette tries in
+order; `mount_apps(isolated=True)` picks the app by prefix first and
+only then tries that app's routes. Each case sends full ASGI requests
+to a route of the first, middle and last app, and to an unknown path:
+
+    python benchmarks/bench_routing.py --apps 10 40 100 --controllers 8
+"""
+
+import os
+import sys
+import asyncio
+import argparse
+import tempfile
+from pathlib import Path
+
+from _harness import environment, measure, report, save_results
+from bench_mount_apps import generate
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def requester(app, path: str, status: int):
+    loop = asyncio.new_event_loop()
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": path, "raw_path": path.encode(), "root_path": "",
+        "query_string": b"", "headers": [], "client": None, "server": None,
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            assert message["status"] == status, (path, message["status"])
+
+    def request():
+        loop.run_until_complete(app(dict(scope), receive, send))
+
+    request()
+    return request
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--apps", type=int, nargs="+", default=[10, 40, 100])
+    parser.add_argument("--controllers", type=int, default=8, help="3 routes each")
+    parser.add_argument("--iterations", type=int, default=3_000)
+    parser.add_argument("--output", type=Path, help="JSON results file")
+    args = parser.parse_args()
+
+    from superkit.api.application import SuperKitApp
+
+    results = {}
+    cwd = os.getcwd()
+    for apps in args.apps:
+        with tempfile.TemporaryDirectory() as directory:
+            root = Path(directory)
+            generate(root, apps, args.controllers)
+            os.chdir(root)
+            sys.path.insert(0, str(root / "src"))
+            try:
+                instances = {}
+                for mode in ("eager", "isolated"):
+                    instances[mode] = SuperKitApp()
+                    instances[mode].mount_apps(include_all=True, isolated=mode == "isolated")
+
+                last = f"resource{args.controllers - 1:02d}"
+                targets = {
+                    "first app": (f"/app000/{last}/1", 200),
+                    "middle app": (f"/app{apps // 2:03d}/{last}/1", 200),
+                    "last app": (f"/app{apps - 1:03d}/{last}/1", 200),
+                    "not found": ("/missing/path", 404),
+                }
+                print(f"\n{apps} apps x {args.controllers * 3} routes")
+                for target, (path, status) in targets.items():
+                    for mode, app in instances.items():
+                        name = f"{apps} apps, {target}, {mode}"
+                        results[name] = measure(
+                            requester(app, path, status),
+                            iterations=args.iterations,
+                            warmup=args.iterations // 10,
+                        )
+                        report(name, results[name])
+            finally:
+                os.chdir(cwd)
+                sys.path.remove(str(root / "src"))
+                for module in [m for m in sys.modules if m == "apps" or m.startswith("apps.")]:
+                    del sys.modules[module]
+
+    output = args.output or RESULTS_DIR / f"routing-{environment()['commit'] or 'local'}.json"
+    print(f"\nresults: {save_results(output, 'routing', results, apps=args.apps, controllers=args.controllers)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,15 +7,37 @@ that provides structure, conventions, and tooling without hiding
 how things work.
 """
 
-# Application factory
-from superkit.api.app_factory import create_app
+from typing import TYPE_CHECKING
 
-# Public contracts
-from superkit.apps.config import AppConfig
-from superkit.routing.router import Router
+if TYPE_CHECKING:
+    from superkit.api.app_factory import create_app
+    from superkit.apps.config import AppConfig
+    from superkit.routing.router import Router
+
+# Public name -> defining module. Resolved on first access, so tools
+# that only need e.g. the app manifest do not import FastAPI.
+_EXPORTS = {
+    # Application factory
+    "create_app": "superkit.api.app_factory",
+    # Public contracts
+    "AppConfig": "superkit.apps.config",
+    "Router": "superkit.routing.router",
+}
 
 __all__ = [
     "create_app",
     "AppConfig",
     "Router",
 ]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module 'superkit' has no attribute '{name}'")
+
+    from importlib import import_module
+
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
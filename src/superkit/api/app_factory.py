@@ -1,9 +1,15 @@
 from superkit.api.application import SuperKitApp
 from superkit.runtime.registry import runtime
 from superkit.logging import setup_logging
+from superkit.logging.config import config as logging_config
+from superkit.logging.middleware import AccessLogMiddleware
+from superkit.logging.endpoint import recent_logs
 
 from superkit.runtime.bootstrap import ensure_src_on_path
+from superkit.runtime.profiling import profiled
+from superkit.runtime.build import load_build
 
+@profiled()
 def create_app(
     *,
     settings=None,
@@ -14,7 +20,7 @@ def create_app(
     ensure_src_on_path()
 
     # Initializing Logging
-    setup_logging()
+    setup_logging(settings)
 
 
     fastapi_kwargs = {}
@@ -44,6 +50,7 @@ def create_app(
             "host": settings.host,
             "port": settings.port,
             "reload": settings.reload,
+            "workers": getattr(settings, "workers", 1),
             "environment": environment,
         }
 
@@ -54,6 +61,23 @@ def create_app(
         **fastapi_kwargs,
     )
 
+    # Frozen apps / OpenAPI from `superkit build` (ignored when stale)
+    if environment == "production":
+        app.state.build = load_build()
+
+    # Structured HTTP access logs
+    if logging_config.access:
+        app.add_middleware(AccessLogMiddleware)
+
+    # Recent logs from the in-memory ring (internal, opt-in)
+    if logging_config.endpoint:
+        app.add_api_route(
+            logging_config.endpoint,
+            recent_logs,
+            methods=["GET"],
+            include_in_schema=False,
+        )
+
     # Initialize runtime once
     if settings is not None and not runtime.is_initialized():
         runtime.initialize(
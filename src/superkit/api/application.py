@@ -1,7 +1,11 @@
 from fastapi import FastAPI
+from starlette.routing import Route
 
 # Lifecycle Imports
 from superkit.lifecycle.mount_apps import mount_apps as _mount_apps
+from superkit.lifecycle.lifespan import wrap_lifespan
+from superkit.logging.middleware import LogContextMiddleware
+from superkit.routing.radix import use_radix
 
 
 class SuperKitApp(FastAPI):
@@ -9,9 +13,18 @@ class SuperKitApp(FastAPI):
     SuperKit application instance.
     """
 
-    def __init__(self, *, environment: str = "development", **kwargs):
+    def __init__(self, *, environment: str = "development", router_engine: str = "default", **kwargs):
+        if router_engine not in ("default", "radix"):
+            raise ValueError(f"Unknown router_engine '{router_engine}'; expected 'default' or 'radix'")
+
         super().__init__(**kwargs)
 
+        # Framework teardown (log flush) on shutdown
+        self.router.lifespan_context = wrap_lifespan(self.router.lifespan_context)
+
+        # Per-request log scope (flushes open log entries)
+        self.add_middleware(LogContextMiddleware)
+
         # Metadata only
         self.environment = environment
 
@@ -19,6 +32,15 @@ class SuperKitApp(FastAPI):
         self.state.installed_apps = None
         self.state.settings = None
         self.state.security = None
+        self.state.import_report = None
+        self.state.lazy_apps = None
+        self.state.isolated_apps = None
+        self.state.build = None
+        self.state.route_matcher = None
+
+        # Indexed route matching (compiled at startup)
+        if router_engine == "radix":
+            self.state.route_matcher = use_radix(self.router)
 
         # Internal mount tracking (idempotency)
         self._mounted_apps = set()
@@ -30,6 +52,10 @@ class SuperKitApp(FastAPI):
         include_all: bool = False,
         include: list[str] | None = None,
         exclude: list[str] | None = None,
+        prefetch: bool = False,
+        lazy: bool = False,
+        warmup: bool = False,
+        isolated: bool = False,
     ):
         if self.state.installed_apps is not None:
             raise RuntimeError(
@@ -42,6 +68,10 @@ class SuperKitApp(FastAPI):
             include_all=include_all,
             include=include,
             exclude=exclude,
+            prefetch=prefetch,
+            lazy=lazy,
+            warmup=warmup,
+            isolated=isolated,
         )
 
         # Persist resolved apps (not raw input)
@@ -49,5 +79,46 @@ class SuperKitApp(FastAPI):
 
         return self
 
+    def setup(self) -> None:
+        super().setup()
+        if not self.openapi_url:
+            return
+
+        # The schema lists every app: load pending lazy apps first, on
+        # the thread pool, so other requests are served meanwhile
+        routes = self.router.routes
+        for index, route in enumerate(routes):
+            if isinstance(route, Route) and route.path == self.openapi_url:
+                serve_schema = route.endpoint
+
+                async def openapi(request):
+                    lazy_apps = self.state.lazy_apps
+                    if lazy_apps is not None and lazy_apps.pending:
+                        await lazy_apps.load_pending("openapi")
+                    return await serve_schema(request)
+
+                routes[index] = Route(self.openapi_url, openapi, include_in_schema=False)
+                break
+
+    def openapi(self):
+        """
+        The OpenAPI document of the loaded apps. Never imports anything:
+        pending lazy apps are loaded by the `/openapi.json` route (or
+        `LazyApps.load_all`) before it is called.
+        """
+        # Pre-generated by `superkit build`, if it still matches
+        build = self.state.build
+        if build is not None:
+            schema = build.openapi_for(self)
+            if schema is not None:
+                return schema
+
+        schema = super().openapi()
+        # Isolated apps have their own documents
+        isolated_apps = self.state.isolated_apps
+        if isolated_apps is not None:
+            isolated_apps.merge_openapi(schema)
+        return schema
+
     def apply_security(self):
         return self
@@ -1,3 +1,17 @@
-from superkit.apps.config import AppConfig
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from superkit.apps.config import AppConfig
 
 __all__ = ["AppConfig"]
+
+
+def __getattr__(name: str):
+    # Lazy, so discovery (`superkit.apps.manifest`) does not import FastAPI
+    if name != "AppConfig":
+        raise AttributeError(f"module 'superkit.apps' has no attribute '{name}'")
+
+    from superkit.apps.config import AppConfig
+
+    globals()["AppConfig"] = AppConfig
+    return AppConfig
@@ -8,6 +8,8 @@ class AppConfig:
     url_prefix: str
     tags: list[str] = []
     routers: list = []  # ControllerGroup | APIRouter
+    # starlette.middleware.Middleware entries; only with mount_apps(isolated=True)
+    middleware: list = []
 
     def _unwrap_router(self, router):
         """
@@ -38,12 +40,15 @@ class AppConfig:
         for pkg in self._derive_controller_packages():
             import_module(pkg)
 
-    def build_router(self) -> APIRouter:
+    def build_router(self, *, prefix: str | None = None) -> APIRouter:
+        """
+        The app's routes under `prefix` (default: `url_prefix`).
+        """
         # Ensure all controllers are imported (decorators executed)
         self._load_controllers()
 
         app_router = APIRouter(
-            prefix=self.url_prefix,
+            prefix=self.url_prefix if prefix is None else prefix,
             tags=self.tags,
         )
 
@@ -0,0 +1,282 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+from importlib import import_module
+from dataclasses import dataclass, field, asdict
+
+from superkit.runtime.registry import runtime
+from superkit.runtime.bootstrap import add_import_root
+from superkit.apps.static import Diagnostic, analyze_app
+
+MANIFEST_VERSION = 2
+
+# Files whose changes invalidate an app's entry
+_APP_FILES = ("__init__.py", "app.py")
+
+
+@dataclass
+class AppEntry:
+    """
+    What discovery knows about one app, without importing it again.
+    """
+
+    name: str
+    module: str
+    config_class: str | None = None
+    # AppConfig attributes; None when not a literal (static engine)
+    config_name: str | None = None
+    url_prefix: str | None = None
+    tags: list[str] | None = None
+    routers: list[str] | None = None
+    dynamic: list[str] = field(default_factory=list)
+    # "static" (read with `ast`) or "import" (module was imported)
+    engine: str = "static"
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+    # file name -> [mtime_ns, size, sha256]
+    files: dict[str, list] = field(default_factory=dict)
+    # Why the app is not usable (import failure, no AppConfig); never persisted
+    error: str | None = None
+
+    @property
+    def valid(self) -> bool:
+        return self.config_class is not None
+
+
+@dataclass
+class AppManifest:
+    """
+    Discovered apps of a project, cached on disk and in the runtime.
+    """
+
+    apps_path: Path
+    search_root: Path
+    apps: dict[str, AppEntry] = field(default_factory=dict)
+
+    def discovered(self) -> set[str]:
+        return {name for name, entry in self.apps.items() if entry.valid}
+
+    @property
+    def path(self) -> Path:
+        return manifest_path(self.apps_path)
+
+
+def manifest_path(apps_path: Path) -> Path:
+    """
+    `<project root>/.superkit/manifest.json` (project root is the parent
+    of `apps/` or of `src/`).
+    """
+    root = apps_path.parent
+    if root.name == "src":
+        root = root.parent
+    return root / ".superkit" / "manifest.json"
+
+
+def find_app_config(module):
+    """
+    First `AppConfig` subclass defined or imported in `module`, skipping
+    classes that only serve as bases of another one.
+    """
+    from superkit.apps.config import AppConfig
+
+    configs = [
+        obj for obj in module.__dict__.values()
+        if isinstance(obj, type) and issubclass(obj, AppConfig) and obj is not AppConfig
+    ]
+    for cls in configs:
+        if not any(other is not cls and issubclass(other, cls) for other in configs):
+            return cls
+    return None
+
+
+def load_app_config(entry: AppEntry):
+    """
+    Import an app's module (once; it stays in `sys.modules`) and return
+    its `AppConfig` subclass.
+    """
+    module = import_module(entry.module)
+    config_cls = getattr(module, entry.config_class, None) if entry.config_class else None
+    return config_cls or find_app_config(module)
+
+
+# ---------- fingerprints ----------
+
+def _fingerprint(path: Path) -> list:
+    stat = path.stat()
+    return [stat.st_mtime_ns, stat.st_size, hashlib.sha256(path.read_bytes()).hexdigest()]
+
+
+def _check(entry: AppEntry, app_dir: Path) -> tuple[bool, bool]:
+    """
+    (fresh, touched) for an entry's files.
+
+    mtime and size are checked first; when they differ the content hash
+    decides, so touched but identical files (checkouts, copies) keep
+    their entry and only get their stat updated (`touched`).
+    """
+    if set(entry.files) != {name for name in _APP_FILES if (app_dir / name).exists()}:
+        return False, False
+
+    touched = False
+    for name, known in entry.files.items():
+        path = app_dir / name
+        try:
+            stat = path.stat()
+        except OSError:
+            return False, False
+        if [stat.st_mtime_ns, stat.st_size] == known[:2]:
+            continue
+        if hashlib.sha256(path.read_bytes()).hexdigest() != known[2]:
+            return False, False
+        known[:2] = [stat.st_mtime_ns, stat.st_size]
+        touched = True
+    return True, touched
+
+
+def _scan(name: str, app_dir: Path) -> AppEntry:
+    """
+    Build an entry from `app.py`'s syntax tree.
+
+    Only when that is inconclusive (the config's base class comes from
+    another module) is the module imported, through the regular import
+    system so a later `import_module` reuses it.
+    """
+    entry = AppEntry(
+        name=name,
+        module=f"apps.{name}.app",
+        files={n: _fingerprint(app_dir / n) for n in _APP_FILES if (app_dir / n).exists()},
+    )
+
+    static = analyze_app(app_dir / "app.py", entry.module)
+    entry.diagnostics = static.diagnostics
+
+    if static.conclusive:
+        error = static.error()
+        if error is not None:
+            entry.error = str(error)
+            return entry
+
+        entry.config_class = static.config_class
+        entry.config_name = static.name
+        entry.url_prefix = static.url_prefix
+        entry.tags = static.tags
+        entry.routers = static.routers
+        entry.dynamic = static.dynamic
+        return entry
+
+    entry.engine = "import"
+    try:
+        module = import_module(entry.module)
+    except Exception as e:
+        entry.error = f"import failed ({type(e).__name__}: {str(e)[:50]})"
+        return entry
+
+    config_cls = find_app_config(module)
+    if config_cls is None:
+        entry.error = "no AppConfig class found"
+        return entry
+
+    entry.config_class = config_cls.__name__
+    entry.config_name = getattr(config_cls, "name", None)
+    entry.url_prefix = getattr(config_cls, "url_prefix", None)
+    entry.tags = list(getattr(config_cls, "tags", []))
+    return entry
+
+
+# ---------- disk cache ----------
+
+def dump_entries(manifest: AppManifest) -> dict[str, dict]:
+    """
+    JSON-ready entries of the valid apps (also stored by `superkit build`).
+    """
+    return {
+        name: {k: v for k, v in asdict(entry).items() if k != "error"}
+        for name, entry in sorted(manifest.apps.items())
+        if entry.valid
+    }
+
+
+def parse_entries(apps: dict[str, dict]) -> dict[str, AppEntry]:
+    """
+    Inverse of `dump_entries`; raises TypeError / AttributeError on
+    malformed data.
+    """
+    entries = {}
+    for name, fields in apps.items():
+        fields = {**fields, "diagnostics": [Diagnostic(**d) for d in fields.get("diagnostics", ())]}
+        entries[name] = AppEntry(**fields)
+    return entries
+
+
+def _read(path: Path, apps_path: Path) -> dict[str, AppEntry]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+    if data.get("version") != MANIFEST_VERSION or data.get("apps_path") != str(apps_path):
+        return {}
+
+    try:
+        return parse_entries(data.get("apps", {}))
+    except (TypeError, AttributeError):
+        return {}
+
+
+def _write(manifest: AppManifest) -> None:
+    data = {
+        "version": MANIFEST_VERSION,
+        "apps_path": str(manifest.apps_path),
+        "apps": dump_entries(manifest),
+    }
+
+    path = manifest.path
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data, indent=2) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        # Read-only checkout: discovery still works, just uncached
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+# ---------- entry point ----------
+
+def load_manifest(apps_path: Path, search_root: Path, *, refresh: bool = False) -> AppManifest:
+    """
+    The app manifest for `apps_path`.
+
+    Reuses the runtime's copy, then the on-disk manifest; only apps
+    whose files changed (or that failed last time) are analyzed again.
+    `refresh=True` ignores both caches.
+    """
+    cached = runtime.manifest
+    if cached is not None and cached.apps_path == apps_path and not refresh:
+        return cached
+
+    add_import_root(search_root)
+
+    manifest = AppManifest(apps_path=apps_path, search_root=search_root)
+    known = {} if refresh else _read(manifest.path, apps_path)
+    changed = False
+
+    for item in sorted(apps_path.iterdir()):
+        if not (item.is_dir() and (item / "__init__.py").exists() and (item / "app.py").exists()):
+            continue
+
+        entry = known.get(item.name)
+        fresh, touched = _check(entry, item) if entry is not None else (False, False)
+        if not fresh:
+            entry = _scan(item.name, item)
+        changed = changed or touched or not fresh
+        manifest.apps[item.name] = entry
+
+    if changed or set(known) != manifest.discovered():
+        _write(manifest)
+
+    runtime.set_manifest(manifest)
+    return manifest
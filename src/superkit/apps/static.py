@@ -0,0 +1,289 @@
+import ast
+from pathlib import Path
+from dataclasses import dataclass, field
+
+# Every public path `AppConfig` can be imported from
+APP_CONFIG_NAMES = {
+    "superkit.AppConfig",
+    "superkit.apps.AppConfig",
+    "superkit.apps.config.AppConfig",
+}
+
+_LITERAL_ATTRS = ("name", "url_prefix", "tags")
+
+
+@dataclass
+class Diagnostic:
+    """
+    One finding about an app, reported instead of skipping it.
+
+    `severity` is "error" (app unusable), "warning" or "info".
+    """
+
+    severity: str
+    code: str
+    message: str
+    line: int | None = None
+
+    def __str__(self) -> str:
+        where = f"line {self.line}: " if self.line else ""
+        return f"{where}{self.message}"
+
+
+@dataclass
+class StaticApp:
+    """
+    What `analyze_app` could read from an `app.py` without running it.
+
+    `conclusive` is False when the answer depends on code elsewhere
+    (a base class imported from another module); callers then have to
+    import the module to be sure.
+    """
+
+    config_class: str | None = None
+    name: str | None = None
+    url_prefix: str | None = None
+    tags: list[str] | None = None
+    # Dotted import paths of the router objects, e.g. "apps.posts.controllers.router"
+    routers: list[str] | None = None
+    # Attributes set to something other than a literal
+    dynamic: list[str] = field(default_factory=list)
+    conclusive: bool = True
+    diagnostics: list[Diagnostic] = field(default_factory=list)
+
+    def error(self) -> Diagnostic | None:
+        return next((d for d in self.diagnostics if d.severity == "error"), None)
+
+
+# ---------- name resolution ----------
+
+def _dotted(node: ast.expr) -> str | None:
+    """
+    "a.b.c" for a Name/Attribute chain, else None.
+    """
+    parts = []
+    while isinstance(node, ast.Attribute):
+        parts.append(node.attr)
+        node = node.value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return ".".join(reversed(parts))
+
+
+def _imports(tree: ast.Module, module: str) -> dict[str, str]:
+    """
+    Local name -> fully qualified name for every import in the module.
+    """
+    package = module.rpartition(".")[0]
+    names = {}
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.asname:
+                    names[alias.asname] = alias.name
+                else:
+                    # `import a.b` binds `a`
+                    top = alias.name.partition(".")[0]
+                    names[top] = top
+        elif isinstance(node, ast.ImportFrom):
+            source = node.module or ""
+            if node.level:
+                base = package.split(".") if package else []
+                base = base[: len(base) - (node.level - 1)] if node.level > 1 else base
+                source = ".".join([*base, source] if source else base)
+            for alias in node.names:
+                if alias.name != "*":
+                    names[alias.asname or alias.name] = f"{source}.{alias.name}"
+    return names
+
+
+def _qualify(dotted: str, imports: dict[str, str]) -> str:
+    head, _, rest = dotted.partition(".")
+    if head in imports:
+        return f"{imports[head]}.{rest}" if rest else imports[head]
+    return dotted
+
+
+# ---------- analysis ----------
+
+def _literal(node: ast.expr):
+    try:
+        return ast.literal_eval(node), True
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None, False
+
+
+def _class_attrs(cls: ast.ClassDef) -> dict[str, ast.expr]:
+    attrs = {}
+    for stmt in cls.body:
+        if isinstance(stmt, ast.Assign):
+            for target in stmt.targets:
+                if isinstance(target, ast.Name):
+                    attrs[target.id] = stmt.value
+        elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+            if isinstance(stmt.target, ast.Name):
+                attrs[stmt.target.id] = stmt.value
+    return attrs
+
+
+def analyze_source(source: str, module: str, filename: str = "app.py") -> StaticApp:
+    """
+    Find the `AppConfig` subclass in `source` and read its literal
+    attributes. Nothing is imported or executed.
+    """
+    result = StaticApp()
+
+    try:
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError as e:
+        result.diagnostics.append(Diagnostic("error", "syntax-error", f"syntax error: {e.msg}", e.lineno))
+        return result
+
+    imports = _imports(tree, module)
+    classes = {node.name: node for node in tree.body if isinstance(node, ast.ClassDef)}
+
+    # name -> True (AppConfig subclass), False (not one), None (unknown)
+    verdicts: dict[str, bool | None] = {}
+
+    def verdict(name: str) -> bool | None:
+        if name in verdicts:
+            return verdicts[name]
+        verdicts[name] = False  # cycles
+
+        answer = False
+        for base in classes[name].bases:
+            dotted = _dotted(base)
+            if dotted is None:
+                answer = None if answer is False else answer
+                continue
+            if dotted in classes and dotted != name:
+                base_verdict = verdict(dotted)
+            else:
+                qualified = _qualify(dotted, imports)
+                if qualified in APP_CONFIG_NAMES:
+                    base_verdict = True
+                elif dotted.partition(".")[0] in imports and not qualified.startswith("superkit."):
+                    # Defined in another module; could subclass AppConfig
+                    base_verdict = None
+                else:
+                    base_verdict = False
+
+            if base_verdict:
+                answer = True
+                break
+            if base_verdict is None:
+                answer = None
+
+        verdicts[name] = answer
+        return answer
+
+    found = []
+    unknown = []
+    for name, node in classes.items():
+        v = verdict(name)
+        if v:
+            found.append(node)
+        elif v is None:
+            unknown.append(node)
+
+    if not found:
+        if unknown:
+            result.conclusive = False
+            for node in unknown:
+                result.diagnostics.append(Diagnostic(
+                    "info",
+                    "unresolved-base",
+                    f"cannot tell statically whether '{node.name}' subclasses AppConfig",
+                    node.lineno,
+                ))
+        else:
+            result.diagnostics.append(Diagnostic("error", "no-app-config", "no AppConfig class found"))
+        return result
+
+    # Shared bases are not the app's config; prefer the most derived class
+    bases = {d for node in found for d in map(_dotted, node.bases)}
+    leaves = [node for node in found if node.name not in bases]
+
+    cls = leaves[0]
+    result.config_class = cls.name
+    if len(leaves) > 1:
+        result.diagnostics.append(Diagnostic(
+            "warning",
+            "multiple-app-configs",
+            f"several AppConfig classes ({', '.join(c.name for c in leaves)}); using '{cls.name}'",
+            leaves[1].lineno,
+        ))
+
+    # Attributes from the class, then its local bases (first definition wins)
+    attrs: dict[str, ast.expr] = {}
+    pending = [cls]
+    seen = set()
+    while pending:
+        node = pending.pop(0)
+        if node.name in seen:
+            continue
+        seen.add(node.name)
+        for key, value in _class_attrs(node).items():
+            attrs.setdefault(key, value)
+        pending.extend(classes[d] for d in map(_dotted, node.bases) if d in classes)
+
+    for key in _LITERAL_ATTRS:
+        if key not in attrs:
+            continue
+        value, ok = _literal(attrs[key])
+        if ok:
+            setattr(result, key, value)
+        else:
+            result.dynamic.append(key)
+            result.diagnostics.append(Diagnostic(
+                "info",
+                "dynamic-value",
+                f"{cls.name}.{key} is not a literal; known only at import",
+                attrs[key].lineno,
+            ))
+
+    if result.tags is None and "tags" not in attrs:
+        result.tags = []
+
+    routers = attrs.get("routers")
+    if routers is None:
+        result.routers = []
+    elif isinstance(routers, (ast.List, ast.Tuple)):
+        result.routers = []
+        for element in routers.elts:
+            dotted = _dotted(element)
+            if dotted is None:
+                result.diagnostics.append(Diagnostic(
+                    "info",
+                    "dynamic-value",
+                    f"{cls.name}.routers has an entry that is not a plain name",
+                    element.lineno,
+                ))
+                continue
+            if dotted.partition(".")[0] in imports:
+                result.routers.append(_qualify(dotted, imports))
+            else:
+                result.routers.append(f"{module}.{dotted}")
+    else:
+        result.dynamic.append("routers")
+        result.diagnostics.append(Diagnostic(
+            "info",
+            "dynamic-value",
+            f"{cls.name}.routers is not a list literal; known only at import",
+            routers.lineno,
+        ))
+
+    return result
+
+
+def analyze_app(path: Path, module: str) -> StaticApp:
+    """
+    `analyze_source` for an `app.py` on disk.
+    """
+    try:
+        source = path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        return StaticApp(diagnostics=[Diagnostic("error", "unreadable", f"cannot read {path.name}: {e}")])
+    return analyze_source(source, module, str(path))
@@ -0,0 +1,214 @@
+from fastapi import FastAPI
+from fastapi.datastructures import DefaultPlaceholder
+from starlette.datastructures import URLPath
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+from superkit.routing.radix import use_radix
+
+
+def normalize_prefix(url_prefix: str | None) -> str | None:
+    """
+    `/a/b` for `a/b/`, `/a/b/` ...; None for an empty or root prefix,
+    which cannot be dispatched on.
+    """
+    prefix = (url_prefix or "").strip("/")
+    return f"/{prefix}" if prefix else None
+
+
+def _prefixed_ids(prefix: str, generate):
+    """
+    The parent's operation id function, applied to the full path so ids
+    match an eager mount and stay unique across apps.
+    """
+    if isinstance(generate, DefaultPlaceholder):
+        generate = generate.value
+
+    def generate_unique_id(route) -> str:
+        path_format = route.path_format
+        route.path_format = prefix + path_format
+        try:
+            return generate(route)
+        finally:
+            route.path_format = path_format
+
+    return generate_unique_id
+
+
+def _rename_refs(node, renames: dict[str, str]):
+    if isinstance(node, dict):
+        return {
+            key: renames.get(value, value) if key == "$ref" and isinstance(value, str) else _rename_refs(value, renames)
+            for key, value in node.items()
+        }
+    if isinstance(node, list):
+        return [_rename_refs(item, renames) for item in node]
+    return node
+
+
+class AppDispatcher(BaseRoute):
+    """
+    One route in front of every isolated app.
+
+    Picks the app by its `url_prefix` with a dict lookup per distinct
+    prefix depth (longest first), instead of trying every route of every
+    app in turn, then hands the request to that app like a `Mount`.
+    """
+
+    def __init__(self):
+        self.apps: dict[str, FastAPI] = {}
+        # Segment counts of the registered prefixes, deepest first
+        self._depths: list[int] = []
+
+    def add(self, prefix: str, app: FastAPI) -> None:
+        self.apps[prefix] = app
+        self._depths = sorted({p.count("/") for p in self.apps}, reverse=True)
+
+    def find(self, path: str) -> tuple[str, FastAPI] | None:
+        """
+        (prefix, app) serving `path`. Only paths below the prefix match;
+        the prefix itself is left to the router (slash redirect).
+        """
+        for depth in self._depths:
+            end = 0
+            for _ in range(depth):
+                end = path.find("/", end + 1)
+                if end == -1:
+                    break
+            if end == -1:
+                continue
+            app = self.apps.get(path[:end])
+            if app is not None:
+                return path[:end], app
+        return None
+
+    def matches(self, scope):
+        if scope["type"] not in ("http", "websocket"):
+            return Match.NONE, {}
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+
+        found = self.find(path)
+        if found is None:
+            return Match.NONE, {}
+
+        prefix, app = found
+        return Match.FULL, {
+            "app_root_path": scope.get("app_root_path", root_path),
+            "root_path": root_path + prefix,
+            "endpoint": app,
+        }
+
+    def url_path_for(self, name, /, **path_params):
+        for prefix, app in self.apps.items():
+            try:
+                url = app.router.url_path_for(name, **path_params)
+            except NoMatchFound:
+                continue
+            return URLPath(path=prefix + str(url), protocol=url.protocol)
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send):
+        await scope["endpoint"](scope, receive, send)
+
+
+class IsolatedApps:
+    """
+    Apps mounted with `mount_apps(isolated=True)`.
+
+    Each app is its own FastAPI sub-application under its `url_prefix`,
+    with the middleware from `AppConfig.middleware`. Sub-applications
+    share the parent's state, exception handlers and dependency
+    overrides; their OpenAPI documents are merged into the parent's.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.dispatcher = AppDispatcher()
+        # App name -> prefix
+        self.prefixes: dict[str, str] = {}
+        self._merged = None
+        app.router.routes.append(self.dispatcher)
+
+    def build(self, app_config) -> FastAPI:
+        """
+        The sub-application for `app_config` (not mounted yet).
+        """
+        parent = self.app
+        prefix = normalize_prefix(app_config.url_prefix)
+
+        sub_app = FastAPI(
+            title=app_config.name,
+            debug=parent.debug,
+            openapi_url=None,
+            docs_url=None,
+            redoc_url=None,
+            openapi_version=parent.openapi_version,
+            separate_input_output_schemas=parent.separate_input_output_schemas,
+            generate_unique_id_function=_prefixed_ids(prefix, parent.router.generate_unique_id_function),
+            middleware=list(app_config.middleware),
+        )
+        # Same request.app.state, error responses and test overrides as an eager mount
+        sub_app.state = parent.state
+        sub_app.exception_handlers = parent.exception_handlers
+        sub_app.dependency_overrides = parent.dependency_overrides
+
+        sub_app.include_router(app_config.build_router(prefix=""))
+        # Same router engine as the parent; conflicts are reported now
+        if getattr(parent.state, "route_matcher", None) is not None:
+            use_radix(sub_app.router).compile()
+        return sub_app
+
+    def add(self, name: str, url_prefix: str, sub_app: FastAPI) -> None:
+        prefix = normalize_prefix(url_prefix)
+        for other, other_prefix in self.prefixes.items():
+            if other_prefix == prefix:
+                raise RuntimeError(
+                    f"Apps '{other}' and '{name}' both use url_prefix '{prefix}'; "
+                    "isolated apps need distinct prefixes"
+                )
+
+        self.dispatcher.add(prefix, sub_app)
+        self.prefixes[name] = prefix
+        # Regenerate the schema with the new app
+        self.app.openapi_schema = None
+
+    def mount(self, name: str, app_config) -> None:
+        self.add(name, app_config.url_prefix, self.build(app_config))
+
+    def merge_openapi(self, schema: dict) -> dict:
+        """
+        Add every app's paths and components to `schema` (once per
+        generated schema). Components that clash with a different
+        definition are renamed `<app>__<Name>`.
+        """
+        if schema is self._merged:
+            return schema
+
+        paths = schema.setdefault("paths", {})
+        for name, prefix in self.prefixes.items():
+            fragment = self.dispatcher.apps[prefix].openapi()
+
+            components = schema.get("components", {})
+            renames = {}
+            for kind, items in fragment.get("components", {}).items():
+                for key, value in items.items():
+                    existing = components.get(kind, {}).get(key)
+                    if existing is not None and existing != value:
+                        renames[f"#/components/{kind}/{key}"] = f"#/components/{kind}/{name}__{key}"
+            if renames:
+                fragment = _rename_refs(fragment, renames)
+
+            for kind, items in fragment.get("components", {}).items():
+                target = schema.setdefault("components", {}).setdefault(kind, {})
+                for key, value in items.items():
+                    renamed = renames.get(f"#/components/{kind}/{key}")
+                    target[renamed.rsplit("/", 1)[1] if renamed else key] = value
+
+            for path, item in fragment.get("paths", {}).items():
+                paths[prefix + path] = item
+
+        self._merged = schema
+        return schema
@@ -0,0 +1,214 @@
+import time
+import asyncio
+import threading
+from contextlib import nullcontext
+from dataclasses import dataclass
+
+from starlette.concurrency import run_in_threadpool
+from starlette.routing import BaseRoute, Match, NoMatchFound
+
+from superkit.apps.manifest import AppEntry, load_app_config
+from superkit.lifecycle.prefetch import ImportReport, ImportTimer
+from superkit.logging.api.log import log
+
+
+@dataclass
+class LazyLoad:
+    """
+    Load metrics of one lazily mounted app.
+    """
+
+    app: str
+    url_prefix: str
+    loaded: bool = False
+    # "request", "warmup" or "openapi"
+    trigger: str | None = None
+    # Importing the app and building its router
+    load_ms: float | None = None
+    # Requests that arrived before the app was ready, and the longest wait
+    waited: int = 0
+    max_wait_ms: float = 0.0
+    error: str | None = None
+
+
+class LazyAppRoute(BaseRoute):
+    """
+    Placeholder on an app's `url_prefix` until its routes are built.
+
+    The first matching request builds the app, swaps this placeholder
+    for the real routes and is dispatched again through the router.
+    """
+
+    def __init__(self, lazy_apps: "LazyApps", entry: AppEntry):
+        self.lazy_apps = lazy_apps
+        self.entry = entry
+        self.prefix = entry.url_prefix
+        self.stats = LazyLoad(app=entry.name, url_prefix=entry.url_prefix)
+        # APIRouter, or a sub-application with mount_apps(isolated=True)
+        self.router = None
+
+    def matches(self, scope):
+        if self.stats.loaded or scope["type"] not in ("http", "websocket"):
+            return Match.NONE, {}
+
+        path = scope["path"]
+        root_path = scope.get("root_path", "")
+        if root_path and path.startswith(root_path):
+            path = path[len(root_path):]
+
+        if path == self.prefix or path.startswith(self.prefix + "/"):
+            return Match.FULL, {}
+        return Match.NONE, {}
+
+    def url_path_for(self, name, /, **path_params):
+        # Route names of the app exist once it is loaded
+        raise NoMatchFound(name, path_params)
+
+    async def handle(self, scope, receive, send):
+        start = time.perf_counter()
+        await self.lazy_apps.load(self, "request")
+
+        self.stats.waited += 1
+        self.stats.max_wait_ms = max(self.stats.max_wait_ms, round((time.perf_counter() - start) * 1000, 3))
+
+        await self.lazy_apps.app.router(scope, receive, send)
+
+
+class LazyApps:
+    """
+    Apps mounted with `mount_apps(lazy=True)`.
+
+    Builds run on the thread pool, one at a time (a single lock, so
+    concurrent first requests build an app once and import timings
+    stay accurate). Routes are installed on the event loop.
+    """
+
+    def __init__(self, app, report: ImportReport, prefix: str, *, warmup: bool = False, isolated=None,
+                 timed: bool = True):
+        self.app = app
+        self.report = report
+        self.prefix = prefix
+        self.warmup = warmup
+        # Per-module import timings (see `mount_apps`)
+        self.timed = timed
+        # IsolatedApps, when apps are mounted as sub-applications
+        self.isolated = isolated
+        self.routes: dict[str, LazyAppRoute] = {}
+        self._lock = threading.Lock()
+
+    def register(self, entry: AppEntry) -> None:
+        route = LazyAppRoute(self, entry)
+        self.routes[entry.name] = route
+        self.app.router.routes.append(route)
+
+    @property
+    def pending(self) -> list[str]:
+        return [name for name, route in self.routes.items() if not route.stats.loaded]
+
+    def stats(self) -> dict[str, LazyLoad]:
+        return {name: route.stats for name, route in self.routes.items()}
+
+    # ---------- loading ----------
+
+    def _build(self, route: LazyAppRoute, trigger: str):
+        with self._lock:
+            if route.router is not None:
+                return route.router
+
+            start = time.perf_counter()
+            try:
+                with ImportTimer(self.report, self.prefix) if self.timed else nullcontext():
+                    app_config_cls = load_app_config(route.entry)
+                    if app_config_cls is None:
+                        raise RuntimeError(
+                            f"App '{route.entry.name}' must define an AppConfig subclass"
+                        )
+                    app_config = app_config_cls()
+                    if self.isolated is not None:
+                        route.router = self.isolated.build(app_config)
+                    else:
+                        route.router = app_config.build_router()
+            except Exception as e:
+                route.stats.error = f"{type(e).__name__}: {e}"
+                raise
+            finally:
+                elapsed = round((time.perf_counter() - start) * 1000, 3)
+                self.report.import_ms = round(self.report.import_ms + elapsed, 3)
+
+            route.stats.load_ms = elapsed
+            route.stats.trigger = trigger
+            route.stats.error = None
+            return route.router
+
+    def _install(self, route: LazyAppRoute) -> None:
+        """
+        Replace the placeholder with the app's routes, keeping their
+        position. Runs without awaiting, so no request sees half of it.
+        """
+        if route.stats.loaded:
+            return
+
+        routes = self.app.router.routes
+        if self.isolated is not None:
+            self.isolated.add(route.entry.name, route.prefix, route.router)
+            if route in routes:
+                routes.remove(route)
+        else:
+            before = len(routes)
+            self.app.include_router(route.router)
+
+            if route in routes:
+                added = routes[before:]
+                del routes[before:]
+                index = routes.index(route)
+                routes[index:index + 1] = added
+
+        # Same length route lists are not noticed by the matcher
+        matcher = getattr(self.app.state, "route_matcher", None)
+        if matcher is not None:
+            matcher.invalidate()
+
+        route.stats.loaded = True
+        self.app._mounted_apps.add(route.entry.name)
+        # Regenerate the schema with the new routes
+        self.app.openapi_schema = None
+
+        stats = route.stats
+        log.info(f"Loaded app '{stats.app}' on {stats.trigger} in {stats.load_ms:.1f} ms").emit()
+
+    async def load(self, route: LazyAppRoute, trigger: str) -> None:
+        if route.stats.loaded:
+            return
+        await run_in_threadpool(self._build, route, trigger)
+        self._install(route)
+
+    async def load_pending(self, trigger: str) -> None:
+        """
+        Load every pending app, building each on the thread pool.
+        """
+        for name in self.pending:
+            await self.load(self.routes[name], trigger)
+
+    def load_all(self, trigger: str) -> None:
+        """
+        Load every pending app from the calling thread (not the event
+        loop; use `load_pending` there).
+        """
+        for name in self.pending:
+            route = self.routes[name]
+            self._build(route, trigger)
+            self._install(route)
+
+    async def warm_up(self) -> None:
+        """
+        Load pending apps one after another in the background, yielding
+        to requests between apps. A failing app is skipped; its next
+        request tries again and gets the error.
+        """
+        for name in self.pending:
+            route = self.routes[name]
+            try:
+                await self.load(route, "warmup")
+            except Exception:
+                log.warning(f"Warm-up of app '{name}' failed: {route.stats.error}").emit()
+            await asyncio.sleep(0)
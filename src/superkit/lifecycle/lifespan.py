@@ -0,0 +1,42 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
+from starlette.concurrency import run_in_threadpool
+
+from superkit.logging.setup import shutdown_logging
+
+
+def wrap_lifespan(lifespan_context):
+    """
+    Wrap the router's lifespan so framework teardown runs after the
+    user's lifespan has exited.
+
+    Also compiles the radix route index (`router_engine="radix"`), so
+    route conflicts are reported at boot, and runs the warm-up of lazily
+    mounted apps (`mount_apps(lazy=True, warmup=True)`) once startup is
+    done.
+    """
+
+    @asynccontextmanager
+    async def superkit_lifespan(app):
+        warmup = None
+        try:
+            async with lifespan_context(app) as state:
+                matcher = getattr(app.state, "route_matcher", None)
+                if matcher is not None:
+                    await run_in_threadpool(matcher.compile)
+
+                lazy_apps = getattr(app.state, "lazy_apps", None)
+                if lazy_apps is not None and lazy_apps.warmup:
+                    warmup = asyncio.create_task(lazy_apps.warm_up())
+                yield state
+        finally:
+            if warmup is not None and not warmup.done():
+                warmup.cancel()
+                with suppress(asyncio.CancelledError):
+                    await warmup
+            # Report collapsed errors and drain the log writer without
+            # blocking the event loop
+            await run_in_threadpool(shutdown_logging)
+
+    return superkit_lifespan
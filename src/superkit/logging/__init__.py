@@ -1,4 +1,4 @@
-from superkit.logging.setup import setup_logging
+from superkit.logging.setup import setup_logging, flush_logging, shutdown_logging, get_log_stats
 from superkit.logging.api.log import log
 
-__all__ = ["setup_logging", "log"]
+__all__ = ["setup_logging", "flush_logging", "shutdown_logging", "get_log_stats", "log"]
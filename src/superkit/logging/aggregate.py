@@ -0,0 +1,230 @@
+import os
+import json
+import socket
+import logging
+import tempfile
+import selectors
+import threading
+
+from superkit.logging.encoding import JsonSnapshot, dumps
+from superkit.logging.record import SuperKitLogRecord
+from superkit.logging.tables import TableSample
+
+# Set by the supervisor; workers that see it send their records there
+AGGREGATOR_ENV = "SUPERKIT_LOG_SOCKET"
+
+_logger = logging.getLogger("superkit.workers")
+
+
+# ---------- wire format (one JSON object per line) ----------
+
+def _attachment_to_wire(attachment: dict) -> dict:
+    data = attachment.get("data")
+    if isinstance(data, JsonSnapshot):
+        return {**attachment, "data": None, "json": data.text, "truncated": data.truncated}
+    if isinstance(data, TableSample):
+        return {**attachment, "data": None, "table": data.to_json()}
+    return attachment
+
+
+def _attachment_from_wire(attachment: dict) -> dict:
+    if "json" in attachment:
+        data = JsonSnapshot(attachment.pop("json"), attachment.pop("truncated", False))
+    elif "table" in attachment:
+        table = attachment.pop("table")
+        table.pop("omitted_rows", None)
+        data = TableSample(**table)
+    else:
+        return attachment
+    attachment["data"] = data
+    return attachment
+
+
+def _record_to_wire(record: SuperKitLogRecord) -> dict:
+    return {
+        "kind": record.kind,
+        "level": record.level,
+        "title": record.title,
+        "message": record.message,
+        "data": record.data,
+        "meta": record.meta,
+        "attachments": [_attachment_to_wire(a) for a in record.attachments],
+        "entries": [_record_to_wire(e) for e in record.entries],
+    }
+
+
+def _record_from_wire(data: dict) -> SuperKitLogRecord:
+    return SuperKitLogRecord(
+        kind=data["kind"],
+        level=data["level"],
+        title=data["title"],
+        message=data.get("message"),
+        data=data.get("data"),
+        meta=data.get("meta"),
+        attachments=[_attachment_from_wire(a) for a in data.get("attachments") or ()],
+        entries=[_record_from_wire(e) for e in data.get("entries") or ()],
+    )
+
+
+def encode_record(record: SuperKitLogRecord, created: float, worker: int) -> str:
+    return dumps({"worker": worker, "created": created, "record": _record_to_wire(record)})
+
+
+def encode_error(type_name: str, message: str, frames: list, created: float, worker: int) -> str:
+    return dumps({
+        "worker": worker,
+        "created": created,
+        "error": {"type": type_name, "message": message, "frames": frames},
+    })
+
+
+def decode(line: bytes) -> tuple[float, SuperKitLogRecord]:
+    """
+    (created, record) for one wire line. Errors become `error` records
+    whose meta holds the frames; every record is tagged with its worker.
+    """
+    message = json.loads(line)
+    worker = message.get("worker")
+
+    error = message.get("error")
+    if error is not None:
+        record = SuperKitLogRecord(
+            kind="error",
+            level="ERROR",
+            title=error["type"],
+            message=error["message"],
+            meta={
+                "frames": [
+                    {"file": filename, "line": lineno, "function": function}
+                    for filename, lineno, function in error["frames"]
+                ],
+            },
+        )
+    else:
+        record = _record_from_wire(message["record"])
+
+    if record.meta is None:
+        record.meta = {}
+    record.meta["worker"] = worker
+    return message["created"], record
+
+
+# ---------- supervisor side ----------
+
+class LogAggregator:
+    """
+    Collects records from worker processes over a Unix socket.
+
+    Runs in the supervisor. Each read round takes whatever all workers
+    have sent, orders it by creation time and re-emits it through the
+    `superkit.workers` logger, so the supervisor's own handlers render
+    or write it. Output from several workers never interleaves
+    mid-record. When those handlers push back (`log_overflow = "block"`)
+    the socket buffers fill and workers' writer threads wait, never
+    their request threads.
+    """
+
+    READ_SIZE = 256 * 1024
+
+    def __init__(self, path: str | None = None):
+        self._tmpdir = None
+        if path is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="superkit-logs-")
+            path = os.path.join(self._tmpdir, "logs.sock")
+        self.path = path
+        self._server = None
+        self._selector = None
+        self._thread = None
+        self._stopping = False
+        self._buffers: dict[socket.socket, bytes] = {}
+
+    def start(self) -> "LogAggregator":
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+        self._server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._server.bind(self.path)
+        self._server.listen()
+        self._server.setblocking(False)
+
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._server, selectors.EVENT_READ)
+
+        self._thread = threading.Thread(target=self._run, name="superkit-log-aggregator", daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        self._stopping = True
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+        for conn in list(self._buffers):
+            conn.close()
+        self._buffers.clear()
+        if self._server is not None:
+            self._server.close()
+        if self._selector is not None:
+            self._selector.close()
+
+        try:
+            os.unlink(self.path)
+            if self._tmpdir is not None:
+                os.rmdir(self._tmpdir)
+        except OSError:
+            pass
+
+    def _run(self) -> None:
+        while not self._stopping:
+            batch = []
+            for key, _ in self._selector.select(timeout=0.2):
+                if key.fileobj is self._server:
+                    self._accept()
+                else:
+                    self._read(key.fileobj, batch)
+
+            if batch:
+                batch.sort(key=lambda item: item[0])
+                for created, record in batch:
+                    self._emit(created, record)
+
+    def _accept(self) -> None:
+        try:
+            conn, _ = self._server.accept()
+        except OSError:
+            return
+        conn.setblocking(False)
+        self._buffers[conn] = b""
+        self._selector.register(conn, selectors.EVENT_READ)
+
+    def _read(self, conn: socket.socket, batch: list) -> None:
+        try:
+            data = conn.recv(self.READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b""
+
+        if not data:
+            self._selector.unregister(conn)
+            self._buffers.pop(conn, None)
+            conn.close()
+            return
+
+        *lines, rest = (self._buffers[conn] + data).split(b"\n")
+        self._buffers[conn] = rest
+        for line in lines:
+            try:
+                batch.append(decode(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+
+    def _emit(self, created: float, record: SuperKitLogRecord) -> None:
+        levelno = logging.getLevelName(record.level)
+        log_record = _logger.makeRecord(
+            _logger.name,
+            levelno if isinstance(levelno, int) else logging.INFO,
+            "(worker)", 0, record, None, None,
+        )
+        log_record.created = created
+        _logger.handle(log_record)
@@ -1,60 +1,214 @@
 import logging
+from superkit.logging.config import config
+from superkit.logging.context import current_buffer, current_scope
+from superkit.logging.encoding import snapshot
 from superkit.logging.record import SuperKitLogRecord
+from superkit.logging.tables import sample_table
 
 _logger = logging.getLogger("superkit.apps")
 
 
 class LogEntry:
-    def __init__(self, record: SuperKitLogRecord, logger: logging.Logger):
+    """
+    Chainable handle for a single log record.
+
+    The record is emitted exactly once, at the first of:
+
+    - an explicit `.emit()`
+    - leaving a `with` block
+    - the entry being dropped by the caller
+    - the end of the current request
+
+    Inside a request the record goes to the request buffer and is
+    emitted with the access record when the response finishes. Adding
+    to an entry after it was emitted does nothing.
+    """
+
+    __slots__ = ("_record", "_logger", "_levelno", "_scope", "_emitted", "_pooled", "_held", "__weakref__")
+
+    def __init__(self, record: SuperKitLogRecord, logger: logging.Logger, levelno: int | None = None):
         self._record = record
         self._logger = logger
+        self._levelno = levelno if levelno is not None else logging.getLevelName(record.level)
+        self._scope = None
         self._emitted = False
-    
+        self._pooled = False
+        # Inside a `with` block
+        self._held = False
+
     def add_json(self, data: dict, title: str = None) -> "LogEntry":
-        self._record.attachments.append({"type": "json", "data": data, "title": title})
+        """
+        Attach a JSON payload. It is serialized right away (within the
+        `log_json_max_*` limits), so later changes to `data` are not
+        logged. `data` may be a zero-argument callable, which is only
+        called for records that will be emitted.
+        """
+        if self._record is None:
+            return self
+        if callable(data):
+            data = data()
+        payload = snapshot(data, config.json_max_bytes, config.json_max_depth, config.json_max_items)
+        self._record.attachments.append({"type": "json", "data": payload, "title": title})
+        return self
+
+    def add_table(self, data, title: str = None) -> "LogEntry":
+        """
+        Attach a table: rows (first row = headers), an iterable of dicts,
+        or a dict of columns. Generators are consumed once and only a
+        bounded head/tail sample is kept (see `TableSample`). `data` may
+        be a zero-argument callable, which is only called for records
+        that will be emitted.
+        """
+        if self._record is None:
+            return self
+        if callable(data):
+            data = data()
+        table = sample_table(data, config.table_max_rows)
+        self._record.attachments.append({"type": "table", "data": table, "title": title})
         return self
-    
-    def add_table(self, data: list[list], title: str = None) -> "LogEntry":
-        self._record.attachments.append({"type": "table", "data": data, "title": title})
+
+    def emit(self) -> None:
+        if self._emitted:
+            return
+        self._emitted = True
+
+        record = self._record
+        scope = self._scope
+        self._record = None
+        self._scope = None
+
+        if scope is not None:
+            scope.release(self)
+
+        buffer = current_buffer()
+        if buffer is not None:
+            buffer.add(self._levelno, record)
+        else:
+            self._logger.log(self._levelno, record)
+
+        if self._pooled:
+            _pool.release(self)
+
+    def __enter__(self) -> "LogEntry":
+        self._held = True
         return self
-    
-    def _emit(self):
-        if not self._emitted:
-            log_method = getattr(self._logger, self._record.level.lower())
-            log_method(self._record)
-            self._emitted = True
-    
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.emit()
+
     def __del__(self):
-        self._emit()
+        # Backstop for entries that were never flushed explicitly
+        self.emit()
+
+
+class _NoopLogEntry:
+    """
+    Shared stand-in returned when the level is disabled.
+
+    Every method is a no-op, so lazy payloads are never built.
+    """
+
+    __slots__ = ()
+
+    def add_json(self, data=None, title: str = None) -> "_NoopLogEntry":
+        return self
+
+    def add_table(self, data=None, title: str = None) -> "_NoopLogEntry":
+        return self
+
+    def emit(self) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopLogEntry":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        pass
+
+
+_NOOP_ENTRY = _NoopLogEntry()
+
+
+class _EntryPool:
+    """
+    Free list of `LogEntry` objects for hot call sites.
+
+    Pooled entries are recycled right after they emit, so callers must
+    not keep a reference past the statement (or `with` block). The next
+    `log.*` call emits pooled entries left open outside a `with` block.
+    """
+
+    MAX_SIZE = 128
+
+    def __init__(self):
+        self._free: list[LogEntry] = []
+
+    def acquire(self, record: SuperKitLogRecord, logger: logging.Logger, levelno: int) -> LogEntry:
+        try:
+            entry = self._free.pop()
+        except IndexError:
+            entry = LogEntry(record, logger, levelno)
+            entry._pooled = True
+            return entry
+
+        entry._record = record
+        entry._logger = logger
+        entry._levelno = levelno
+        entry._emitted = False
+        entry._held = False
+        return entry
+
+    def release(self, entry: LogEntry) -> None:
+        if len(self._free) < self.MAX_SIZE:
+            self._free.append(entry)
+
+
+_pool = _EntryPool()
 
 
 class _LogAPI:
-    def info(self, message: str = "") -> LogEntry:
-        record = SuperKitLogRecord(
-            kind="user",
-            level="INFO",
-            title="INFO",
-            message=message,
-        )
-        return LogEntry(record, _logger)
+    """
+    `log.*` methods check the `superkit.apps` logger level first; disabled
+    levels return a shared no-op entry without building a record.
 
-    def warning(self, message: str = "") -> LogEntry:
-        record = SuperKitLogRecord(
-            kind="user",
-            level="WARNING",
-            title="WARNING",
-            message=message,
-        )
-        return LogEntry(record, _logger)
+    `message` may be a zero-argument callable for expensive formatting.
+    """
+
+    def _entry(self, levelno: int, level: str, message, pooled: bool) -> LogEntry:
+        if not _logger.isEnabledFor(levelno):
+            return _NOOP_ENTRY
+
+        if callable(message):
+            message = message()
 
-    def critical(self, message: str = "") -> LogEntry:
         record = SuperKitLogRecord(
             kind="user",
-            level="CRITICAL",
-            title="CRITICAL",
+            level=level,
+            title=level,
             message=message,
         )
-        return LogEntry(record, _logger)
+
+        if pooled:
+            entry = _pool.acquire(record, _logger, levelno)
+        else:
+            entry = LogEntry(record, _logger, levelno)
+
+        scope = current_scope()
+        entry._scope = scope
+        scope.open(entry, strong=pooled)
+        return entry
+
+    def debug(self, message: str = "", *, pooled: bool = False) -> LogEntry:
+        return self._entry(logging.DEBUG, "DEBUG", message, pooled)
+
+    def info(self, message: str = "", *, pooled: bool = False) -> LogEntry:
+        return self._entry(logging.INFO, "INFO", message, pooled)
+
+    def warning(self, message: str = "", *, pooled: bool = False) -> LogEntry:
+        return self._entry(logging.WARNING, "WARNING", message, pooled)
+
+    def critical(self, message: str = "", *, pooled: bool = False) -> LogEntry:
+        return self._entry(logging.CRITICAL, "CRITICAL", message, pooled)
 
 
 log = _LogAPI()
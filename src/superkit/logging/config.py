@@ -0,0 +1,130 @@
+import sys
+from dataclasses import dataclass, field, fields
+
+
+OVERFLOW_POLICIES = ("drop_oldest", "drop_new", "block")
+LOG_FORMATS = ("auto", "panel", "jsonl")
+REQUEST_KEEP_POLICIES = ("all", "tail")
+
+
+@dataclass
+class LoggingConfig:
+    """
+    Resolved logging configuration for the current process.
+
+    Every field can be overridden from `ProjectSettings` through a
+    `log_<field>` attribute (e.g. `log_queue_size`).
+    """
+
+    # Output: "panel" (Rich), "jsonl" (one JSON object per line),
+    # or "auto" (jsonl when stdout is not a TTY)
+    format: str = "auto"
+
+    # Minimum level for `log.*` calls; disabled levels cost almost nothing
+    level: str = "INFO"
+
+    # Repeated errors: within `error_window` seconds only the first
+    # `error_burst` occurrences render; the rest collapse into a summary.
+    # error_window = 0 disables deduplication.
+    error_window: float = 60.0
+    error_burst: int = 1
+
+    # Extra phrases hidden from uvicorn's log output, on top of the
+    # built-in startup / shutdown banners (case-insensitive substrings)
+    noise_phrases: list[str] = field(default_factory=list)
+
+    # HTTP access records from `AccessLogMiddleware`.
+    # `access_status_rates` maps an exact status ("404") or a class
+    # ("2xx") to a sampling rate; anything else uses `access_sample_rate`.
+    access: bool = True
+    access_sample_rate: float = 1.0
+    access_status_rates: dict[str, float] = field(default_factory=dict)
+
+    # Entries logged while a request is handled are buffered and emitted
+    # once, grouped under its access record. request_keep = "tail" drops
+    # the buffer unless the request failed (5xx, exception, a warning or
+    # worse was logged) or took at least `slow_request_ms`.
+    request_buffer: bool = True
+    request_keep: str = "all"
+    slow_request_ms: float = 1000.0
+
+    # `add_table` keeps at most `table_max_rows` rows (head + tail);
+    # panel cells longer than `table_max_cell` characters are cut
+    table_max_rows: int = 20
+    table_max_cell: int = 80
+
+    # `add_json` snapshots payloads at call time; past these limits
+    # values are replaced by "..." markers
+    json_max_bytes: int = 65_536
+    json_max_depth: int = 10
+    json_max_items: int = 1000
+
+    # JSON lines file sink, next to the console output or, with
+    # `file_only`, instead of it. Rotates at `file_max_bytes` or after
+    # `file_rotate_interval` seconds (0 disables either); rotated
+    # segments are gzipped in the background and `file_backups` kept.
+    file: str | None = None
+    file_only: bool = False
+    file_max_bytes: int = 50 * 1024 * 1024
+    file_rotate_interval: float = 86_400.0
+    file_backups: int = 7
+    file_fsync_interval: float = 1.0
+    file_compress: bool = True
+
+    # In-memory ring of the most recent records (0 disables), served
+    # as JSON at `endpoint` when set (e.g. "/_superkit/logs")
+    ring_size: int = 1000
+    endpoint: str | None = None
+
+    # Writer pipeline
+    async_writer: bool = True
+    queue_size: int = 10_000
+    overflow: str = "drop_oldest"
+    flush_timeout: float = 5.0
+
+
+config = LoggingConfig()
+
+
+def configure(settings=None) -> LoggingConfig:
+    """
+    Reset the process-wide logging config and apply `log_*` overrides.
+    """
+    defaults = LoggingConfig()
+
+    for f in fields(LoggingConfig):
+        value = getattr(settings, f"log_{f.name}", None)
+        if value is None:
+            value = getattr(defaults, f.name)
+        setattr(config, f.name, value)
+
+    if config.overflow not in OVERFLOW_POLICIES:
+        raise ValueError(
+            f"Invalid log_overflow '{config.overflow}'. "
+            f"Expected one of: {', '.join(OVERFLOW_POLICIES)}."
+        )
+
+    if config.format not in LOG_FORMATS:
+        raise ValueError(
+            f"Invalid log_format '{config.format}'. "
+            f"Expected one of: {', '.join(LOG_FORMATS)}."
+        )
+
+    if config.request_keep not in REQUEST_KEEP_POLICIES:
+        raise ValueError(
+            f"Invalid log_request_keep '{config.request_keep}'. "
+            f"Expected one of: {', '.join(REQUEST_KEEP_POLICIES)}."
+        )
+
+    return config
+
+
+def resolve_format() -> str:
+    """
+    Concrete output format ("panel" or "jsonl") for this process.
+    """
+    if config.format != "auto":
+        return config.format
+
+    isatty = getattr(sys.stdout, "isatty", None)
+    return "panel" if isatty is not None and isatty() else "jsonl"
@@ -0,0 +1,158 @@
+import threading
+import weakref
+from contextvars import ContextVar
+
+
+class LogScope:
+    """
+    Logging state for one request (or one thread outside requests).
+
+    Tracks the entries that are still open for chaining (`add_json`,
+    ...). Entries the caller still holds are only emitted by the caller
+    (`emit()`, leaving a `with` block) or when the scope closes at the
+    end of the request.
+    """
+
+    __slots__ = ("_pending", "__weakref__")
+
+    def __init__(self):
+        # Weak references to regular entries, pooled entries themselves
+        self._pending = []
+
+    def open(self, entry, *, strong: bool = False) -> None:
+        """
+        Track `entry` as open.
+
+        Regular entries are held weakly, so they emit as soon as the
+        caller drops them. Pooled entries are held strongly; the ones
+        opened before, outside a `with` block, are emitted first (their
+        callers may not keep them past the statement).
+        """
+        kept = []
+        for ref in self._pending:
+            if type(ref) is weakref.ref:
+                if ref() is not None:
+                    kept.append(ref)
+            elif ref._held:
+                kept.append(ref)
+            else:
+                ref.emit()
+        kept.append(entry if strong else weakref.ref(entry))
+        self._pending = kept
+
+    def release(self, entry) -> None:
+        self._pending = [
+            ref for ref in self._pending
+            if (ref() if type(ref) is weakref.ref else ref) not in (entry, None)
+        ]
+
+    @property
+    def pending(self) -> list:
+        return [entry for entry in (ref() if type(ref) is weakref.ref else ref for ref in self._pending) if entry is not None]
+
+    def flush(self) -> None:
+        entries = self.pending
+        self._pending = []
+        for entry in entries:
+            entry.emit()
+
+
+_request_scope: ContextVar[LogScope | None] = ContextVar("superkit_log_scope", default=None)
+_thread_scope = threading.local()
+_thread_scopes: "weakref.WeakSet[LogScope]" = weakref.WeakSet()
+
+
+def current_scope() -> LogScope:
+    """
+    Scope of the current request, or of the current thread outside requests.
+    """
+    scope = _request_scope.get()
+    if scope is not None:
+        return scope
+
+    scope = getattr(_thread_scope, "scope", None)
+    if scope is None:
+        scope = _thread_scope.scope = LogScope()
+        _thread_scopes.add(scope)
+    return scope
+
+
+def open_request_scope():
+    """
+    Start a request scope. Returns a token for `close_request_scope`.
+    """
+    return _request_scope.set(LogScope())
+
+
+def close_request_scope(token) -> None:
+    """
+    Emit whatever the request left open and restore the outer scope.
+    """
+    scope = _request_scope.get()
+    try:
+        if scope is not None:
+            scope.flush()
+    finally:
+        _request_scope.reset(token)
+
+
+def flush_pending() -> None:
+    """
+    Emit open entries of the current request and of every thread scope.
+    """
+    scope = _request_scope.get()
+    if scope is not None:
+        scope.flush()
+
+    for scope in list(_thread_scopes):
+        scope.flush()
+
+
+class RequestBuffer:
+    """
+    Records logged while one request is handled.
+
+    Filled by `LogEntry.emit` instead of the logger, then emitted once by
+    `AccessLogMiddleware` as the entries of the request's access record.
+    """
+
+    MAX_RECORDS = 1000
+
+    __slots__ = ("records", "levelno", "dropped")
+
+    def __init__(self):
+        self.records = []
+        self.levelno = 0
+        self.dropped = 0
+
+    def add(self, levelno: int, record) -> None:
+        if levelno > self.levelno:
+            self.levelno = levelno
+        if len(self.records) < self.MAX_RECORDS:
+            self.records.append(record)
+        else:
+            self.dropped += 1
+
+
+_request_buffer: ContextVar[RequestBuffer | None] = ContextVar("superkit_log_buffer", default=None)
+
+
+def current_buffer() -> RequestBuffer | None:
+    return _request_buffer.get()
+
+
+def open_request_buffer():
+    """
+    Start buffering this request's records. Returns a token for
+    `close_request_buffer`.
+    """
+    return _request_buffer.set(RequestBuffer())
+
+
+def close_request_buffer(token) -> RequestBuffer | None:
+    """
+    Stop buffering and return what the request logged.
+    """
+    buffer = _request_buffer.get()
+    _request_buffer.reset(token)
+    return buffer
@@ -0,0 +1,139 @@
+import json
+from collections.abc import Mapping
+
+try:
+    import orjson
+except ImportError:  # optional: pip install superkit[fast]
+    orjson = None
+
+
+def _default(obj):
+    to_json = getattr(obj, "to_json", None)
+    if to_json is not None:
+        return to_json()
+    return str(obj)
+
+
+def dumps(obj) -> str:
+    """
+    Serialize to compact single-line JSON.
+
+    Uses orjson when installed, the stdlib encoder otherwise.
+    Objects with a `to_json()` method are serialized through it;
+    other unknown types fall back to `str()`.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=_default)
+
+
+class JsonSnapshot:
+    """
+    Compact JSON text of an attachment, taken when it was added.
+
+    Later changes to the caller's data do not show up in the log, and
+    renderers / sinks use the text as-is instead of serializing again.
+    """
+
+    __slots__ = ("text", "truncated")
+
+    def __init__(self, text: str, truncated: bool = False):
+        self.text = text
+        self.truncated = truncated
+
+    def to_json(self):
+        return json.loads(self.text)
+
+
+class _Pruner:
+    """
+    Bounded copy of JSON-like data.
+
+    Containers deeper than `max_depth` or past `max_items` entries are
+    replaced by markers, and copying stops once roughly `max_bytes` of
+    output has been produced, so the cost is bounded by the limits.
+    """
+
+    def __init__(self, max_bytes: int, max_depth: int, max_items: int):
+        self.budget = max_bytes
+        self.max_depth = max_depth
+        self.max_items = max_items
+        self.truncated = False
+
+    def prune(self, value, depth: int = 0):
+        if value is None or value is True or value is False:
+            self.budget -= 5
+            return value
+
+        if type(value) is int or type(value) is float:
+            self.budget -= 8
+            return value
+
+        if isinstance(value, str):
+            if len(value) > self.budget:
+                self.truncated = True
+                value = value[:max(self.budget, 0)] + "..."
+            self.budget -= len(value) + 2
+            return value
+
+        to_json = getattr(value, "to_json", None)
+        if to_json is not None:
+            return self.prune(to_json(), depth)
+
+        if isinstance(value, Mapping):
+            if depth >= self.max_depth:
+                self.truncated = True
+                return "{...}"
+            return self._prune_mapping(value, depth)
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            if depth >= self.max_depth:
+                self.truncated = True
+                return "[...]"
+            return self._prune_sequence(value, depth)
+
+        return self.prune(str(value), depth)
+
+    def _prune_mapping(self, value: Mapping, depth: int) -> dict:
+        out = {}
+        for i, (key, item) in enumerate(value.items()):
+            if i >= self.max_items or self.budget <= 0:
+                self.truncated = True
+                out["..."] = f"{len(value) - i} more keys"
+                break
+            key = key if isinstance(key, str) else str(key)
+            self.budget -= len(key) + 4
+            out[key] = self.prune(item, depth + 1)
+        return out
+
+    def _prune_sequence(self, value, depth: int) -> list:
+        out = []
+        for i, item in enumerate(value):
+            if i >= self.max_items or self.budget <= 0:
+                self.truncated = True
+                out.append(f"... {len(value) - i} more items")
+                break
+            self.budget -= 1
+            out.append(self.prune(item, depth + 1))
+        return out
+
+
+def snapshot(data, max_bytes: int = 65_536, max_depth: int = 10, max_items: int = 1000) -> JsonSnapshot:
+    """
+    Serialize `data` now into a size-capped `JsonSnapshot`.
+
+    Truncated parts are replaced by "..." markers; if the encoded text
+    still exceeds `max_bytes` it is kept only as a string preview.
+    """
+    if isinstance(data, JsonSnapshot):
+        return data
+
+    pruner = _Pruner(max_bytes, max_depth, max_items)
+    text = dumps(pruner.prune(data))
+    truncated = pruner.truncated
+
+    if len(text) > max_bytes:
+        text = dumps({"...": "truncated", "preview": text[:max_bytes]})
+        truncated = True
+
+    return JsonSnapshot(text, truncated)
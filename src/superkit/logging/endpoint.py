@@ -0,0 +1,37 @@
+from fastapi import HTTPException, Query, Response
+
+from superkit.logging import ring
+from superkit.logging.encoding import dumps
+from superkit.logging.renderers.jsonl import JsonLinesRenderer
+
+_renderer = JsonLinesRenderer()
+
+
+def recent_logs(
+    level: str | None = None,
+    kind: str | None = None,
+    since: int = 0,
+    limit: int = Query(100, ge=1),
+) -> Response:
+    """
+    Recent records from the in-memory ring.
+
+    `since` is the `cursor` returned by the previous call; polling with
+    it returns the next records, oldest first, without gaps. `limit` is
+    capped at the ring's capacity.
+    """
+    log_ring = ring.log_ring
+    if log_ring is None:
+        raise HTTPException(status_code=404, detail="Log ring is disabled")
+
+    try:
+        entries, cursor = log_ring.query(level=level, kind=kind, since=since, limit=min(limit, log_ring.capacity))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    records = [
+        {"seq": seq, **_renderer.to_dict(record, created)}
+        for seq, created, record in entries
+    ]
+    body = {"cursor": cursor, "records": records}
+    return Response(content=dumps(body), media_type="application/json")
@@ -0,0 +1,152 @@
+import time
+import threading
+from collections import OrderedDict
+
+from superkit.logging.record import SuperKitLogRecord
+
+
+class ErrorOccurrence:
+    """
+    Tracking state for one error fingerprint inside its current window.
+    """
+
+    __slots__ = (
+        "type_name",
+        "message",
+        "frames",
+        "window_start",
+        "first_seen",
+        "last_seen",
+        "count",
+        "suppressed",
+    )
+
+    def __init__(self, type_name: str, message: str, frames: list, now: float):
+        self.type_name = type_name
+        self.message = message
+        self.frames = frames
+        self.window_start = now
+        self.first_seen = now
+        self.last_seen = now
+        self.count = 0
+        self.suppressed = 0
+
+    def to_record(self) -> SuperKitLogRecord:
+        return SuperKitLogRecord(
+            kind="error_summary",
+            level="ERROR",
+            title=self.type_name,
+            message=self.message,
+            meta={
+                "occurrences": self.count,
+                "suppressed": self.suppressed,
+                "first_seen": self.first_seen,
+                "last_seen": self.last_seen,
+                "frames": [
+                    {"file": filename, "line": lineno, "function": function}
+                    for filename, lineno, function in self.frames
+                ],
+            },
+        )
+
+
+class ErrorDeduplicator:
+    """
+    Collapses repeats of the same error into a single summary.
+
+    Errors are fingerprinted by exception type plus the filtered user
+    frames. Inside a window of `window` seconds the first `burst`
+    occurrences render normally; the rest are only counted. When the
+    window closes, one summary record reports how many were suppressed
+    and when they were first/last seen. A fingerprint evicted to stay
+    within `MAX_FINGERPRINTS` is summarized early rather than dropped.
+
+    Thread-safe: without the async writer, `emit` calls it from any
+    thread.
+    """
+
+    MAX_FINGERPRINTS = 1024
+    # Closed windows are looked for at most this often (seconds)
+    SCAN_INTERVAL = 1.0
+
+    def __init__(self, window: float = 60.0, burst: int = 1):
+        self.window = window
+        self.burst = max(1, burst)
+        self._seen: OrderedDict[tuple, ErrorOccurrence] = OrderedDict()
+        self._closed: list[ErrorOccurrence] = []
+        self._next_scan = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(type_name: str, frames: list) -> tuple:
+        return (type_name, tuple(frames))
+
+    def observe(self, type_name: str, message: str, frames: list, now: float | None = None) -> bool:
+        """
+        Record an occurrence. Returns True if it should render in full.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._observe(type_name, message, frames, now)
+
+    def _observe(self, type_name: str, message: str, frames: list, now: float) -> bool:
+        key = self.fingerprint(type_name, frames)
+
+        occurrence = self._seen.get(key)
+        if occurrence is None or now - occurrence.window_start >= self.window:
+            if occurrence is not None and occurrence.suppressed:
+                self._closed.append(occurrence)
+            occurrence = ErrorOccurrence(type_name, message, frames, now)
+            self._seen[key] = occurrence
+            if len(self._seen) > self.MAX_FINGERPRINTS:
+                # Least recently seen; its pending count is reported early
+                _, evicted = self._seen.popitem(last=False)
+                if evicted.suppressed:
+                    self._closed.append(evicted)
+
+        self._seen.move_to_end(key)
+        occurrence.count += 1
+        occurrence.last_seen = now
+        occurrence.message = message
+
+        if occurrence.count <= self.burst:
+            return True
+
+        occurrence.suppressed += 1
+        return False
+
+    def expired(self, now: float | None = None) -> list[ErrorOccurrence]:
+        """
+        Pop closed windows that suppressed at least one occurrence.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._expired(now)
+
+    def _expired(self, now: float) -> list[ErrorOccurrence]:
+        summaries, self._closed = self._closed, []
+
+        if now < self._next_scan:
+            return summaries
+        self._next_scan = now + self.SCAN_INTERVAL
+
+        closed = [
+            key for key, occurrence in self._seen.items()
+            if now - occurrence.window_start >= self.window
+        ]
+
+        for key in closed:
+            occurrence = self._seen.pop(key)
+            if occurrence.suppressed:
+                summaries.append(occurrence)
+        return summaries
+
+    def drain(self) -> list[ErrorOccurrence]:
+        """
+        Pop every window that suppressed something (e.g. on shutdown).
+        """
+        with self._lock:
+            summaries = self._closed + [o for o in self._seen.values() if o.suppressed]
+            self._seen.clear()
+            self._closed = []
+        return summaries
@@ -1,3 +1,6 @@
+import re
+import logging
+
 NOISE_PHRASES = (
     "started server process",
     "waiting for application startup",
@@ -8,3 +11,32 @@ NOISE_PHRASES = (
     "will watch for changes",
     "uvicorn running on",
 )
+
+
+def compile_phrases(phrases) -> re.Pattern | None:
+    """
+    One case-insensitive regex matching any of `phrases`.
+    """
+    phrases = sorted({p.lower() for p in phrases if p}, key=len, reverse=True)
+    if not phrases:
+        return None
+    return re.compile("|".join(map(re.escape, phrases)), re.IGNORECASE)
+
+
+class NoiseFilter(logging.Filter):
+    """
+    Drops server chatter (startup / shutdown banners) at the logger, so
+    it never reaches a handler. The message is matched whether or not
+    the record carries an exception, so tracebacks uvicorn logs with a
+    noise message (e.g. cancelled tasks while shutting down) are hidden
+    too.
+    """
+
+    def __init__(self, phrases=NOISE_PHRASES):
+        super().__init__()
+        self.pattern = compile_phrases(phrases)
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.pattern is None:
+            return True
+        return self.pattern.search(record.getMessage()) is None
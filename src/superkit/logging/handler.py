@@ -1,92 +1,363 @@
+import os
+import sys
+import socket
 import logging
 from rich.console import Console
 
+from superkit.logging.config import config
+from superkit.logging.pipeline import LogPipeline
 from superkit.logging.record import SuperKitLogRecord
 from superkit.logging.renderers.user import UserPanelRenderer
 from superkit.logging.renderers.http import HttpPanelRenderer
 from superkit.logging.renderers.json import JsonPanelRenderer
 from superkit.logging.renderers.error import ErrorPanelRenderer
+from superkit.logging.renderers.jsonl import JsonLinesRenderer
+from superkit.logging.sinks.file import RotatingFile
+from superkit.logging.ring import LogRing
+from superkit.logging.aggregate import encode_error, encode_record
 
-from superkit.logging.filters.noise import NOISE_PHRASES
+from superkit.logging.filters.dedup import ErrorDeduplicator
 
 console = Console()
 
+# Queued to make the writer report every open error window
+_DRAIN_SUMMARIES = object()
 
-class SuperKitPanelHandler(logging.Handler):
-    def __init__(self):
+
+class SuperKitHandler(logging.Handler):
+    """
+    Base handler for SuperKit output.
+
+    `emit()` only hands the record to a `LogPipeline`; classification,
+    rendering and writes happen on the pipeline's writer thread. With
+    `async_writer=False` everything runs inline on the calling thread.
+
+    Subclasses implement `render`, `render_error` and `write`, and must
+    set up their renderers before calling `super().__init__()` (the
+    writer thread starts there).
+    """
+
+    def __init__(
+        self,
+        *,
+        async_writer: bool | None = None,
+        queue_size: int | None = None,
+        overflow: str | None = None,
+    ):
         super().__init__()
-        self.user_renderer = UserPanelRenderer()
-        self.http_renderer = HttpPanelRenderer()
-        self.json_renderer = JsonPanelRenderer()
-        self.error_renderer = ErrorPanelRenderer()
+
+        # Error fingerprinting / repeat collapsing (the deduplicator locks
+        # itself: without the async writer, records arrive on any thread)
+        self.error_frames = ErrorPanelRenderer()
+        self.dedup = None
+        if config.error_window > 0:
+            self.dedup = ErrorDeduplicator(config.error_window, config.error_burst)
+
+        async_writer = config.async_writer if async_writer is None else async_writer
+        self.pipeline = None
+
+        if async_writer:
+            self.pipeline = LogPipeline(
+                self._write,
+                maxsize=config.queue_size if queue_size is None else queue_size,
+                overflow=config.overflow if overflow is None else overflow,
+                on_batch_end=self.write_batch_end,
+                on_idle=self._write_error_summaries if self.dedup else None,
+            ).start()
+
+    # ---------- output surface (subclasses) ----------
+
+    def render(self, record: SuperKitLogRecord, created: float):
+        raise NotImplementedError
+
+    def render_error(self, type_name: str, message: str, frames: list, created: float):
+        raise NotImplementedError
+
+    def write(self, output) -> None:
+        raise NotImplementedError
+
+    def write_batch_end(self) -> None:
+        """Called by the writer thread after each drained batch."""
+
+    # ---------- logging.Handler ----------
 
     def emit(self, record: logging.LogRecord):
-        try:
-            message = record.getMessage().lower()
-
-            if record.name == "uvicorn.error":
-                if any(p in message for p in NOISE_PHRASES):
-                    return
-                # If uvicorn.error has exception info, show the error
-                if record.exc_info:
-                    console.print(self.error_renderer.render(*record.exc_info))
-                    return
-
-            if record.name == "uvicorn.access":
-                panel_record = self._convert_uvicorn_access(record)
-                if panel_record:
-                    console.print(self.http_renderer.render(panel_record))
-                return
-
-            payload = record.msg
-            if isinstance(payload, SuperKitLogRecord):
-                console.print(self._render(payload))
-
-            # Handle any other log record with exception info
-            elif record.exc_info:
-                console.print("\n")
-                console.print(self.error_renderer.render(*record.exc_info))
+        # Only SuperKit records and exceptions are shown; skip the rest
+        # before they are queued
+        if record.exc_info is None and not isinstance(record.msg, SuperKitLogRecord):
+            return
+
+        if self.pipeline is not None and self.pipeline.running:
+            self.pipeline.submit(record)
+            return
 
+        self._write(record)
+        self.write_batch_end()
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until queued records have been written.
+        """
+        if self.pipeline is None:
+            return True
+        return self.pipeline.flush(config.flush_timeout if timeout is None else timeout)
+
+    def drain_summaries(self) -> None:
+        """
+        Report errors still collapsed in an open window, through the
+        writer so they stay in order. Called at shutdown, since servers
+        may exit without `close()` ever running.
+        """
+        if self.dedup is None:
+            return
+        if self.pipeline is not None and self.pipeline.running and self.pipeline.submit(_DRAIN_SUMMARIES):
+            return
+        self._drain_summaries()
+
+    def close(self):
+        if self.pipeline is not None:
+            self.pipeline.close(config.flush_timeout)
+
+        # Whatever `drain_summaries()` has not reported yet
+        if self.dedup is not None:
+            self._drain_summaries()
+
+        super().close()
+
+    def stats(self) -> dict:
+        if self.pipeline is None:
+            return {"running": False}
+        return self.pipeline.stats()
+
+    # ---------- writer side ----------
+
+    def _write(self, record: logging.LogRecord):
+        if record is _DRAIN_SUMMARIES:
+            self._drain_summaries()
+            return
+
+        if self.dedup is not None:
+            self._write_error_summaries(record.created)
+
+        try:
+            output = self._build(record)
+            if output is not None:
+                self.write(output)
         except Exception:
             self.handleError(record)
 
-    def _convert_uvicorn_access(self, record: logging.LogRecord):
-        msg = record.getMessage()
-        try:
-            # Parse: 127.0.0.1:54321 - "GET /api/users HTTP/1.1" 200
-            parts = msg.split('"')
+    def _build(self, record: logging.LogRecord):
+        # Noise is dropped by `NoiseFilter` on the uvicorn loggers
+        payload = record.msg
+        if isinstance(payload, SuperKitLogRecord):
+            return self.render(payload, record.created)
 
-            # Client info (before the quoted part)
-            client = parts[0].strip().rstrip(' -')
+        # Any other log record is shown only if it carries an exception
+        if record.exc_info:
+            return self._build_error(record.exc_info, record.created)
 
-            # Request line
-            request_part = parts[1]
-            method, path, protocol = request_part.split()
+        return None
 
-            # Status code
-            status_part = parts[2].strip().split()
-            status = status_part[0]
+    def _build_error(self, exc_info, created: float):
+        exc_type, exc_value, exc_tb = exc_info
+        type_name = exc_type.__name__
+        message = str(exc_value)
+        frames = self.error_frames.user_frames(exc_tb)
 
-        except Exception as e:
+        if self.dedup is not None and not self.dedup.observe(type_name, message, frames, created):
             return None
 
-        return SuperKitLogRecord(
-            kind="http",
-            level="INFO",
-            title=f"{method} {path}",
-            meta={
-                "method": method,
-                "path": path,
-                "status": status,
-                "client": client,
-                "protocol": protocol,
-            },
+        return self.render_error(type_name, message, frames, created)
+
+    def _write_error_summaries(self, now: float | None = None) -> None:
+        summaries = self.dedup.expired(now)
+        for occurrence in summaries:
+            try:
+                self.write(self.render(occurrence.to_record(), occurrence.last_seen))
+            except Exception:
+                pass
+        if summaries and now is None:
+            self.write_batch_end()
+
+    def _drain_summaries(self) -> None:
+        summaries = self.dedup.drain()
+        for occurrence in summaries:
+            try:
+                self.write(self.render(occurrence.to_record(), occurrence.last_seen))
+            except Exception:
+                pass
+        if summaries:
+            self.write_batch_end()
+
+
+class SuperKitPanelHandler(SuperKitHandler):
+    """
+    Renders SuperKit records as Rich panels on the console.
+    """
+
+    def __init__(self, console: Console | None = None, **kwargs):
+        self.console = console
+        self.user_renderer = UserPanelRenderer()
+        self.http_renderer = HttpPanelRenderer()
+        self.json_renderer = JsonPanelRenderer()
+        self.error_renderer = ErrorPanelRenderer()
+        # kind -> renderer; anything else renders as a user panel
+        self.renderers = {
+            "http": self._render_http,
+            "json": self.json_renderer.render,
+            "error_summary": self.error_renderer.render_summary,
+            "error": self._render_error_record,
+        }
+        super().__init__(**kwargs)
+
+    def render(self, record: SuperKitLogRecord, created: float):
+        # Stamped with the record's time, not the time the writer gets to it
+        return self._render(record, created)
+
+    def render_error(self, type_name: str, message: str, frames: list, created: float):
+        return self.error_renderer.render_frames(type_name, message, frames, created)
+
+    def write(self, output) -> None:
+        (self.console or console).print(output)
+
+    def _render(self, record: SuperKitLogRecord, created: float | None = None):
+        return self.renderers.get(record.kind, self.user_renderer.render)(record, created)
+
+    def _render_error_record(self, record: SuperKitLogRecord, created: float | None = None):
+        # Errors already reduced to frames elsewhere (e.g. by a worker)
+        frames = [(f["file"], f["line"], f["function"]) for f in (record.meta or {}).get("frames", ())]
+        return self.error_renderer.render_frames(record.title, record.message, frames, created)
+
+    def _render_http(self, record: SuperKitLogRecord, created: float | None = None):
+        # Entries carry no time of their own; they show the request's
+        entries = [self._render(entry, created) for entry in record.entries]
+        return self.http_renderer.render(record, entries, created)
+
+
+class SuperKitJsonLinesHandler(SuperKitHandler):
+    """
+    Writes one JSON object per record to a text stream.
+
+    Used for production / non-TTY output; no Rich objects are built.
+    """
+
+    def __init__(self, stream=None, **kwargs):
+        self.stream = stream
+        self.renderer = JsonLinesRenderer()
+        super().__init__(**kwargs)
+
+    def render(self, record: SuperKitLogRecord, created: float):
+        return self.renderer.render(record, created)
+
+    def render_error(self, type_name: str, message: str, frames: list, created: float):
+        return self.renderer.render_error(type_name, message, frames, created)
+
+    def write(self, output) -> None:
+        (self.stream or sys.stdout).write(output + "\n")
+
+    def write_batch_end(self) -> None:
+        (self.stream or sys.stdout).flush()
+
+
+class SuperKitFileHandler(SuperKitJsonLinesHandler):
+    """
+    Writes JSON lines to a size/time rotated file (see `RotatingFile`).
+    """
+
+    def __init__(self, path: str | None = None, **kwargs):
+        stream = RotatingFile(
+            path or config.file,
+            max_bytes=config.file_max_bytes,
+            rotate_interval=config.file_rotate_interval,
+            backups=config.file_backups,
+            fsync_interval=config.file_fsync_interval,
+            compress=config.file_compress,
         )
+        super().__init__(stream=stream, **kwargs)
+
+    def close(self):
+        super().close()
+        self.stream.close(config.flush_timeout)
+
+
+class SuperKitRingHandler(logging.Handler):
+    """
+    Stores records in the in-memory `LogRing`.
+
+    Runs inline on the calling thread: storing is a slot assignment,
+    nothing is rendered.
+    """
+
+    def __init__(self, ring: LogRing):
+        super().__init__()
+        self.ring = ring
+
+    def emit(self, record: logging.LogRecord):
+        payload = record.msg
+        if isinstance(payload, SuperKitLogRecord):
+            self.ring.append(payload, record.created)
+        elif record.exc_info and record.exc_info[0] is not None:
+            exc_type, exc_value, _ = record.exc_info
+            self.ring.append(
+                SuperKitLogRecord(
+                    kind="error",
+                    level="ERROR",
+                    title=exc_type.__name__,
+                    message=str(exc_value),
+                ),
+                record.created,
+            )
+
+
+class SuperKitSocketHandler(SuperKitHandler):
+    """
+    Worker-side handler that sends records to the supervisor's
+    `LogAggregator` instead of writing them.
+
+    Records are serialized on the writer thread and sent once per batch.
+    If the aggregator is unreachable the batch goes to stderr as JSON
+    lines, and the next batch reconnects.
+    """
+
+    def __init__(self, path: str, **kwargs):
+        self.path = path
+        self.worker = os.getpid()
+        self._sock = None
+        self._pending: list[str] = []
+        super().__init__(**kwargs)
+
+    def render(self, record: SuperKitLogRecord, created: float):
+        return encode_record(record, created, self.worker)
+
+    def render_error(self, type_name: str, message: str, frames: list, created: float):
+        return encode_error(type_name, message, frames, created, self.worker)
+
+    def write(self, output) -> None:
+        self._pending.append(output)
+
+    def write_batch_end(self) -> None:
+        if not self._pending:
+            return
+        data = "\n".join(self._pending) + "\n"
+        self._pending.clear()
+
+        try:
+            if self._sock is None:
+                self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self._sock.connect(self.path)
+            self._sock.sendall(data.encode("utf-8"))
+        except OSError:
+            self._disconnect()
+            sys.stderr.write(data)
 
-    def _render(self, record: SuperKitLogRecord):
-        if record.kind == "http":
-            return self.http_renderer.render(record)
-        if record.kind == "json":
-            return self.json_renderer.render(record)
-        return self.user_renderer.render(record)
+    def close(self):
+        super().close()
+        self._disconnect()
 
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+            self._sock = None
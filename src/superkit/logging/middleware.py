@@ -0,0 +1,155 @@
+import time
+import random
+import logging
+
+from superkit.logging.config import config
+from superkit.logging.context import (
+    open_request_scope,
+    close_request_scope,
+    open_request_buffer,
+    close_request_buffer,
+)
+from superkit.logging.record import SuperKitLogRecord
+
+_http_logger = logging.getLogger("superkit.http")
+
+
+class LogContextMiddleware:
+    """
+    ASGI middleware that gives every request its own log scope.
+
+    Entries still open when the response finishes are emitted here, so
+    no log waits on garbage collection to appear.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        token = open_request_scope()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            close_request_scope(token)
+
+
+class AccessLogMiddleware:
+    """
+    ASGI middleware that emits one `http` record per request.
+
+    The record is built straight from the ASGI scope and send events
+    (status, duration, response bytes, request id), replacing uvicorn's
+    formatted access lines. Records are sampled per status code.
+
+    With `request_buffer` on, `log.*` entries made during the request
+    are collected and written once as the record's `entries`.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.sample_rate = config.access_sample_rate
+        self.status_rates = {str(k).lower(): v for k, v in config.access_status_rates.items()}
+        self._rates: dict[int, float] = {}
+        self.buffer = config.request_buffer
+        self.keep_all = config.request_keep == "all"
+        self.slow_ms = config.slow_request_ms
+        # Polling the logs endpoint should not log itself
+        self.skip_path = config.endpoint
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope.get("path") == self.skip_path
+            or not _http_logger.isEnabledFor(logging.INFO)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+        size = 0
+        failed = False
+        token = open_request_buffer() if self.buffer else None
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            buffer = close_request_buffer(token) if token is not None else None
+
+            entries = []
+            if buffer is not None and buffer.records and (
+                self.keep_all
+                or failed
+                or status >= 500
+                or buffer.levelno >= logging.WARNING
+                or duration_ms >= self.slow_ms
+            ):
+                entries = buffer.records
+
+            if entries or self._sampled(status):
+                record = self._record(scope, status, size, duration_ms)
+                record.entries = entries
+                if entries and buffer.dropped:
+                    record.meta["dropped_entries"] = buffer.dropped
+                _http_logger.info(record)
+
+    def _sampled(self, status: int) -> bool:
+        rate = self._rates.get(status)
+        if rate is None:
+            rate = self.status_rates.get(
+                str(status),
+                self.status_rates.get(f"{status // 100}xx", self.sample_rate),
+            )
+            self._rates[status] = rate
+
+        if rate >= 1:
+            return True
+        if rate <= 0:
+            return False
+        return random.random() < rate
+
+    def _record(self, scope, status: int, size: int, duration_ms: float) -> SuperKitLogRecord:
+        method = scope.get("method", "HTTP")
+        path = scope.get("path", "")
+        query = scope.get("query_string", b"")
+        if query:
+            path = f"{path}?{query.decode('latin-1')}"
+
+        client = scope.get("client")
+        request_id = None
+        for name, value in scope.get("headers", ()):
+            if name == b"x-request-id":
+                request_id = value.decode("latin-1")
+                break
+
+        return SuperKitLogRecord(
+            kind="http",
+            level="INFO",
+            title=f"{method} {path}",
+            meta={
+                "method": method,
+                "path": path,
+                "status": status,
+                "client": f"{client[0]}:{client[1]}" if client else "",
+                "protocol": f"HTTP/{scope.get('http_version', '1.1')}",
+                "duration_ms": round(duration_ms, 2),
+                "bytes": size,
+                "request_id": request_id,
+            },
+        )
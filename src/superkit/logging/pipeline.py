@@ -0,0 +1,226 @@
+import threading
+from collections import deque
+
+from superkit.logging.config import OVERFLOW_POLICIES
+
+
+class LogPipeline:
+    """
+    Bounded queue between log call sites and a dedicated writer thread.
+
+    - `submit()` only enqueues; rendering and I/O happen on the writer
+    - Overflow policy decides what happens when the queue is full:
+        drop_oldest → evict the oldest queued item
+        drop_new    → discard the incoming item
+        block       → wait for the writer to make room
+    - `flush()` waits until everything submitted so far is written
+    - `on_batch_end` runs once per drained batch (e.g. one stream flush
+      instead of one per record)
+    - `on_idle` runs on the writer every `idle_interval` seconds while the
+      queue is empty (time-based housekeeping)
+    """
+
+    BATCH_SIZE = 256
+
+    def __init__(
+        self,
+        write,
+        *,
+        maxsize: int = 10_000,
+        overflow: str = "drop_oldest",
+        on_batch_end=None,
+        on_idle=None,
+        idle_interval: float = 1.0,
+        name: str = "superkit-log-writer",
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Invalid overflow policy '{overflow}'. "
+                f"Expected one of: {', '.join(OVERFLOW_POLICIES)}."
+            )
+
+        self._write = write
+        self._on_batch_end = on_batch_end
+        self._on_idle = on_idle
+        self._idle_interval = idle_interval
+        self._maxsize = max(1, maxsize)
+        self._overflow = overflow
+        self._name = name
+
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+        self._not_full = threading.Condition(self._lock)
+        self._idle = threading.Condition(self._lock)
+
+        # queued + currently being written
+        self._pending = 0
+        self._closed = True
+        self._thread: threading.Thread | None = None
+
+        # counters
+        self._submitted = 0
+        self._written = 0
+        self._dropped = 0
+        self._high_watermark = 0
+
+    # ---------- lifecycle ----------
+
+    @property
+    def running(self) -> bool:
+        return not self._closed
+
+    def start(self) -> "LogPipeline":
+        with self._lock:
+            if not self._closed:
+                return self
+            self._closed = False
+            self._thread = threading.Thread(
+                target=self._run,
+                name=self._name,
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Block until every submitted item is written.
+
+        Returns False if the timeout expired first.
+        """
+        if self._on_writer_thread():
+            return self._pending == 0
+
+        with self._lock:
+            return self._idle.wait_for(lambda: self._pending == 0, timeout)
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Drain the queue and stop the writer thread.
+        """
+        self.flush(timeout)
+
+        with self._lock:
+            self._closed = True
+            self._not_empty.notify_all()
+            self._not_full.notify_all()
+            thread = self._thread
+            self._thread = None
+
+        if thread is not None and not self._on_writer_thread(thread):
+            thread.join(timeout)
+
+    # ---------- producer side ----------
+
+    def submit(self, item) -> bool:
+        """
+        Enqueue an item for the writer.
+
+        Returns False when the item was not accepted (pipeline closed,
+        or dropped by the overflow policy).
+        """
+        # The writer must never wait on itself
+        if self._on_writer_thread():
+            self._write(item)
+            return True
+
+        with self._lock:
+            if self._closed:
+                return False
+
+            if len(self._queue) >= self._maxsize:
+                if self._overflow == "drop_new":
+                    self._dropped += 1
+                    return False
+
+                if self._overflow == "drop_oldest":
+                    self._queue.popleft()
+                    self._pending -= 1
+                    self._dropped += 1
+
+                else:  # block
+                    self._not_full.wait_for(
+                        lambda: len(self._queue) < self._maxsize or self._closed
+                    )
+                    if self._closed:
+                        return False
+
+            self._queue.append(item)
+            self._pending += 1
+            self._submitted += 1
+
+            depth = len(self._queue)
+            if depth > self._high_watermark:
+                self._high_watermark = depth
+
+            self._not_empty.notify()
+
+        return True
+
+    # ---------- writer side ----------
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._queue and not self._closed:
+                    self._not_empty.wait(self._idle_interval if self._on_idle else None)
+
+                if not self._queue:
+                    if self._closed:
+                        return
+                    batch = None
+                else:
+                    batch = []
+                    while self._queue and len(batch) < self.BATCH_SIZE:
+                        batch.append(self._queue.popleft())
+
+                    self._not_full.notify_all()
+
+            if batch is None:
+                if self._on_idle is not None:
+                    try:
+                        self._on_idle()
+                    except Exception:
+                        pass
+                continue
+
+            for item in batch:
+                try:
+                    self._write(item)
+                except Exception:
+                    # The write callable owns error reporting
+                    pass
+
+            if self._on_batch_end is not None:
+                try:
+                    self._on_batch_end()
+                except Exception:
+                    pass
+
+            with self._lock:
+                self._pending -= len(batch)
+                self._written += len(batch)
+                if self._pending <= 0:
+                    self._pending = 0
+                    self._idle.notify_all()
+
+    def _on_writer_thread(self, thread: threading.Thread | None = None) -> bool:
+        thread = thread or self._thread
+        return thread is not None and threading.current_thread() is thread
+
+    # ---------- introspection ----------
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "running": not self._closed,
+                "capacity": self._maxsize,
+                "overflow": self._overflow,
+                "depth": len(self._queue),
+                "pending": self._pending,
+                "high_watermark": self._high_watermark,
+                "submitted": self._submitted,
+                "written": self._written,
+                "dropped": self._dropped,
+            }
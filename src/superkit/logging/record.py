@@ -1,7 +1,7 @@
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
-@dataclass
+@dataclass(slots=True)
 class SuperKitLogRecord:
     kind: str
     level: str
@@ -10,3 +10,5 @@ class SuperKitLogRecord:
     data: Any = None
     meta: dict | None = None
     attachments: list[dict[str, Any]] = field(default_factory=list)
+    # Records grouped under this one (e.g. a request's entries)
+    entries: list["SuperKitLogRecord"] = field(default_factory=list)
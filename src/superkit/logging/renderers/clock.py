@@ -0,0 +1,33 @@
+import time
+
+
+class SecondClock:
+    """
+    "HH:MM:SS" for an epoch time, formatted at most once per second
+    (timestamps arrive mostly in order).
+    """
+
+    __slots__ = ("_cached",)
+
+    def __init__(self):
+        # (epoch second, formatted); swapped as one tuple so readers on
+        # other threads never see a half-updated pair
+        self._cached = (-1, "")
+
+    def now(self) -> str:
+        return self.at(None)
+
+    def at(self, created: float | None) -> str:
+        """
+        `created` (a record's creation time), or the current time.
+        """
+        second = int(time.time() if created is None else created)
+        cached = self._cached
+        if cached[0] == second:
+            return cached[1]
+        text = time.strftime("%H:%M:%S", time.localtime(second))
+        self._cached = (second, text)
+        return text
+
+
+clock = SecondClock()
@@ -1,7 +1,10 @@
+import os
 from datetime import datetime
 from rich.panel import Panel
 from rich.text import Text
-from pathlib import Path
+
+from superkit.logging.renderers.clock import clock
+from superkit.logging.renderers.source import source_cache, project_relative_path
 
 
 class ErrorPanelRenderer:
@@ -16,108 +19,131 @@ class ErrorPanelRenderer:
         'venv',
     ]
 
+    # Most recent user frames shown in the traceback section
+    MAX_FRAMES = 20
+
+    def __init__(self):
+        self._user_code: dict[str, bool] = {}
+
     def _is_user_code(self, filename: str) -> bool:
         """Check if the file is user code (not framework code)"""
-        return not any(fw in filename for fw in self.FRAMEWORK_PATHS)
+        is_user = self._user_code.get(filename)
+        if is_user is None:
+            is_user = not any(fw in filename for fw in self.FRAMEWORK_PATHS)
+            self._user_code[filename] = is_user
+        return is_user
 
-    def _get_project_relative_path(self, filename: str) -> str:
+    def _get_project_relative_path(self, filename: str, cwd: str | None = None) -> str:
         """Get the project-relative path for a file"""
         try:
-            file_path = Path(filename).resolve()
-            cwd = Path.cwd()
-            try:
-                # Try to get relative path from current working directory
-                relative_path = file_path.relative_to(cwd)
-                return str(relative_path)
-            except ValueError:
-                # If file is outside project, return just the filename
-                return file_path.name
-        except:
+            cwd = cwd or os.getcwd()
+        except OSError:
             return filename
-
-    def render(self, exc_type, exc_value, exc_tb):
+        return project_relative_path(filename, cwd)
+
+    def _collect_frames(self, exc_tb) -> tuple[list, list]:
+        """Return (all_frames, user_frames) for a traceback"""
+        # Collect all frames
+        all_frames = []
+        tb = exc_tb
+        while tb is not None:
+            all_frames.append(tb)
+            tb = tb.tb_next
+
+        # Filter to only user code frames
+        user_frames = [
+            tb for tb in all_frames
+            if self._is_user_code(tb.tb_frame.f_code.co_filename)
+        ]
+
+        # If we filtered everything out, show at least the last frame
+        if not user_frames and all_frames:
+            user_frames = [all_frames[-1]]
+
+        return all_frames, user_frames
+
+    def user_frames(self, exc_tb) -> list[tuple[str, int, str]]:
+        """(filename, lineno, function) for each user frame"""
+        if not exc_tb:
+            return []
+        _, user_frames = self._collect_frames(exc_tb)
+        return [
+            (tb.tb_frame.f_code.co_filename, tb.tb_lineno, tb.tb_frame.f_code.co_name)
+            for tb in user_frames
+        ]
+
+    def render(self, exc_type, exc_value, exc_tb, created: float | None = None):
         """Render a runtime error with filtered stack trace"""
-
-        # Get current time
-        time = datetime.now().strftime("%H:%M:%S")
+        return self.render_frames(
+            exc_type.__name__,
+            str(exc_value),
+            self.user_frames(exc_tb),
+            created,
+        )
+
+    def render_frames(self, type_name: str, message: str, frames: list[tuple[str, int, str]], created: float | None = None):
+        """
+        Render an error from already extracted (filename, lineno, function)
+        user frames. `created` is when the error was logged (default now).
+        """
+
+        # Time the error was logged
+        time = clock.at(created)
 
         # Build the error content
         content = Text()
 
         # Error type and message
-        content.append(f"{exc_type.__name__}: {str(exc_value)}", style="red bold")
+        content.append(f"{type_name}: {message}", style="red bold")
         content.append("\n\n")
 
         # Build the filtered stack trace
-        if exc_tb:
-            # Collect all frames
-            all_frames = []
-            tb = exc_tb
-            while tb is not None:
-                all_frames.append(tb)
-                tb = tb.tb_next
-
-            # Filter to only user code frames
-            user_frames = [
-                tb for tb in all_frames
-                if self._is_user_code(tb.tb_frame.f_code.co_filename)
-            ]
-
-            # If we filtered everything out, show at least the last frame
-            if not user_frames and all_frames:
-                user_frames = [all_frames[-1]]
-
-            if user_frames:
-                content.append("Traceback:\n", style="bold")
-                content.append("─" * 60, style="dim")
-                content.append("\n\n")
-
-                # Show each user frame in the stack
-                for idx, tb in enumerate(user_frames):
-                    frame = tb.tb_frame
-                    filename = frame.f_code.co_filename
-                    lineno = tb.tb_lineno
-                    function_name = frame.f_code.co_name
-
-                    # Get project-relative path
-                    relative_path = self._get_project_relative_path(filename)
-
-                    # Frame header
-                    is_last = (idx == len(user_frames) - 1)
-                    arrow = "❱ " if is_last else "  "
-
-                    content.append(arrow, style="red bold" if is_last else "dim")
-                    content.append(f"File \"{relative_path}\", line {lineno}, in {function_name}\n",
-                                   style="cyan bold" if is_last else "cyan")
-
-                    # Try to show the code for this frame
-                    try:
-                        with open(filename, 'r') as f:
-                            lines = f.readlines()
-
-                        if 0 < lineno <= len(lines):
-                            code_line = lines[lineno - 1].strip()
-                            content.append("    ", style="")
-                            content.append(code_line, style="red bold" if is_last else "")
-                            content.append("\n")
-                    except:
-                        pass
-
+        if frames:
+            try:
+                cwd = os.getcwd()
+            except OSError:
+                cwd = None
+
+            hidden = max(0, len(frames) - self.MAX_FRAMES)
+            shown = frames[hidden:]
+
+            content.append("Traceback:\n", style="bold")
+            content.append("─" * 60, style="dim")
+            content.append("\n\n")
+
+            if hidden:
+                content.append(f"  … {hidden} earlier frame(s) hidden\n\n", style="dim italic")
+
+            # Show each user frame in the stack
+            for idx, (filename, lineno, function_name) in enumerate(shown):
+                # Get project-relative path
+                relative_path = self._get_project_relative_path(filename, cwd)
+
+                # Frame header
+                is_last = (idx == len(shown) - 1)
+                arrow = "❱ " if is_last else "  "
+
+                content.append(arrow, style="red bold" if is_last else "dim")
+                content.append(f"File \"{relative_path}\", line {lineno}, in {function_name}\n",
+                               style="cyan bold" if is_last else "cyan")
+
+                # Show the code for this frame
+                code_line = source_cache.getline(filename, lineno).strip()
+                if code_line:
+                    content.append("    ", style="")
+                    content.append(code_line, style="red bold" if is_last else "")
                     content.append("\n")
 
-                content.append("─" * 60, style="dim")
-                content.append("\n\n")
+                content.append("\n")
 
-            # Show detailed code context for the last frame (where error occurred)
-            last_tb = user_frames[-1] if user_frames else all_frames[-1]
-            frame = last_tb.tb_frame
-            filename = frame.f_code.co_filename
-            lineno = last_tb.tb_lineno
+            content.append("─" * 60, style="dim")
+            content.append("\n\n")
 
-            try:
-                with open(filename, 'r') as f:
-                    lines = f.readlines()
+            # Show detailed code context for the last frame (where error occurred)
+            filename, lineno, _ = frames[-1]
+            lines = source_cache.getlines(filename)
 
+            if lines:
                 # Show 3 lines before and 2 after the error
                 start = max(0, lineno - 4)
                 end = min(len(lines), lineno + 3)
@@ -136,9 +162,6 @@ class ErrorPanelRenderer:
                         content.append(line.rstrip(), style="")
                     content.append("\n")
 
-            except Exception:
-                pass
-
         return Panel(
             content,
             title=f"Runtime Error • {time}",
@@ -146,4 +169,35 @@ class ErrorPanelRenderer:
             title_align="left",
             padding=(1, 2),
             width=100,
-        )
\ No newline at end of file
+        )
+
+    def render_summary(self, record, created: float | None = None):
+        """Render a collapsed summary of repeated errors"""
+        meta = record.meta or {}
+        first_seen = datetime.fromtimestamp(meta.get("first_seen", 0)).strftime("%H:%M:%S")
+        last_seen = datetime.fromtimestamp(meta.get("last_seen", 0)).strftime("%H:%M:%S")
+
+        content = Text()
+        content.append(f"{record.title}: {record.message}", style="red bold")
+        content.append("\n\n")
+        content.append(f"× {meta.get('occurrences', 0)} occurrences", style="bold")
+        content.append(f" ({meta.get('suppressed', 0)} collapsed)\n", style="dim")
+        content.append(f"first seen {first_seen} • last seen {last_seen}", style="dim")
+
+        frames = meta.get("frames") or []
+        if frames:
+            top = frames[-1]
+            relative_path = self._get_project_relative_path(top["file"])
+            content.append("\n\n")
+            content.append("❱ ", style="red bold")
+            content.append(f"File \"{relative_path}\", line {top['line']}, in {top['function']}",
+                           style="cyan bold")
+
+        return Panel(
+            content,
+            title=f"Repeated Error • {last_seen}",
+            border_style="red",
+            title_align="left",
+            padding=(1, 2),
+            width=100,
+        )
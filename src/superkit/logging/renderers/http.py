@@ -1,47 +1,102 @@
-from datetime import datetime
+from functools import partial
+from rich.console import Group
 from rich.panel import Panel
-from rich.text import Text
+from rich.rule import Rule
+from rich.style import Style
+from rich.control import strip_control_codes
+from rich.text import Span, Text
 
+from superkit.logging.renderers.clock import clock
 from superkit.logging.styles.defaults import HTTP_COLORS, STATUS_COLORS, STATUS_TEXT
 
+# Precomputed at import: status code -> (label, style), method -> panel
+_STATUS = {}
+for _code in range(100, 600):
+    _text = STATUS_TEXT.get(_code, "")
+    _color = STATUS_COLORS.get(f"{_code // 100}xx", "white")
+    _STATUS[_code] = (f"{_code} {_text}" if _text else str(_code), Style.parse(f"{_color} bold"))
+
+_PANELS = {
+    method: partial(Panel, border_style=color, title_align="left", padding=(1, 2))
+    for method, color in HTTP_COLORS.items()
+}
+_DEFAULT_PANEL = partial(Panel, border_style="white", title_align="left", padding=(1, 2))
+
+_DIM = Style.parse("dim")
+_DIM_WHITE = Style.parse("dim white")
+_BOLD = Style.parse("bold")
+_PATH = Style.parse("cyan bold")
+_SEPARATOR = (" - ", _DIM)
+_NEWLINE = ("\n", "")
+
+
+def _assemble(parts: list[tuple[str, Style | str]]) -> Text:
+    """
+    Build a Text from (text, style) parts in one go; much cheaper than
+    one `Text.append` per part. Parts must be free of control codes.
+    """
+    plain = []
+    spans = []
+    offset = 0
+    for text, style in parts:
+        end = offset + len(text)
+        if style:
+            spans.append(Span(offset, end, style))
+        plain.append(text)
+        offset = end
+    return Text("".join(plain), spans=spans)
+
 
 class HttpPanelRenderer:
-    def render(self, record):
-        time = datetime.now().strftime("%H:%M:%S")
+    def render(self, record, entries: list | None = None, created: float | None = None):
+        """
+        `entries` are the already-rendered records grouped under this
+        request; they are shown below the status lines.
+        """
+        time = clock.at(created)
         method = record.meta.get("method", "HTTP")
-        path = record.meta.get("path", "")
+        path = strip_control_codes(record.meta.get("path", ""))
         status = record.meta.get("status", "")
-        client = record.meta.get("client", "")
-        protocol = record.meta.get("protocol", "")
+        client = strip_control_codes(record.meta.get("client", ""))
+        protocol = strip_control_codes(record.meta.get("protocol", ""))
+        duration_ms = record.meta.get("duration_ms")
+        size = record.meta.get("bytes")
 
-        color = HTTP_COLORS.get(method, "white")
         title = f"{method} • {time}"
 
-        body = Text()
-
         # First line: Status and Path
-        status_str = self._format_status(status)
-        body.append(status_str, style=f"{self._get_status_color(status)} bold")
-        body.append(" - ", style="dim")
-        body.append(path, style="cyan bold")
+        status_line = _STATUS.get(status)
+        if status_line is None:
+            status_line = (self._format_status(status), f"{self._get_status_color(status)} bold")
+        parts = [status_line, _SEPARATOR, (path, _PATH), _NEWLINE]
 
         # Second line: Protocol and Client
-        body.append("\n")
         if protocol:
-            body.append(protocol, style="dim white")
+            parts.append((protocol, _DIM_WHITE))
 
         if client:
             if protocol:
-                body.append(" - ", style="dim")
-            body.append(client, style="dim")
-
-        return Panel(
-            body,
-            title=title,
-            border_style=color,
-            title_align="left",
-            padding=(1, 2),
-        )
+                parts.append(_SEPARATOR)
+            parts.append((client, _DIM))
+
+        if duration_ms is not None:
+            parts.append(_SEPARATOR)
+            parts.append((f"{duration_ms:.1f} ms", _BOLD))
+
+        if size is not None:
+            parts.append(_SEPARATOR)
+            parts.append((f"{size} B", _DIM))
+
+        body = _assemble(parts)
+
+        content = body
+        if entries:
+            content = Group(body, Rule(style="dim"), *entries)
+            dropped = record.meta.get("dropped_entries")
+            if dropped:
+                content.renderables.append(Text(f"... {dropped} more entries dropped", style=_DIM))
+
+        return _PANELS.get(method, _DEFAULT_PANEL)(content, title=title)
 
     def _format_status(self, status):
         """Format status code with text (e.g., '200 OK')"""
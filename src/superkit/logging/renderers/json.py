@@ -1,17 +1,24 @@
-from datetime import datetime
+from functools import partial
 from rich.panel import Panel
 from rich.json import JSON
 
-class JsonPanelRenderer:
-    def render(self, record):
-        time = datetime.now().strftime("%H:%M:%S")
-        title = f"JSON • {time}"
+from superkit.logging.encoding import JsonSnapshot
+from superkit.logging.renderers.clock import clock
+
+_PANEL = partial(Panel, border_style="magenta")
+
 
-        json_render = JSON.from_data(record.data)
+def json_renderable(data) -> JSON:
+    """
+    Rich JSON for a `JsonSnapshot` (its text as-is) or plain data.
+    """
+    if isinstance(data, JsonSnapshot):
+        return JSON(data.text)
+    return JSON.from_data(data)
 
-        return Panel(
-            json_render,
-            title=title,
-            border_style="magenta",
-        )
+
+class JsonPanelRenderer:
+    def render(self, record, created: float | None = None):
+        title = f"JSON • {clock.at(created)}"
+        return _PANEL(json_renderable(record.data), title=title)
 
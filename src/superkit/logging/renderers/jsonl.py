@@ -0,0 +1,84 @@
+from datetime import datetime, timezone
+
+from superkit.logging.encoding import JsonSnapshot, dumps
+
+
+class JsonLinesRenderer:
+    """
+    Serializes records to one JSON object per line.
+
+    No Rich objects are created; output is meant for log collectors.
+    """
+
+    def to_dict(self, record, created: float | None = None) -> dict:
+        return {"ts": self._timestamp(created), **self._body(record)}
+
+    def _body(self, record) -> dict:
+        return {
+            "kind": record.kind,
+            "level": record.level,
+            "title": record.title,
+            "message": record.message,
+            "meta": record.meta,
+            "attachments": record.attachments,
+            "entries": [self._body(entry) for entry in record.entries],
+        }
+
+    def error_to_dict(self, type_name: str, message: str, frames: list, created: float | None = None) -> dict:
+        return {
+            "ts": self._timestamp(created),
+            "kind": "error",
+            "level": "ERROR",
+            "title": type_name,
+            "message": message,
+            "meta": {
+                "frames": [
+                    {"file": filename, "line": lineno, "function": function}
+                    for filename, lineno, function in frames
+                ],
+            },
+            "attachments": [],
+        }
+
+    def render(self, record, created: float | None = None) -> str:
+        return self._encode(record, self._timestamp(created))
+
+    def _encode(self, record, ts: str | None = None) -> str:
+        """
+        Encode a record, splicing JSON attachment snapshots in as-is.
+        """
+        head = {
+            "kind": record.kind,
+            "level": record.level,
+            "title": record.title,
+            "message": record.message,
+            "meta": record.meta,
+        }
+        if ts is not None:
+            head = {"ts": ts, **head}
+
+        attachments = ",".join(self._encode_attachment(a) for a in record.attachments)
+        entries = ",".join(self._encode(entry) for entry in record.entries)
+        return f'{dumps(head)[:-1]},"attachments":[{attachments}],"entries":[{entries}]}}'
+
+    def _encode_attachment(self, attachment: dict) -> str:
+        data = attachment.get("data")
+        if not isinstance(data, JsonSnapshot):
+            return dumps(attachment)
+
+        rest = {k: v for k, v in attachment.items() if k != "data"}
+        if data.truncated:
+            rest["truncated"] = True
+        prefix = dumps(rest)[:-1] + "," if rest else "{"
+        return f'{prefix}"data":{data.text}}}'
+
+    def render_error(self, type_name: str, message: str, frames: list, created: float | None = None) -> str:
+        return dumps(self.error_to_dict(type_name, message, frames, created))
+
+    def _timestamp(self, created: float | None) -> str:
+        moment = (
+            datetime.fromtimestamp(created, tz=timezone.utc)
+            if created is not None
+            else datetime.now(timezone.utc)
+        )
+        return moment.isoformat(timespec="milliseconds")
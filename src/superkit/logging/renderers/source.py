@@ -0,0 +1,88 @@
+import os
+import time
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+
+
+class SourceCache:
+    """
+    Bounded LRU of source file lines, invalidated by mtime/size.
+
+    Files are stat'ed at most once per `check_interval` seconds, so an
+    error storm hitting the same frames never touches the disk again.
+    """
+
+    def __init__(self, max_files: int = 256, check_interval: float = 1.0):
+        self.max_files = max_files
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        # filename -> (mtime_ns, size, checked_at, lines)
+        self._files: OrderedDict[str, tuple[int, int, float, list[str]]] = OrderedDict()
+
+    def getlines(self, filename: str) -> list[str]:
+        now = time.monotonic()
+
+        with self._lock:
+            cached = self._files.get(filename)
+            if cached is not None:
+                self._files.move_to_end(filename)
+                if now - cached[2] < self.check_interval:
+                    return cached[3]
+
+        try:
+            stat = os.stat(filename)
+        except OSError:
+            self.invalidate(filename)
+            return []
+
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            lines = cached[3]
+        else:
+            try:
+                with open(filename, "r", encoding="utf-8", errors="replace") as f:
+                    lines = f.readlines()
+            except OSError:
+                self.invalidate(filename)
+                return []
+
+        with self._lock:
+            self._files[filename] = (stat.st_mtime_ns, stat.st_size, now, lines)
+            self._files.move_to_end(filename)
+            while len(self._files) > self.max_files:
+                self._files.popitem(last=False)
+
+        return lines
+
+    def getline(self, filename: str, lineno: int) -> str:
+        lines = self.getlines(filename)
+        if 0 < lineno <= len(lines):
+            return lines[lineno - 1]
+        return ""
+
+    def invalidate(self, filename: str | None = None) -> None:
+        with self._lock:
+            if filename is None:
+                self._files.clear()
+            else:
+                self._files.pop(filename, None)
+
+
+source_cache = SourceCache()
+
+
+@lru_cache(maxsize=2048)
+def project_relative_path(filename: str, cwd: str) -> str:
+    """
+    Path of `filename` relative to `cwd`, or its basename when outside.
+    """
+    try:
+        file_path = Path(filename).resolve()
+        try:
+            return str(file_path.relative_to(cwd))
+        except ValueError:
+            # If file is outside project, return just the filename
+            return file_path.name
+    except Exception:
+        return filename
@@ -1,6 +1,9 @@
 from rich.table import Table
 from rich.box import SIMPLE, ROUNDED, MINIMAL
 
+from superkit.logging.config import config
+from superkit.logging.tables import TableSample, sample_table
+
 
 class TableRenderer:
     """Renders tabular data as a Rich Table"""
@@ -19,23 +22,34 @@ class TableRenderer:
         self.row_styles = row_styles or ["", "dim"]  # Alternating row styles
         self.box_style = box_style
 
-    def render(self, data: list[list]) -> Table:
+    def render(self, data) -> Table:
         """
-        Render a 2D list as a Rich Table.
+        Render a table sample (or raw table data) as a Rich Table.
 
         Args:
-            data: 2D list where first row is headers, remaining rows are data
+            data: `TableSample` from `add_table`, or a 2D list where the
+                  first row is headers, remaining rows are data
                   Example: [["Name", "Age"], ["Alice", 30], ["Bob", 25]]
 
         Returns:
             Rich Table object
         """
-        if not data or len(data) == 0:
+        sample = sample_table(data, config.table_max_rows)
+        if not sample.columns:
             return self._empty_table()
 
-        # Separate headers and rows
-        headers = data[0] if len(data) > 0 else []
-        rows = data[1:] if len(data) > 1 else []
+        # Only the sampled rows are stringified; widths are known upfront
+        width = len(sample.columns)
+        head = [self._cells(row, width) for row in sample.head]
+        tail = [self._cells(row, width) for row in sample.tail]
+
+        widths = [len(column) for column in sample.columns]
+        for row in head + tail:
+            for i, cell in enumerate(row):
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+
+        omitted = sample.omitted_rows
 
         # Create table
         table = Table(
@@ -45,26 +59,53 @@ class TableRenderer:
             box=self.box_style,
             padding=(0, 1),
             expand=False,
+            caption=self._caption(sample) if omitted else None,
+            caption_style="dim",
         )
 
         # Add columns
-        for header in headers:
+        for header, column_width in zip(sample.columns, widths):
             table.add_column(
-                str(header),
+                header,
                 justify="left",
+                max_width=column_width,
                 no_wrap=False,
             )
 
         # Add rows with alternating styles
-        for idx, row in enumerate(rows):
+        for idx, row in enumerate(head):
             style = self.row_styles[idx % len(self.row_styles)]
-            table.add_row(
-                *[str(cell) for cell in row],
-                style=style
-            )
+            table.add_row(*row, style=style)
+
+        if omitted:
+            table.add_row(*["..."] * width, style="dim")
+
+        for idx, row in enumerate(tail, start=len(head)):
+            style = self.row_styles[idx % len(self.row_styles)]
+            table.add_row(*row, style=style)
 
         return table
 
+    def _cells(self, row: list, width: int) -> list[str]:
+        limit = config.table_max_cell
+        cells = []
+        for cell in row[:width]:
+            text = str(cell)
+            if len(text) > limit:
+                text = text[:limit - 1] + "…"
+            cells.append(text)
+        cells.extend([""] * (width - len(cells)))
+        return cells
+
+    def _caption(self, sample: TableSample) -> str:
+        parts = [f"{sample.total_rows} rows, {sample.omitted_rows} not shown"]
+        for column, stats in sample.stats.items():
+            if "min" in stats:
+                parts.append(f"{column}: {stats['min']}..{stats['max']}")
+            if stats["nulls"]:
+                parts.append(f"{column}: {stats['nulls']} null")
+        return " · ".join(parts)
+
     def _empty_table(self) -> Table:
         """Return an empty table with a message"""
         table = Table(
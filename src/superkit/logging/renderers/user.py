@@ -1,53 +1,56 @@
-from datetime import datetime
+from functools import partial
 from rich.panel import Panel
+from rich.style import Style
 from rich.text import Text
 from rich.console import Group
-from rich.json import JSON
 from rich.rule import Rule
 
 from superkit.logging.styles.defaults import LEVEL_COLORS
+from superkit.logging.renderers.clock import clock
+from superkit.logging.renderers.json import json_renderable
 from superkit.logging.renderers.table import TableRenderer
 
+# Panel templates per level, built once at import
+_PANELS = {
+    level: partial(Panel, border_style=color, title_align="left", padding=(1, 2))
+    for level, color in LEVEL_COLORS.items()
+}
+_DEFAULT_PANEL = partial(Panel, border_style="white", title_align="left", padding=(1, 2))
+
+_MESSAGE = Style.parse("bold")
+_RULE = Style.parse("dim")
+_ATTACHMENT_TITLE = Style.parse("italic dim")
+
 
 class UserPanelRenderer:
     def __init__(self):
         self.table_renderer = TableRenderer()
     
-    def render(self, record):
-        time = datetime.now().strftime("%H:%M:%S")
-        color = LEVEL_COLORS.get(record.level, "white")
-
-        title = f"{record.level} • {time}"
+    def render(self, record, created: float | None = None):
+        title = f"{record.level} • {clock.at(created)}"
         
         renderables = []
         
         if record.message:
-            message_text = Text(record.message, style="bold")
+            message_text = Text(record.message, style=_MESSAGE)
             renderables.append(message_text)
         
         if hasattr(record, 'attachments') and record.attachments:
             for i, attachment in enumerate(record.attachments):
                 if i > 0 or record.message:
-                    renderables.append(Rule(style="dim"))
+                    renderables.append(Rule(style=_RULE))
                 
                 if attachment.get("title"):
-                    title_text = Text(attachment["title"], style="italic dim")
+                    title_text = Text(attachment["title"], style=_ATTACHMENT_TITLE)
                     renderables.append(title_text)
                     renderables.append(Text(""))
                 
                 if attachment["type"] == "json":
-                    json_render = JSON.from_data(attachment["data"])
-                    renderables.append(json_render)
+                    renderables.append(json_renderable(attachment["data"]))
                 elif attachment["type"] == "table":
                     table = self.table_renderer.render(attachment["data"])
                     renderables.append(table)
         
         body = Group(*renderables) if len(renderables) > 1 else (renderables[0] if renderables else Text(""))
 
-        return Panel(
-            body,
-            title=title,
-            border_style=color,
-            title_align="left",
-            padding=(1, 2),
-        )
+        return _PANELS.get(record.level, _DEFAULT_PANEL)(body, title=title)
@@ -0,0 +1,140 @@
+import heapq
+import logging
+import threading
+from collections import deque
+
+
+class LogRing:
+    """
+    Fixed-size ring of the most recent records.
+
+    Slots are preallocated and overwritten in place, so memory stays
+    constant no matter how much is logged. Every record gets a sequence
+    number; small per-level and per-kind indexes of recent sequence
+    numbers answer filtered queries without scanning the whole ring.
+
+    A record with grouped `entries` (a request's `log.*` calls) is
+    indexed under their levels and kinds too, so `kind="user"` or
+    `level="WARNING"` also finds requests that logged such entries.
+    """
+
+    # Distinct kinds indexed; others are found by scanning
+    MAX_KINDS = 32
+
+    def __init__(self, capacity: int = 1000):
+        self.capacity = capacity
+        self._seqs = [0] * capacity
+        self._records = [None] * capacity
+        self._created = [0.0] * capacity
+        # Highest level and every kind of a record and its entries
+        self._levelnos = [0] * capacity
+        self._kindsets: list[frozenset] = [frozenset()] * capacity
+        self._levels: dict[int, deque[int]] = {}
+        self._kinds: dict[str, deque[int]] = {}
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def append(self, record, created: float) -> int:
+        levelno = _levelno(record.level)
+        kinds = {record.kind}
+        for entry in record.entries:
+            levelno = max(levelno, _levelno(entry.level))
+            kinds.add(entry.kind)
+
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+            slot = seq % self.capacity
+            self._seqs[slot] = seq
+            self._records[slot] = record
+            self._created[slot] = created
+            self._levelnos[slot] = levelno
+            self._kindsets[slot] = frozenset(kinds)
+
+            self._index(self._levels, levelno, seq)
+            for kind in kinds:
+                if kind in self._kinds or len(self._kinds) < self.MAX_KINDS:
+                    self._index(self._kinds, kind, seq)
+        return seq
+
+    def _index(self, index: dict, key, seq: int) -> None:
+        seqs = index.get(key)
+        if seqs is None:
+            seqs = index[key] = deque(maxlen=self.capacity)
+        seqs.append(seq)
+
+    def query(
+        self,
+        *,
+        level: str | None = None,
+        kind: str | None = None,
+        since: int = 0,
+        limit: int = 100,
+    ) -> tuple[list[tuple[int, float, object]], int]:
+        """
+        `(seq, created, record)` entries and the cursor for the next call.
+
+        With `since`, the oldest `limit` entries after that sequence
+        number; without, the newest `limit` (the start of a tail). The
+        cursor is the last sequence number covered, so polling with it
+        neither skips nor repeats records.
+
+        `level` is a minimum level; `kind` an exact match. Both also
+        match a record through its grouped entries.
+        """
+        min_level = logging.getLevelName(level.upper()) if level else 0
+        if not isinstance(min_level, int):
+            raise ValueError(f"Unknown level '{level}'")
+        if limit <= 0:
+            # Nothing delivered: the caller's cursor stays where it was
+            return [], since
+
+        results = []
+        with self._lock:
+            last = self._seq
+            start = max(since + 1, last - self.capacity + 1, 1)
+            newest = since <= 0
+
+            if kind is not None and kind in self._kinds:
+                candidates = self._kinds[kind]
+            elif min_level:
+                candidates = heapq.merge(*(seqs for lvl, seqs in self._levels.items() if lvl >= min_level))
+            else:
+                candidates = range(start, last + 1)
+            if newest:
+                candidates = reversed(list(candidates))
+
+            for seq in candidates:
+                if seq < start:
+                    if newest:
+                        break
+                    continue
+                if len(results) >= limit:
+                    break
+                slot = seq % self.capacity
+                if self._seqs[slot] != seq:
+                    continue
+                if kind is not None and kind not in self._kindsets[slot]:
+                    continue
+                if min_level and self._levelnos[slot] < min_level:
+                    continue
+                results.append((seq, self._created[slot], self._records[slot]))
+
+        if newest:
+            results.reverse()
+            return results, last
+        # Everything up to `last` was looked at unless the page filled up
+        return results, results[-1][0] if len(results) >= limit else last
+
+
+def _levelno(level: str) -> int:
+    levelno = logging.getLevelName(level)
+    return levelno if isinstance(levelno, int) else logging.INFO
+
+
+# Process-wide ring, created by `setup_logging` (None when disabled)
+log_ring: LogRing | None = None
@@ -1,16 +1,106 @@
+import os
 import logging
-from superkit.logging.handler import SuperKitPanelHandler
 
+from superkit.logging import ring
+from superkit.logging.aggregate import AGGREGATOR_ENV
+from superkit.logging.context import flush_pending
+from superkit.logging.config import configure, resolve_format
+from superkit.logging.filters.noise import NOISE_PHRASES, NoiseFilter
+from superkit.runtime.profiling import profiled
+from superkit.logging.handler import (
+    SuperKitHandler,
+    SuperKitPanelHandler,
+    SuperKitJsonLinesHandler,
+    SuperKitFileHandler,
+    SuperKitRingHandler,
+    SuperKitSocketHandler,
+)
+
+
+@profiled()
+def setup_logging(settings=None):
+    config = configure(settings)
 
-def setup_logging():
     # Root logger (SuperKit owns logging)
     root = logging.getLogger()
+
+    # Drain and stop writer threads from a previous setup
+    for handler in root.handlers:
+        if isinstance(handler, SuperKitHandler):
+            handler.close()
+
     root.handlers.clear()
     root.setLevel(logging.INFO)
-    root.addHandler(SuperKitPanelHandler())
 
-    # Force uvicorn loggers to propagate to root
+    aggregator = os.environ.get(AGGREGATOR_ENV)
+
+    if aggregator:
+        # Worker of a multi-process server: the supervisor writes
+        root.addHandler(SuperKitSocketHandler(aggregator))
+    elif config.file:
+        root.addHandler(SuperKitFileHandler())
+
+    if not aggregator and not (config.file and config.file_only):
+        if resolve_format() == "jsonl":
+            root.addHandler(SuperKitJsonLinesHandler())
+        else:
+            root.addHandler(SuperKitPanelHandler())
+
+    # Recent records for the logs endpoint / `superkit logs tail --url`
+    ring.log_ring = ring.LogRing(config.ring_size) if config.ring_size > 0 else None
+    if ring.log_ring is not None:
+        root.addHandler(SuperKitRingHandler(ring.log_ring))
+
+    # User-facing `log.*` API
+    logging.getLogger("superkit.apps").setLevel(config.level.upper())
+
+    # Force uvicorn loggers to propagate to root, minus server chatter
+    noise = NoiseFilter((*NOISE_PHRASES, *config.noise_phrases))
     for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
         logger = logging.getLogger(name)
         logger.handlers.clear()
         logger.propagate = True
+        for f in [f for f in logger.filters if isinstance(f, NoiseFilter)]:
+            logger.removeFilter(f)
+        logger.addFilter(noise)
+
+    # Access records come from AccessLogMiddleware, not uvicorn's strings
+    logging.getLogger("uvicorn.access").disabled = True
+
+
+def _superkit_handlers() -> list[SuperKitHandler]:
+    return [
+        h for h in logging.getLogger().handlers
+        if isinstance(h, SuperKitHandler)
+    ]
+
+
+def flush_logging(timeout: float | None = None) -> bool:
+    """
+    Wait until all queued SuperKit log records have been written.
+
+    Returns False if any handler did not drain within the timeout.
+    """
+    flush_pending()
+    return all(h.flush(timeout) for h in _superkit_handlers())
+
+
+def shutdown_logging(timeout: float | None = None) -> bool:
+    """
+    `flush_logging()` for server shutdown: also reports errors still
+    collapsed in an open dedup window, which `close()` would otherwise
+    only do at interpreter exit (never reached when the server re-raises
+    SIGTERM).
+    """
+    flush_pending()
+    for handler in _superkit_handlers():
+        handler.drain_summaries()
+    return all(h.flush(timeout) for h in _superkit_handlers())
+
+
+def get_log_stats() -> dict:
+    """
+    Queue depth and drop counters of the installed SuperKit handler.
+    """
+    handlers = _superkit_handlers()
+    return handlers[0].stats() if handlers else {"running": False}
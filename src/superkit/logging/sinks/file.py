@@ -0,0 +1,239 @@
+import os
+import re
+import gzip
+import time
+import queue
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+
+class SegmentCompressor:
+    """
+    Background thread that gzips rotated log segments.
+
+    Rotation only renames the file and queues it here, so the writer
+    never waits on compression. The `.gz` is written under a temporary
+    name and renamed when complete.
+    """
+
+    def __init__(self, name: str = "superkit-log-compress"):
+        self._queue: queue.Queue[Path | None] = queue.Queue()
+        # Segments queued or being compressed
+        self._busy: set[Path] = set()
+        self._busy_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, path: Path) -> None:
+        with self._busy_lock:
+            self._busy.add(path)
+        self._queue.put(path)
+
+    def busy(self) -> set[Path]:
+        with self._busy_lock:
+            return set(self._busy)
+
+    def close(self, timeout: float | None = None) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+            try:
+                self.compress(path)
+            except OSError:
+                pass
+            finally:
+                with self._busy_lock:
+                    self._busy.discard(path)
+
+    @staticmethod
+    def compress(path: Path) -> Path:
+        target = path.with_name(path.name + ".gz")
+        partial = path.with_name(path.name + ".gz.tmp")
+        try:
+            with open(path, "rb") as src, gzip.open(partial, "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(partial, target)
+        except OSError:
+            partial.unlink(missing_ok=True)
+            raise
+        path.unlink()
+        return target
+
+
+class RotatingFile:
+    """
+    Buffered text file that rotates by size and age.
+
+    - `write()` goes to a userspace buffer; `flush()` pushes it to the OS
+      and fsyncs at most once per `fsync_interval` seconds
+    - once the file reaches `max_bytes` or is older than
+      `rotate_interval` seconds it is renamed to `<name>.<timestamp>` and a
+      new file is opened; the old segment is gzipped in the background
+    - only the newest `backups` rotated segments are kept
+
+    The time the current file was started is kept next to it in
+    `.<name>.opened`, so age rotation also works across restarts.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike,
+        *,
+        max_bytes: int = 50 * 1024 * 1024,
+        rotate_interval: float = 86_400.0,
+        backups: int = 7,
+        fsync_interval: float = 1.0,
+        compress: bool = True,
+        buffer_size: int = 64 * 1024,
+    ):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backups = backups
+        self.fsync_interval = fsync_interval
+        self.buffer_size = buffer_size
+        self.compressor = SegmentCompressor() if compress else None
+
+        self._lock = threading.Lock()
+        self._last_fsync = time.monotonic()
+        self._file = None
+        self._open()
+
+    # ---------- stream surface ----------
+
+    def write(self, text: str) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            if self._should_rotate():
+                self._rotate()
+            self._size += self._file.write(text)
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.flush()
+            now = time.monotonic()
+            if now - self._last_fsync >= self.fsync_interval:
+                os.fsync(self._file.fileno())
+                self._last_fsync = now
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+                os.fsync(self._file.fileno())
+                self._file.close()
+                self._file = None
+        if self.compressor is not None:
+            self.compressor.close(timeout)
+
+    # ---------- rotation ----------
+
+    def _open(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8", buffering=self.buffer_size)
+        self._size = self._file.tell()
+        self._opened_at = self._started_at()
+
+    def _started_at(self) -> float:
+        """
+        When the current file was started. An existing file's age counts
+        from the time recorded when it was created, not from now.
+        """
+        marker = self.path.with_name(f".{self.path.name}.opened")
+        now = time.time()
+        if self._size:
+            try:
+                return min(now, float(marker.read_text()))
+            except (OSError, ValueError):
+                pass
+        try:
+            marker.write_text(repr(now))
+        except OSError:
+            pass
+        return now
+
+    def _should_rotate(self) -> bool:
+        if self.max_bytes and self._size >= self.max_bytes:
+            return True
+        return bool(self.rotate_interval) and time.time() - self._opened_at >= self.rotate_interval
+
+    def _rotate(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._file.close()
+
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        rotated = self.path.with_name(f"{self.path.name}.{stamp}")
+        suffix = 1
+        while rotated.exists() or rotated.with_name(rotated.name + ".gz").exists():
+            rotated = self.path.with_name(f"{self.path.name}.{stamp}-{suffix}")
+            suffix += 1
+
+        # The file is closed: whatever fails here, open a file again
+        try:
+            os.replace(self.path, rotated)
+        except OSError:
+            rotated = None
+        try:
+            self._prune()
+        except OSError:
+            pass
+        self._open()
+
+        if rotated is not None and self.compressor is not None:
+            self.compressor.submit(rotated)
+
+    def _segment_names(self) -> list[tuple[tuple[str, int], str]]:
+        """
+        ((stamp, suffix), base name) of every rotated segment, oldest
+        first. A segment and its `.gz` share one base name.
+        """
+        pattern = re.compile(re.escape(self.path.name) + r"\.(\d{8}-\d{6})(?:-(\d+))?(?:\.gz)?")
+        try:
+            names = os.listdir(self.path.parent)
+        except OSError:
+            return []
+
+        found = {}
+        for name in names:
+            match = pattern.fullmatch(name)
+            if match is not None:
+                key = (match.group(1), int(match.group(2) or 0))
+                found[key] = name.removesuffix(".gz")
+        return sorted(found.items())
+
+    def segments(self) -> list[Path]:
+        """
+        Rotated segments, oldest first: the `.gz` once compressed, the
+        plain file before.
+        """
+        paths = []
+        for _, base in self._segment_names():
+            path = self.path.with_name(base)
+            paths.append(path if path.exists() else path.with_name(base + ".gz"))
+        return paths
+
+    def _prune(self) -> None:
+        if self.backups <= 0:
+            return
+        busy = self.compressor.busy() if self.compressor is not None else set()
+        for _, base in self._segment_names()[:-self.backups]:
+            path = self.path.with_name(base)
+            # Left for the next rotation; unlinking now would cut the .gz short
+            if path in busy:
+                continue
+            for old in (path, path.with_name(base + ".gz")):
+                try:
+                    old.unlink()
+                except OSError:
+                    pass
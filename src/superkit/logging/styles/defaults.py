@@ -1,4 +1,5 @@
 LEVEL_COLORS = {
+    "DEBUG": "dim",
     "INFO": "cyan",
     "WARNING": "yellow",
     "ERROR": "red",
@@ -0,0 +1,122 @@
+from collections import deque
+from collections.abc import Mapping
+from itertools import zip_longest
+
+
+class TableSample:
+    """
+    Bounded view of the data passed to `add_table`.
+
+    Only the first and last rows are kept. Every row is still counted
+    and feeds the per-column statistics (nulls, numeric min/max), so
+    rendering cost depends on the sample size, not on the input size.
+    """
+
+    __slots__ = ("columns", "head", "tail", "total_rows", "stats")
+
+    def __init__(self, columns: list[str], head: list, tail: list, total_rows: int, stats: dict):
+        self.columns = columns
+        self.head = head
+        self.tail = tail
+        self.total_rows = total_rows
+        self.stats = stats
+
+    @property
+    def omitted_rows(self) -> int:
+        return self.total_rows - len(self.head) - len(self.tail)
+
+    def to_json(self) -> dict:
+        return {
+            "columns": self.columns,
+            "head": self.head,
+            "tail": self.tail,
+            "total_rows": self.total_rows,
+            "omitted_rows": self.omitted_rows,
+            "stats": self.stats,
+        }
+
+
+def _split(data) -> tuple[list, object]:
+    """
+    Headers and a row iterator for the supported table shapes.
+    """
+    if isinstance(data, Mapping):
+        # Column oriented: {"name": [...], "age": [...]}
+        return list(data), zip_longest(*data.values())
+
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
+        return [], rows
+
+    if isinstance(first, Mapping):
+        # Records: [{"name": ..., "age": ...}, ...]
+        columns = list(first)
+
+        def records():
+            yield tuple(first.get(c) for c in columns)
+            for row in rows:
+                yield tuple(row.get(c) for c in columns)
+
+        return columns, records()
+
+    # Rows: first row holds the headers
+    return list(first), rows
+
+
+def sample_table(data, max_rows: int = 20) -> TableSample:
+    """
+    Consume `data` once, keeping at most `max_rows` rows (half from the
+    start, half from the end).
+
+    `data` may be a list/iterable of rows whose first row is the header,
+    an iterable of dicts, or a dict of columns.
+    """
+    if isinstance(data, TableSample):
+        return data
+
+    columns, rows = _split(data)
+
+    head_size = (max_rows + 1) // 2
+    tail = deque(maxlen=max_rows - head_size)
+    head = []
+
+    width = len(columns)
+    nulls = [0] * width
+    mins = [None] * width
+    maxs = [None] * width
+    total = 0
+
+    for row in rows:
+        row = tuple(row)
+        total += 1
+
+        if len(head) < head_size:
+            head.append(row)
+        elif tail.maxlen:
+            tail.append(row)
+
+        for i, value in enumerate(row[:width]):
+            if value is None:
+                nulls[i] += 1
+            elif type(value) is int or type(value) is float:
+                if mins[i] is None or value < mins[i]:
+                    mins[i] = value
+                if maxs[i] is None or value > maxs[i]:
+                    maxs[i] = value
+
+    stats = {}
+    for i, column in enumerate(columns):
+        column_stats = {"nulls": nulls[i]}
+        if mins[i] is not None:
+            column_stats["min"] = mins[i]
+            column_stats["max"] = maxs[i]
+        stats[str(column)] = column_stats
+
+    return TableSample(
+        columns=[str(c) for c in columns],
+        head=[list(r) for r in head],
+        tail=[list(r) for r in tail],
+        total_rows=total,
+        stats=stats,
+    )
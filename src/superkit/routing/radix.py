@@ -0,0 +1,480 @@
+"""
+Radix-tree route matching (`SuperKitApp(router_engine="radix")`).
+
+Starlette tries a router's routes one by one. The matcher here indexes
+them by path segment instead: static segments are dict lookups, path
+parameters are tried per distinct convertor. Every candidate found is
+confirmed with the route's own `matches()` and served by its own
+handler, in registration order, so dependencies, validation, 405s and
+"first registered route wins" behave exactly as before.
+
+Routes that cannot be indexed (mounts, hosts, custom routes, unknown
+convertors) stay in the search as fallbacks at their position.
+"""
+
+import re
+import threading
+from dataclasses import dataclass
+
+import fastapi.routing
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from starlette.convertors import FloatConvertor, IntegerConvertor, PathConvertor, StringConvertor, UUIDConvertor
+from starlette.datastructures import URL
+from starlette.responses import PlainTextResponse, RedirectResponse
+from starlette.routing import Match, Route, WebSocketRoute
+
+from superkit.logging.api.log import log
+
+_STATIC, _PARAM, _TAIL = 0, 1, 2
+
+# Convertors whose values never contain "/", so they fit one segment
+_SEGMENT_CONVERTORS = (StringConvertor, IntegerConvertor, FloatConvertor, UUIDConvertor)
+_PLACEHOLDER = re.compile(r"{([^}]+)}")
+_regexes: dict[str, re.Pattern] = {}
+
+
+def _regex(pattern: str) -> re.Pattern:
+    compiled = _regexes.get(pattern)
+    if compiled is None:
+        compiled = _regexes[pattern] = re.compile(pattern)
+    return compiled
+
+
+def _segments(path_format: str, convertors: dict) -> tuple | None:
+    """
+    (kind, value, regex) per segment of `path_format`, or None when the
+    route cannot be indexed. A `{x:path}` parameter must be the last
+    segment and matches the rest of the path.
+    """
+    if not path_format.startswith("/"):
+        return None
+
+    parts = path_format.split("/")[1:]
+    segments = []
+    for position, part in enumerate(parts):
+        if "{" not in part:
+            segments.append((_STATIC, part, None))
+            continue
+
+        whole = _PLACEHOLDER.fullmatch(part)
+        if whole is not None and isinstance(convertors.get(whole.group(1)), PathConvertor):
+            if position != len(parts) - 1:
+                return None
+            segments.append((_TAIL, whole.group(1), None))
+            continue
+
+        # "{id}", or literal text around parameters ("{name}.{ext}")
+        pattern, end = "", 0
+        for placeholder in _PLACEHOLDER.finditer(part):
+            convertor = convertors.get(placeholder.group(1))
+            if not isinstance(convertor, _SEGMENT_CONVERTORS):
+                return None
+            pattern += re.escape(part[end:placeholder.start()]) + f"(?:{convertor.regex})"
+            end = placeholder.end()
+        pattern += re.escape(part[end:])
+        segments.append((_PARAM, pattern, _regex(pattern)))
+    return tuple(segments)
+
+
+def _route_path(scope) -> str:
+    path = scope["path"]
+    root_path = scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path):]
+    return path
+
+
+# ---------- entries ----------
+
+class _Entry:
+    """
+    One route in matching order.
+
+    `route` is a Starlette route; `context` is set instead for routes of
+    routers that FastAPI includes lazily (they are served through the
+    context's handler, like FastAPI does).
+    """
+
+    __slots__ = ("index", "kind", "segments", "methods", "route", "context", "path")
+
+    def __init__(self, index, route=None, context=None, segments=None, kind=None):
+        self.index = index
+        self.route = route
+        self.context = context
+        self.segments = segments
+        # "http" / "websocket" for indexed routes, None for fallbacks
+        self.kind = kind
+        source = context if context is not None else route
+        self.methods = getattr(source, "methods", None) if kind == "http" else None
+        self.path = getattr(source, "path_format", None) or getattr(source, "path", None)
+
+    def matches(self, scope):
+        if self.context is None:
+            return self.route.matches(scope)
+        match, child_scope = self.context.matches(scope)
+        if match != Match.NONE:
+            child_scope["route"] = self.context.original_route
+        return match, child_scope
+
+    async def handle(self, scope, receive, send):
+        if self.context is None:
+            await self.route.handle(scope, receive, send)
+            return
+
+        # What APIRoute.handle does for an included route
+        methods = self.methods
+        if methods and scope["method"] not in methods:
+            headers = {"Allow": ", ".join(methods)}
+            if "app" in scope:
+                raise HTTPException(status_code=405, headers=headers)
+            await PlainTextResponse("Method Not Allowed", status_code=405, headers=headers)(scope, receive, send)
+            return
+        await self.context.app(scope, receive, send)
+
+    def __str__(self):
+        methods = set(self.methods or ())
+        if "GET" in methods:
+            methods.discard("HEAD")
+        return f"{' '.join(sorted(methods)) or self.kind} {self.path}"
+
+
+def _entries(routes) -> list[_Entry]:
+    iter_contexts = getattr(fastapi.routing, "iter_route_contexts", None)
+
+    entries = []
+    for top in routes:
+        if iter_contexts is None:
+            items = [(top, None)]
+        else:
+            # RouteContext._route_context is set for routes of included routers
+            items = [(item.route, getattr(item, "_route_context", None)) for item in iter_contexts([top])]
+
+        indexed = []
+        for route, context in items:
+            if context is not None and context.starlette_route is not None:
+                route, context = context.starlette_route, None
+
+            if context is not None:
+                if not isinstance(context.original_route, APIRoute):
+                    break
+                segments = _segments(context.path_format, context.param_convertors)
+                kind = "http"
+            elif isinstance(route, (Route, WebSocketRoute)):
+                segments = _segments(route.path_format, route.param_convertors)
+                kind = "websocket" if isinstance(route, WebSocketRoute) else "http"
+            else:
+                break
+            if segments is None:
+                break
+            indexed.append((route, context, segments, kind))
+        else:
+            for route, context, segments, kind in indexed:
+                entries.append(_Entry(len(entries), route, context, segments, kind))
+            continue
+
+        # Something in `top` cannot be indexed: it is matched as a whole
+        entries.append(_Entry(len(entries), top))
+    return entries
+
+
+# ---------- tree ----------
+
+class _Node:
+    __slots__ = ("static", "params", "leaves", "tails")
+
+    def __init__(self):
+        self.static: dict[str, _Node] = {}
+        # pattern -> (regex, node)
+        self.params: dict[str, tuple[re.Pattern, _Node]] = {}
+        # Routes ending here, and `{x:path}` routes matching anything below
+        self.leaves: list[_Entry] = []
+        self.tails: list[_Entry] = []
+
+    def insert(self, entry: _Entry) -> None:
+        node = self
+        for kind, value, regex in entry.segments:
+            if kind == _TAIL:
+                node.tails.append(entry)
+                return
+            if kind == _STATIC:
+                node = node.static.setdefault(value, _Node())
+            else:
+                node = node.params.setdefault(value, (regex, _Node()))[1]
+        node.leaves.append(entry)
+
+    def lookup(self, parts: list[str]) -> list[_Entry]:
+        found = []
+        size = len(parts)
+        stack = [(self, 0)]
+        while stack:
+            node, position = stack.pop()
+            if position == size:
+                found += node.leaves
+                continue
+            if node.tails:
+                found += node.tails
+            part = parts[position]
+            child = node.static.get(part)
+            if child is not None:
+                stack.append((child, position + 1))
+            for regex, child in node.params.values():
+                if regex.fullmatch(part):
+                    stack.append((child, position + 1))
+        return found
+
+    def subtree(self):
+        yield from self.leaves
+        yield from self.tails
+        for child in self.static.values():
+            yield from child.subtree()
+        for _, child in self.params.values():
+            yield from child.subtree()
+
+    def overlapping(self, segments: tuple, position: int = 0):
+        """
+        Entries already in the tree that match some path `segments` match.
+        """
+        if position == len(segments):
+            yield from self.leaves
+            return
+        yield from self.tails
+
+        kind, value, regex = segments[position]
+        if kind == _TAIL:
+            for child in self.static.values():
+                yield from child.subtree()
+            for _, child in self.params.values():
+                yield from child.subtree()
+            return
+
+        if kind == _STATIC:
+            child = self.static.get(value)
+            if child is not None:
+                yield from child.overlapping(segments, position + 1)
+            for param_regex, child in self.params.values():
+                if param_regex.fullmatch(value):
+                    yield from child.overlapping(segments, position + 1)
+        else:
+            for text, child in self.static.items():
+                if regex.fullmatch(text):
+                    yield from child.overlapping(segments, position + 1)
+            for _, child in self.params.values():
+                yield from child.overlapping(segments, position + 1)
+
+
+# ---------- conflicts ----------
+
+@dataclass(frozen=True)
+class RouteConflict:
+    """
+    `route` is (partly) unreachable because `by`, registered earlier,
+    matches every path it does ("shadowed"), or some of them while
+    neither is more specific ("ambiguous"; `by` wins those).
+    """
+
+    kind: str
+    route: str
+    by: str
+    methods: tuple[str, ...]
+
+    def __str__(self):
+        if self.kind == "shadowed":
+            return f"Route {self.route} is shadowed by {self.by}"
+        return f"Route {self.route} overlaps {self.by}; requests matching both go to the latter"
+
+
+def _segment_covers(a, b) -> bool:
+    if a[0] == _STATIC:
+        return b[0] == _STATIC and a[1] == b[1]
+    if b[0] == _STATIC:
+        return a[2].fullmatch(b[1]) is not None
+    # str matches every single-segment value
+    return a[1] == b[1] or a[1] == f"(?:{StringConvertor.regex})"
+
+
+def _covers(a: _Entry, b: _Entry) -> bool:
+    first, second = a.segments, b.segments
+    if first[-1][0] == _TAIL:
+        prefix = len(first) - 1
+        return len(second) > prefix and all(map(_segment_covers, first[:prefix], second[:prefix]))
+    if second[-1][0] == _TAIL:
+        return False
+    return len(first) == len(second) and all(map(_segment_covers, first, second))
+
+
+def _conflict(earlier: _Entry, entry: _Entry) -> RouteConflict | None:
+    if earlier.kind != entry.kind:
+        return None
+    if earlier.methods and entry.methods:
+        methods = earlier.methods & entry.methods
+        if not methods:
+            return None
+    else:
+        methods = earlier.methods or entry.methods or set()
+    if "GET" in methods:
+        methods = methods - {"HEAD"}
+
+    if _covers(earlier, entry):
+        kind = "shadowed"
+    elif _covers(entry, earlier):
+        # The specific route comes first, as intended
+        return None
+    else:
+        kind = "ambiguous"
+    return RouteConflict(kind, str(entry), str(earlier), tuple(sorted(methods)))
+
+
+# ---------- index ----------
+
+class RouteIndex:
+    """
+    Routes of one router compiled into a tree, plus fallbacks.
+    """
+
+    def __init__(self, routes):
+        self.entries = _entries(routes)
+        self.fallbacks = [entry for entry in self.entries if entry.kind is None]
+        self.conflicts: list[RouteConflict] = []
+
+        self.root = _Node()
+        for entry in self.entries:
+            if entry.kind is None:
+                continue
+            seen = set()
+            for earlier in self.root.overlapping(entry.segments):
+                if earlier.index in seen:
+                    continue
+                seen.add(earlier.index)
+                conflict = _conflict(earlier, entry)
+                if conflict is not None:
+                    self.conflicts.append(conflict)
+            self.root.insert(entry)
+
+    def resolve(self, scope) -> tuple[_Entry, dict] | None:
+        """
+        The route Starlette would pick for `scope` and its child scope:
+        the first full match, else the first partial one (wrong method).
+        """
+        path = _route_path(scope)
+        candidates = self.root.lookup(path.split("/")[1:]) if path.startswith("/") else []
+        if self.fallbacks:
+            candidates += self.fallbacks
+        if len(candidates) > 1:
+            candidates.sort(key=lambda entry: entry.index)
+
+        scope_type = scope["type"]
+        method = scope.get("method")
+        partial = None
+        for entry in candidates:
+            if entry.kind is not None:
+                if entry.kind != scope_type:
+                    continue
+                if entry.methods and method not in entry.methods:
+                    if partial is None:
+                        partial = entry
+                    continue
+
+            match, child_scope = entry.matches(scope)
+            if match == Match.FULL:
+                return entry, child_scope
+            if match == Match.PARTIAL and partial is None:
+                partial = entry
+
+        if partial is not None:
+            match, child_scope = partial.matches(scope)
+            if match != Match.NONE:
+                return partial, child_scope
+        return None
+
+
+class RadixMatcher:
+    """
+    Replaces a router's linear route loop with a `RouteIndex`.
+
+    The index is compiled on first use (or at startup by the SuperKit
+    lifespan) and again whenever the router's route list changes.
+    Shadowed and ambiguous routes are logged once as warnings.
+    """
+
+    def __init__(self, router):
+        self.router = router
+        self._index: RouteIndex | None = None
+        self._key = None
+        self._lock = threading.Lock()
+        self._reported: set[RouteConflict] = set()
+
+    def _routes_key(self):
+        return len(self.router.routes), getattr(self.router, "_routes_version", None)
+
+    def invalidate(self) -> None:
+        self._index = None
+
+    def compile(self) -> RouteIndex:
+        with self._lock:
+            key = self._routes_key()
+            if self._index is None or self._key != key:
+                index = RouteIndex(self.router.routes)
+                for conflict in index.conflicts:
+                    if conflict not in self._reported:
+                        self._reported.add(conflict)
+                        log.warning(str(conflict)).emit()
+                self._index, self._key = index, key
+            return self._index
+
+    @property
+    def conflicts(self) -> list[RouteConflict]:
+        return self.compile().conflicts
+
+    async def __call__(self, scope, receive, send):
+        router = self.router
+        if scope["type"] not in ("http", "websocket"):
+            await router.app(scope, receive, send)
+            return
+
+        if "router" not in scope:
+            scope["router"] = router
+
+        index = self._index
+        if index is None or self._key != self._routes_key():
+            index = self.compile()
+
+        found = index.resolve(scope)
+        if found is not None:
+            entry, child_scope = found
+            scope.update(child_scope)
+            await entry.handle(scope, receive, send)
+            return
+
+        route_path = _route_path(scope)
+        if scope["type"] == "http" and router.redirect_slashes and route_path != "/":
+            redirect_scope = dict(scope)
+            if route_path.endswith("/"):
+                redirect_scope["path"] = redirect_scope["path"].rstrip("/")
+            else:
+                redirect_scope["path"] = redirect_scope["path"] + "/"
+            if index.resolve(redirect_scope) is not None:
+                await RedirectResponse(url=str(URL(scope=redirect_scope)))(scope, receive, send)
+                return
+
+        # FastAPI's low-priority (frontend) routes: let the router finish
+        if getattr(router, "_low_priority_routes", None) or getattr(router, "_frontend_routes", None):
+            await router.app(scope, receive, send)
+            return
+        await router.default(scope, receive, send)
+
+
+def use_radix(router) -> RadixMatcher:
+    """
+    Make `router` (a Starlette / FastAPI router) match through a
+    `RadixMatcher` and return it.
+    """
+    if router.middleware_stack != router.app:
+        raise ValueError("The radix engine cannot be combined with router-level middleware")
+    matcher = RadixMatcher(router)
+    router.middleware_stack = matcher
+    return matcher
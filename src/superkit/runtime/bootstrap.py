@@ -1,12 +1,22 @@
 import sys
 from pathlib import Path
 
+from superkit.runtime.project import get_project
 
-def ensure_src_on_path():
-    cwd = Path.cwd()
-    src = cwd / "src"
+# Entries this process already put on sys.path
+_on_path: set[str] = set()
+
+
+def add_import_root(path: Path) -> None:
+    entry = str(path)
+    if entry in _on_path:
+        return
+    if entry not in sys.path:
+        sys.path.insert(0, entry)
+    _on_path.add(entry)
 
-    if src.exists() and src.is_dir():
-        src_str = str(src)
-        if src_str not in sys.path:
-            sys.path.insert(0, src_str)
+
+def ensure_src_on_path():
+    project = get_project()
+    if project.layout == "src":
+        add_import_root(project.import_root)
@@ -0,0 +1,277 @@
+import os
+import sys
+import json
+import time
+import py_compile
+import compileall
+from pathlib import Path
+from dataclasses import dataclass, field
+
+from superkit.runtime.registry import runtime
+from superkit.runtime.project import get_project
+from superkit.apps.manifest import AppManifest, dump_entries, parse_entries
+from superkit.lifecycle.isolated import AppDispatcher
+from superkit.logging.api.log import log
+
+BUILD_VERSION = 1
+
+# "0" / "off" boots from sources even when an artifact exists
+BUILD_ENV = "SUPERKIT_BUILD"
+
+_OPENAPI_ATTRS = (
+    "title",
+    "version",
+    "openapi_version",
+    "summary",
+    "description",
+    "terms_of_service",
+    "contact",
+    "license_info",
+    "servers",
+    "openapi_tags",
+    "openapi_external_docs",
+    "separate_input_output_schemas",
+)
+
+
+def build_dir(project_root: Path) -> Path:
+    return project_root / ".superkit" / "build"
+
+
+def _key() -> dict:
+    """
+    What the artifact's bytecode and schema depend on besides sources.
+    """
+    import fastapi
+    import pydantic
+
+    return {
+        "build": BUILD_VERSION,
+        "python": sys.implementation.cache_tag,
+        "fastapi": fastapi.__version__,
+        "pydantic": pydantic.VERSION,
+    }
+
+
+def _sources(src: Path) -> tuple[dict[str, list], dict[str, int]]:
+    """
+    (file -> [mtime_ns, size], directory -> mtime_ns) for every Python
+    file under `src`. Directory mtimes catch added and removed files.
+    """
+    files, dirs = {}, {}
+    for directory, subdirs, names in os.walk(src):
+        subdirs[:] = sorted(d for d in subdirs if d != "__pycache__" and not d.startswith("."))
+        dirs[os.path.relpath(directory, src)] = os.stat(directory).st_mtime_ns
+        for name in sorted(names):
+            if name.endswith(".py"):
+                stat = os.stat(os.path.join(directory, name))
+                files[os.path.relpath(os.path.join(directory, name), src)] = [stat.st_mtime_ns, stat.st_size]
+    return files, dirs
+
+
+def route_table(app) -> list[list]:
+    """
+    [path, methods, name] of every route, in matching order.
+    """
+    import fastapi.routing
+
+    # FastAPI versions that include routers lazily
+    iter_contexts = getattr(fastapi.routing, "iter_route_contexts", None)
+
+    table = []
+    for route in app.routes:
+        if isinstance(route, AppDispatcher):
+            for prefix, sub_app in route.apps.items():
+                table += [[prefix + path, methods, name] for path, methods, name in route_table(sub_app)]
+            continue
+
+        for route in iter_contexts([route]) if iter_contexts is not None else [route]:
+            path = getattr(route, "path", None)
+            if path is None:
+                continue
+            methods = getattr(route, "methods", None)
+            table.append([path, sorted(methods) if methods else [], getattr(route, "name", None)])
+    return table
+
+
+def route_signature(app) -> list[list]:
+    """
+    [route type, path] of the app's own routes. Cheap to compute, unlike
+    `route_table`, which makes FastAPI prepare every included route.
+    """
+    return [[type(route).__name__, getattr(route, "path", None)] for route in app.router.routes]
+
+
+def openapi_meta(app) -> dict:
+    """
+    App attributes that end up in the OpenAPI document, JSON-normalized.
+    """
+    meta = {name: getattr(app, name, None) for name in _OPENAPI_ATTRS}
+    meta["webhooks"] = len(app.webhooks.routes)
+    return json.loads(json.dumps(meta, default=str))
+
+
+@dataclass
+class BuildArtifact:
+    """
+    Output of `superkit build`: the resolved apps, their route table and
+    OpenAPI document, and fingerprints of the sources they came from.
+    """
+
+    path: Path
+    project_root: Path
+    key: dict
+    created: float
+    apps: list[str]
+    apps_path: str
+    search_root: str
+    entries: dict[str, dict]
+    routes: list[list]
+    signature: list[list]
+    openapi_meta: dict
+    files: dict[str, list]
+    dirs: dict[str, int]
+    _schema: dict | None = field(default=None, repr=False)
+    _checked: tuple | None = field(default=None, repr=False)
+
+    def stale(self) -> str | None:
+        """
+        Why the artifact no longer matches the project, or None.
+        """
+        if self.key != _key():
+            return "built with another Python, FastAPI or pydantic version"
+
+        src = self.project_root / "src"
+        for rel, mtime in self.dirs.items():
+            try:
+                if os.stat(src / rel).st_mtime_ns != mtime:
+                    return f"files were added or removed in {Path('src', rel)}"
+            except OSError:
+                return f"{Path('src', rel)} is missing"
+
+        for rel, (mtime, size) in self.files.items():
+            try:
+                stat = os.stat(src / rel)
+            except OSError:
+                return f"{Path('src', rel)} is missing"
+            if stat.st_mtime_ns != mtime or stat.st_size != size:
+                return f"{Path('src', rel)} changed"
+        return None
+
+    def manifest(self) -> AppManifest:
+        return AppManifest(
+            apps_path=self.project_root / self.apps_path,
+            search_root=self.project_root / self.search_root,
+            apps=parse_entries(self.entries),
+        )
+
+    def openapi_for(self, app) -> dict | None:
+        """
+        The prebuilt OpenAPI document if `app` serves what was built:
+        same apps, same metadata and, once every app is loaded, the same
+        routes. Checked again whenever routes are added.
+        """
+        lazy_apps = app.state.lazy_apps
+        pending = bool(lazy_apps is not None and lazy_apps.pending)
+        signature = (len(app.router.routes), pending)
+        if signature == self._checked:
+            return self._schema
+
+        self._checked = signature
+        self._schema = None
+        if (
+            list(app.state.installed_apps or ()) == self.apps
+            and openapi_meta(app) == self.openapi_meta
+            # Pending lazy apps have no routes yet; sources were checked at boot
+            and (pending or route_signature(app) == self.signature)
+        ):
+            self._schema = json.loads((self.path / "openapi.json").read_text())
+        return self._schema
+
+
+def _write_json(path: Path, data) -> None:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data, indent=2) + "\n")
+    os.replace(tmp, path)
+
+
+def write_build(app, project_root: Path) -> BuildArtifact:
+    """
+    Freeze the mounted apps of `app`: OpenAPI document, route table,
+    manifest and bytecode for everything under `src/`.
+    """
+    manifest = runtime.manifest
+    if manifest is None or app.state.installed_apps is None:
+        raise RuntimeError("No apps mounted; call mount_apps() on the instance in main.py")
+
+    # Route table and schema list every app, lazily mounted ones included
+    lazy_apps = app.state.lazy_apps
+    if lazy_apps is not None and lazy_apps.pending:
+        lazy_apps.load_all("openapi")
+    schema = app.openapi()
+    routes = route_table(app)
+
+    src = project_root / "src"
+    compileall.compile_dir(
+        str(src),
+        quiet=1,
+        workers=0,
+        invalidation_mode=py_compile.PycInvalidationMode.TIMESTAMP,
+    )
+    # After compiling: new __pycache__ directories change their parents' mtime
+    files, dirs = _sources(src)
+
+    path = build_dir(project_root)
+    artifact = BuildArtifact(
+        path=path,
+        project_root=project_root,
+        key=_key(),
+        created=time.time(),
+        apps=list(app.state.installed_apps),
+        apps_path=str(manifest.apps_path.relative_to(project_root)),
+        search_root=str(manifest.search_root.relative_to(project_root)),
+        entries=dump_entries(manifest),
+        routes=routes,
+        signature=route_signature(app),
+        openapi_meta=openapi_meta(app),
+        files=files,
+        dirs=dirs,
+    )
+
+    path.mkdir(parents=True, exist_ok=True)
+    _write_json(path / "openapi.json", schema)
+    _write_json(path / "build.json", {
+        name: value for name, value in vars(artifact).items()
+        if name not in ("path", "project_root") and not name.startswith("_")
+    })
+    return artifact
+
+
+def load_build(project_root: Path | None = None) -> BuildArtifact | None:
+    """
+    The project's build artifact, or None when there is none, it is
+    disabled (`SUPERKIT_BUILD=off`) or its sources changed.
+    """
+    if os.environ.get(BUILD_ENV, "").lower() in ("0", "off", "false", "no"):
+        return None
+
+    project_root = project_root or get_project().root
+    path = build_dir(project_root)
+    try:
+        data = json.loads((path / "build.json").read_text())
+    except (OSError, ValueError):
+        return None
+
+    try:
+        artifact = BuildArtifact(path=path, project_root=project_root, **data)
+    except TypeError:
+        artifact = None
+    if artifact is None or artifact.key.get("build") != BUILD_VERSION:
+        log.warning("Build artifact has an old format; run `superkit build` again").emit()
+        return None
+
+    reason = artifact.stale()
+    if reason is not None:
+        log.warning(f"Build artifact is stale ({reason}); booting from sources. Run `superkit build` again").emit()
+        return None
+    return artifact
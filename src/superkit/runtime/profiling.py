@@ -0,0 +1,87 @@
+import time
+from functools import wraps
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Phase:
+    name: str
+    depth: int
+    start_ms: float
+    duration_ms: float = 0.0
+
+
+@dataclass
+class StartupProfile:
+    """
+    Boot phases recorded while a profile is active (see `start_profile`).
+    """
+
+    phases: list[Phase] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+    _depth: int = 0
+
+    def elapsed_ms(self) -> float:
+        return round((time.perf_counter() - self.started) * 1000, 3)
+
+
+# Only set by `superkit profile startup`; phases are free otherwise
+_profile: StartupProfile | None = None
+
+
+def start_profile() -> StartupProfile:
+    global _profile
+    _profile = StartupProfile()
+    return _profile
+
+
+def stop_profile() -> StartupProfile | None:
+    global _profile
+    profile, _profile = _profile, None
+    return profile
+
+
+def profiling() -> bool:
+    return _profile is not None
+
+
+@contextmanager
+def phase(name: str):
+    """
+    Time a block as one boot phase, nested under the enclosing one.
+    """
+    profile = _profile
+    if profile is None:
+        yield
+        return
+
+    entry = Phase(name=name, depth=profile._depth, start_ms=profile.elapsed_ms())
+    profile.phases.append(entry)
+    profile._depth += 1
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        entry.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        profile._depth -= 1
+
+
+def profiled(name: str | None = None):
+    """
+    Decorator form of `phase`, named after the function by default.
+    """
+
+    def decorate(func):
+        label = name or func.__name__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _profile is None:
+                return func(*args, **kwargs)
+            with phase(label):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
@@ -0,0 +1,61 @@
+import os
+from pathlib import Path
+from dataclasses import dataclass
+
+from superkit.runtime.registry import runtime
+
+
+@dataclass(frozen=True)
+class ProjectContext:
+    """
+    Where the project lives, resolved once per process (see
+    `get_project`).
+
+    - `root`: project root (holds `src/` or `apps/`, and `.superkit/`)
+    - `layout`: `"src"` (root/src/apps) or `"flat"` (root/apps)
+    - `apps_path`: the `apps/` package, or None when there is none yet
+    - `import_root`: directory `main` and `apps.*` are imported from
+    """
+
+    root: Path
+    layout: str
+    apps_path: Path | None
+    import_root: Path
+    # Working directory it was resolved from
+    cwd: str
+
+    @property
+    def src(self) -> Path:
+        return self.root / "src"
+
+
+def resolve_project(start: Path) -> ProjectContext:
+    """
+    Walk up from `start` to the first directory with `apps/` or
+    `src/apps/`. Without one, `start` is the root.
+    """
+    for parent in [start, *start.parents]:
+        if (parent / "apps").is_dir():
+            # Started inside src/ of a src-layout project
+            if parent.name == "src":
+                return ProjectContext(parent.parent, "src", parent / "apps", parent, str(start))
+            return ProjectContext(parent, "flat", parent / "apps", parent, str(start))
+        if (parent / "src" / "apps").is_dir():
+            return ProjectContext(parent, "src", parent / "src" / "apps", parent / "src", str(start))
+
+    if (start / "src").is_dir():
+        return ProjectContext(start, "src", None, start / "src", str(start))
+    return ProjectContext(start, "flat", None, start, str(start))
+
+
+def get_project(*, refresh: bool = False) -> ProjectContext:
+    """
+    The current project, memoized on `runtime` and resolved again only
+    when the working directory changed or `refresh=True`.
+    """
+    cwd = os.getcwd()
+    project = runtime.project
+    if project is None or project.cwd != cwd or refresh:
+        project = resolve_project(Path(cwd))
+        runtime.set_project(project)
+    return project
@@ -5,7 +5,9 @@ class RuntimeRegistry:
     """
     Framework-owned runtime registry.
 
-    Stores resolved configuration for the current process.
+    Stores resolved configuration for the current process, the project
+    context (see `superkit.runtime.project`) and the app manifest once
+    discovery has run (see `superkit.apps.manifest`).
     """
 
     def __init__(self):
@@ -13,6 +15,8 @@ class RuntimeRegistry:
         self._initialized = False
         self._settings: Optional[Dict[str, Any]] = None
         self._server: Optional[Dict[str, Any]] = None
+        self._manifest = None
+        self._project = None
 
     def initialize(
         self,
@@ -43,5 +47,27 @@ class RuntimeRegistry:
             raise RuntimeError("Runtime not initialized")
         return self._server
 
+    @property
+    def project(self):
+        """
+        Resolved `ProjectContext` (None until first resolved).
+        """
+        return self._project
+
+    def set_project(self, project) -> None:
+        with self._lock:
+            self._project = project
+
+    @property
+    def manifest(self):
+        """
+        Discovered apps for this process (None until discovery runs).
+        """
+        return self._manifest
+
+    def set_manifest(self, manifest) -> None:
+        with self._lock:
+            self._manifest = manifest
+
 runtime = RuntimeRegistry()
 
@@ -36,6 +36,8 @@ class ProjectSettings(BaseSettings):
     host: str = "127.0.0.1"
     port: int = 8000
     reload: bool = True
+    # Worker processes; >1 disables reload and aggregates their logs
+    workers: int = 1
 
     # ─────────────────────────────────────────────
     # Docs URLs
@@ -44,6 +46,58 @@ class ProjectSettings(BaseSettings):
     redoc_url: str | None = "/redoc"
     openapi_url: str | None = "/openapi.json"
 
+    # ─────────────────────────────────────────────
+    # Logging
+    # ─────────────────────────────────────────────
+    # "panel" (Rich panels), "jsonl" (one JSON object per line)
+    # or "auto" (jsonl when stdout is not a TTY)
+    log_format: str = "auto"
+    # Minimum level for log.debug/info/warning/critical
+    log_level: str = "INFO"
+    # Collapse repeats of the same error: only the first
+    # `log_error_burst` per `log_error_window` seconds render in full
+    log_error_window: float = 60.0
+    log_error_burst: int = 1
+    # Extra uvicorn messages to hide (case-insensitive substrings)
+    log_noise_phrases: list[str] = Field(default_factory=list)
+    # HTTP access logs; sample by status, e.g. {"5xx": 1.0, "2xx": 0.01}
+    log_access: bool = True
+    log_access_sample_rate: float = 1.0
+    log_access_status_rates: dict = Field(default_factory=dict)
+    # Group a request's log entries under its access record;
+    # "tail" keeps them only for failed or slow requests
+    log_request_buffer: bool = True
+    log_request_keep: str = "all"
+    log_slow_request_ms: float = 1000.0
+    # add_table: rows kept (head + tail) and panel cell width limit
+    log_table_max_rows: int = 20
+    log_table_max_cell: int = 80
+    # add_json size limits (bytes, nesting depth, items per container)
+    log_json_max_bytes: int = 65_536
+    log_json_max_depth: int = 10
+    log_json_max_items: int = 1000
+    # JSON lines log file (e.g. "logs/superkit.log"), rotated by size
+    # and age; rotated segments are gzipped in the background
+    log_file: str | None = None
+    log_file_only: bool = False
+    log_file_max_bytes: int = 50 * 1024 * 1024
+    log_file_rotate_interval: float = 86_400.0
+    log_file_backups: int = 7
+    log_file_fsync_interval: float = 1.0
+    log_file_compress: bool = True
+    # Recent records kept in memory, and an optional internal route
+    # serving them (e.g. "/_superkit/logs"); exposes log contents
+    log_ring_size: int = 1000
+    log_endpoint: str | None = None
+    # Render and write logs on a background writer thread
+    log_async_writer: bool = True
+    # Bounded writer queue and what to do when it is full:
+    # "drop_oldest" | "drop_new" | "block"
+    log_queue_size: int = 10_000
+    log_overflow: str = "drop_oldest"
+    # Seconds to wait for queued logs on shutdown
+    log_flush_timeout: float = 5.0
+
     class Config:
         env_prefix = ""
         env_file = ".env"
@@ -1,21 +1,22 @@
-import sys
 import importlib
-from pathlib import Path
 import typer
 
 from superkit.runtime.registry import runtime
+from superkit.runtime.project import get_project
+from superkit.runtime.bootstrap import add_import_root
+from superkit.runtime.profiling import phase, profiled
 
+@profiled()
 def bootstrap_loader() -> None:
     """
     Prepare the SuperKit runtime by:
-    - treating CWD as project root
+    - resolving the project root (see `get_project`)
     - using src/ as import root
     - importing src/main.py
     - validating runtime initialization
     """
 
-    project_root = Path.cwd()
-    src_dir = project_root / "src"
+    src_dir = get_project().src
     main_file = src_dir / "main.py"
 
     # ─────────────────────────────────────────────
@@ -40,14 +41,14 @@ def bootstrap_loader() -> None:
     # ─────────────────────────────────────────────
     # Ensure src/ is importable
     # ─────────────────────────────────────────────
-    if str(src_dir) not in sys.path:
-        sys.path.insert(0, str(src_dir))
+    add_import_root(src_dir)
 
     # ─────────────────────────────────────────────
     # Import main.py to initialize runtime
     # ─────────────────────────────────────────────
     try:
-        importlib.import_module("main")
+        with phase("import main"):
+            importlib.import_module("main")
     except Exception as e:
         typer.secho(
             f"Error importing src/main.py: {e}",
@@ -3,9 +3,12 @@ import typer
 # Commands Import
 from superkit_cli.commands.run.run import run
 from superkit_cli.commands.init.init import init
+from superkit_cli.commands.build.build import build
 
 # Subgroups Import
 from superkit_cli.commands.apps.apps import apps_app
+from superkit_cli.commands.logs.logs import logs_app
+from superkit_cli.commands.profile.profile import profile_app
 
 # Typer Instance
 app = typer.Typer(
@@ -15,6 +18,7 @@ app = typer.Typer(
 # Registering Commands
 app.command('init', help="Initializes SuperKit CLI")(init)
 app.command('run', help="Runs SuperKit Application")(run)
+app.command('build', help="Freezes apps, routes and OpenAPI for production boots")(build)
 
 # Subgroups
 app.add_typer(
@@ -22,6 +26,16 @@ app.add_typer(
     name="apps",
     help="Manages SuperKit Apps",
 )
+app.add_typer(
+    logs_app,
+    name="logs",
+    help="Reads SuperKit log files",
+)
+app.add_typer(
+    profile_app,
+    name="profile",
+    help="Profiles SuperKit applications",
+)
 
 from superkit.logging import setup_logging
 
@@ -1,34 +1,33 @@
-import sys
+import typer
 from pathlib import Path
-from superkit.apps.config import AppConfig
-from superkit.apps.discovery import discover_apps, get_apps_context
-from superkit_cli.utils.project import find_project_root
-
-
-def doctor_apps():
+from types import SimpleNamespace
+from superkit.apps.manifest import load_manifest, load_app_config
+from superkit.runtime.project import get_project
+
+
+def doctor_apps(
+    static: bool = typer.Option(
+        False,
+        "--static",
+        help="Only read app.py files (no imports, no router checks)",
+    ),
+):
     print()
     # Project context and root
-    apps_path, search_root = get_apps_context()
+    project = get_project()
+    apps_path, search_root = project.apps_path, project.import_root
 
-    if not apps_path or not search_root:
+    if apps_path is None:
         print(f"  \033[91m✖\033[0m  Not inside a SuperKit project")
         print(f"     \033[90mApps directory not found\033[0m")
         print(f"     \033[90mHint: Ensure you have an 'apps/' directory in your project root or 'src/'\033[0m\n")
         return 1
 
-    # Find project root (one level up from apps or src)
-    if apps_path.parent.name == "src":
-        project_root = apps_path.parent.parent
-        layout = "src-layout"
-    else:
-        project_root = apps_path.parent
-        layout = "flat-layout"
+    print(f"  \033[92m✔\033[0m  Project     \033[94m{project.root.name}\033[0m")
+    print(f"  \033[92m✔\033[0m  Layout      \033[90m{project.layout}-layout\033[0m")
 
-    print(f"  \033[92m✔\033[0m  Project     \033[94m{project_root.name}\033[0m")
-    print(f"  \033[92m✔\033[0m  Layout      \033[90m{layout}\033[0m")
-
-    # Apps discovery
-    apps = discover_apps()
+    # Apps discovery (manifest; app.py files are parsed, not imported)
+    manifest = load_manifest(apps_path, search_root)
     app_folders = sorted([d for d in apps_path.iterdir() if d.is_dir() and not d.name.startswith((".", "__"))])
 
     if not app_folders:
@@ -75,25 +74,37 @@ def doctor_apps():
             continue
 
         # 3.3 Import & AppConfig validation
+        entry = manifest.apps[app_name]
         try:
-            module = __import__(f"apps.{app_name}.app", fromlist=["*"])
-            configs = [
-                obj for obj in module.__dict__.values()
-                if isinstance(obj, type) and issubclass(obj, AppConfig) and obj is not AppConfig
-            ]
-
-            if not configs:
-                app_issues.append("no AppConfig class found")
+            if not entry.valid:
+                app_issues.append(entry.error)
                 is_critical = True
             else:
-                app_config = configs[0]()
+                for diagnostic in entry.diagnostics:
+                    if diagnostic.severity == "warning":
+                        app_issues.append(str(diagnostic))
+                        warnings += 1
+
+                if static:
+                    # Literal values from the manifest; non-literal ones are skipped
+                    app_config = SimpleNamespace(
+                        name=entry.config_name,
+                        url_prefix=entry.url_prefix,
+                        tags=entry.tags if entry.tags is not None else [],
+                    )
+                    unchecked = set(entry.dynamic)
+                else:
+                    app_config = load_app_config(entry)()
+                    unchecked = set()
 
                 # AppConfig attributes
-                if app_config.name != app_name:
+                if "name" not in unchecked and app_config.name != app_name:
                     app_issues.append(f"name mismatch (config: '{app_config.name}', folder: '{app_name}')")
                     warnings += 1
 
-                if not app_config.url_prefix:
+                if "url_prefix" in unchecked:
+                    pass
+                elif not app_config.url_prefix:
                     app_issues.append("missing url_prefix")
                     is_critical = True
                 elif not app_config.url_prefix.startswith("/"):
@@ -105,20 +116,25 @@ def doctor_apps():
                     else:
                         url_prefixes[app_config.url_prefix] = [app_name]
 
-                if not isinstance(app_config.tags, list):
+                if "tags" not in unchecked and not isinstance(app_config.tags, list):
                     app_issues.append("tags should be a list")
                     warnings += 1
 
                 # Router check
-                try:
-                    router = app_config.build_router()
-                    routes = [r for r in router.routes if hasattr(r, 'methods') and r.methods]
-                    if not routes:
-                        app_issues.append("no routes registered")
+                if static:
+                    if entry.routers == []:
+                        app_issues.append("no routers listed")
                         warnings += 1
-                except Exception as e:
-                    app_issues.append(f"router build failed ({type(e).__name__})")
-                    is_critical = True
+                else:
+                    try:
+                        router = app_config.build_router()
+                        routes = [r for r in router.routes if hasattr(r, 'methods') and r.methods]
+                        if not routes:
+                            app_issues.append("no routes registered")
+                            warnings += 1
+                    except Exception as e:
+                        app_issues.append(f"router build failed ({type(e).__name__})")
+                        is_critical = True
 
         except Exception as e:
             app_issues.append(f"import failed ({type(e).__name__}: {str(e)[:50]})")
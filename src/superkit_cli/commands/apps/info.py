@@ -1,15 +1,13 @@
 from pathlib import Path
-from superkit.apps.config import AppConfig
-from superkit_cli.utils.project import find_project_root
+from superkit.apps.manifest import load_manifest, load_app_config
+from superkit.runtime.project import get_project
 
 
 def info_app(app_name: str):
-    from superkit.apps.discovery import get_apps_context
-    import sys
+    project = get_project()
+    apps_path, search_root = project.apps_path, project.import_root
 
-    apps_path, search_root = get_apps_context()
-
-    if not apps_path or not search_root:
+    if apps_path is None:
         print(f"\n\033[91mError: Not inside a SuperKit project (apps/ folder not found)\033[0m\n")
         return
 
@@ -18,28 +16,23 @@ def info_app(app_name: str):
         print(f"\n\033[91mError: App '{app_name}' not found\033[0m\n")
         return
 
-    # Ensure search_root is in sys.path
-    search_root_str = str(search_root)
-    if search_root_str not in sys.path:
-        sys.path.insert(0, search_root_str)
+    # ---- load AppConfig (via the app manifest) ----
+    entry = load_manifest(apps_path, search_root).apps.get(app_name)
 
-    # ---- load AppConfig ----
-    try:
-        module = __import__(f"apps.{app_name}.app", fromlist=["*"])
-    except Exception as e:
-        print(f"\n\033[91mError: Failed to import app '{app_name}': {e}\033[0m\n")
+    if entry is None:
+        print(f"\n\033[91mError: apps/{app_name} is missing __init__.py or app.py\033[0m\n")
         return
 
-    app_config = None
-    for obj in module.__dict__.values():
-        if isinstance(obj, type) and issubclass(obj, AppConfig) and obj is not AppConfig:
-            app_config = obj()
-            break
+    if entry.error and entry.error.startswith("import failed"):
+        print(f"\n\033[91mError: Failed to import app '{app_name}': {entry.error}\033[0m\n")
+        return
 
-    if app_config is None:
-        print(f"\n\033[91mError: No AppConfig found in apps.{app_name}.app\033[0m\n")
+    if not entry.valid:
+        print(f"\n\033[91mError: No AppConfig found in {entry.module}\033[0m\n")
         return
 
+    app_config = load_app_config(entry)()
+
     # ---- AppConfig summary ----
     relative_path = f"apps/{app_name}"
 
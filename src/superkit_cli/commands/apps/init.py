@@ -3,6 +3,7 @@ import re
 from pathlib import Path
 from importlib.resources import files
 
+from superkit.runtime.project import get_project
 from superkit_cli.scaffold.renderer import render_template_dir
 
 apps_init = typer.Typer()
@@ -22,7 +23,7 @@ def init_app(app_name: str):
         raise typer.Exit(1)
 
     # ---- locate project root (src/) ----
-    project_root = Path.cwd()
+    project_root = get_project().root
     src_dir = project_root / "src"
     apps_dir = src_dir / "apps"
 
@@ -1,4 +1,5 @@
 from superkit.apps.discovery import discover_apps
+from superkit.runtime.registry import runtime
 from superkit_cli.utils.project import find_project_root
 
 def list_apps():
@@ -10,11 +11,19 @@ def list_apps():
 
     apps = sorted(discover_apps())
 
-    if not apps:
+    # Everything comes from the manifest; no app module is imported
+    manifest = runtime.manifest
+    broken = sorted(n for n, e in manifest.apps.items() if not e.valid) if manifest else []
+
+    if not apps and not broken:
         print("\n\033[93mNo apps found\033[0m\n")
         return
 
+    width = max(len(app) for app in [*apps, *broken])
+
     print("\n\033[1m\033[96mApps:\033[0m\n")
     for app in apps:
-        print(f"  \033[1m\033[92m→\033[0m  {app}")
+        print(f"  \033[1m\033[92m→\033[0m  {app:<{width}}  \033[90m{manifest.apps[app].url_prefix or ''}\033[0m")
+    for app in broken:
+        print(f"  \033[91m✖\033[0m  {app:<{width}}  \033[91m{manifest.apps[app].error}\033[0m")
     print()
\ No newline at end of file
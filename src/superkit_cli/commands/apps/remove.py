@@ -2,17 +2,17 @@ import shutil
 import typer
 from pathlib import Path
 
-from superkit_cli.utils.project import find_project_root
+from superkit_cli.utils.project import find_project
 
 
 def remove_app(app_name: str):
     try:
-        project_root = find_project_root()
+        project = find_project()
     except RuntimeError as e:
         print(f"\n\033[91mError: {e}\033[0m\n")
         return
 
-    app_dir = project_root / "src" / "apps" / app_name
+    app_dir = project.apps_path / app_name
 
     if not app_dir.exists():
         print(f"\n\033[91mError: App '{app_name}' does not exist\033[0m\n")
@@ -0,0 +1,8 @@
+import typer
+
+from superkit_cli.commands.logs.tail import tail_logs
+
+logs_app = typer.Typer()
+
+# Commands
+logs_app.command('tail', help="Shows and follows SuperKit JSON lines logs")(tail_logs)
@@ -0,0 +1,199 @@
+import os
+import json
+import time
+from pathlib import Path
+from urllib.error import URLError
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+import typer
+
+LEVELS = {"DEBUG": 10, "INFO": 20, "WARNING": 30, "ERROR": 40, "CRITICAL": 50}
+
+LEVEL_COLORS = {
+    "DEBUG": "\033[90m",
+    "INFO": "\033[96m",
+    "WARNING": "\033[93m",
+    "ERROR": "\033[91m",
+    "CRITICAL": "\033[1m\033[91m",
+}
+
+# Bytes read per step when scanning a file backwards for the last lines
+_CHUNK = 64 * 1024
+
+
+def read_last_lines(path: Path, count: int) -> list[str]:
+    """
+    Last `count` lines of `path`, reading backwards from the end.
+    """
+    if count <= 0:
+        return []
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b""
+        while position > 0 and data.count(b"\n") <= count:
+            step = min(_CHUNK, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-count:]
+
+
+def matches(entry: dict, min_level: int, kind: str | None, grep: str | None, line: str) -> bool:
+    if LEVELS.get(entry.get("level"), 0) < min_level:
+        return False
+    if kind and entry.get("kind") != kind:
+        return False
+    if grep and grep not in line:
+        return False
+    return True
+
+
+def format_entry(entry: dict) -> str:
+    level = entry.get("level") or ""
+    color = LEVEL_COLORS.get(level, "")
+    ts = (entry.get("ts") or "")[11:23]
+    title = entry.get("title") or ""
+    message = entry.get("message") or ""
+
+    if entry.get("kind") == "http":
+        meta = entry.get("meta") or {}
+        title = f"{meta.get('status', '')} {title}"
+        if meta.get("duration_ms") is not None:
+            message = f"{meta['duration_ms']} ms"
+
+    text = f"\033[90m{ts}\033[0m " if ts else ""
+    text += f"{color}{level:<8}\033[0m"
+    if title and title != level:
+        text += f" \033[1m{title}\033[0m"
+    if message:
+        text += f" {message}"
+    for child in entry.get("entries") or ():
+        text += f"\n    {format_entry(child)}"
+    return text
+
+
+def print_lines(lines, min_level: int, kind: str | None, grep: str | None, raw: bool) -> None:
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+        except ValueError:
+            continue
+        if not matches(entry, min_level, kind, grep, line):
+            continue
+        print(line if raw else format_entry(entry), flush=True)
+
+
+def follow(path: Path, min_level: int, kind: str | None, grep: str | None, raw: bool, interval: float = 0.5):
+    """
+    Print lines appended to `path`, reopening it after rotation.
+    """
+    f = open(path, "r", encoding="utf-8", errors="replace")
+    f.seek(0, os.SEEK_END)
+    inode = os.fstat(f.fileno()).st_ino
+    pending = ""
+
+    try:
+        while True:
+            chunk = f.read()
+            if chunk:
+                pending += chunk
+                *lines, pending = pending.split("\n")
+                print_lines(lines, min_level, kind, grep, raw)
+                continue
+
+            time.sleep(interval)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            if stat.st_ino != inode or stat.st_size < f.tell():
+                # Rotated: finish with the new file from its start
+                f.close()
+                f = open(path, "r", encoding="utf-8", errors="replace")
+                inode = os.fstat(f.fileno()).st_ino
+                pending = ""
+    except KeyboardInterrupt:
+        pass
+    finally:
+        f.close()
+
+
+def fetch_remote(url: str, since: int, limit: int, level: str, kind: str | None) -> tuple[int, list[dict]]:
+    """
+    One page from a SuperKit logs endpoint. Returns (cursor, records).
+    """
+    params = {"since": since, "limit": limit, "level": level}
+    if kind:
+        params["kind"] = kind
+    with urlopen(f"{url}?{urlencode(params)}", timeout=10) as response:
+        body = json.load(response)
+    return body["cursor"], body["records"]
+
+
+def tail_remote(url: str, lines: int, follow_url: bool, level: str, kind: str | None, grep: str | None, raw: bool, interval: float = 1.0):
+    """
+    Print recent records from a running app's logs endpoint, then poll
+    it with the returned cursor when following.
+    """
+    try:
+        cursor, records = fetch_remote(url, 0, lines, level, kind)
+        while True:
+            for entry in records:
+                line = json.dumps(entry)
+                if grep and grep not in line:
+                    continue
+                print(line if raw else format_entry(entry), flush=True)
+
+            if not follow_url:
+                return
+            time.sleep(interval)
+            cursor, records = fetch_remote(url, cursor, 1000, level, kind)
+    except URLError as e:
+        print(f"\033[91mError: Could not reach {url}: {e.reason}\033[0m")
+        raise typer.Exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+def tail_logs(
+        path: Path = typer.Argument(
+            Path("logs/superkit.log"),
+            help="Log file written by the SuperKit file sink (log_file)",
+        ),
+        lines: int = typer.Option(20, "--lines", "-n", help="Number of past lines to show"),
+        follow_file: bool = typer.Option(False, "--follow", "-f", help="Keep printing new lines"),
+        level: str = typer.Option("DEBUG", "--level", "-l", help="Minimum level"),
+        kind: str | None = typer.Option(None, "--kind", "-k", help="Only records of this kind (user, http, error, ...)"),
+        grep: str | None = typer.Option(None, "--grep", "-g", help="Only lines containing this text"),
+        raw: bool = typer.Option(False, "--json", help="Print the raw JSON lines"),
+        url: str | None = typer.Option(
+            None,
+            "--url",
+            help="Read a running app's logs endpoint instead (e.g. http://127.0.0.1:8000/_superkit/logs)",
+        ),
+):
+    min_level = LEVELS.get(level.upper())
+    if min_level is None:
+        print(f"\033[91mError: Unknown level '{level}'\033[0m")
+        raise typer.Exit(1)
+
+    if url:
+        tail_remote(url, lines, follow_file, level.upper(), kind, grep, raw)
+        return
+
+    if not path.exists():
+        print(f"\033[91mError: Log file '{path}' not found\033[0m")
+        raise typer.Exit(1)
+
+    print_lines(read_last_lines(path, lines), min_level, kind, grep, raw)
+
+    if follow_file:
+        follow(path, min_level, kind, grep, raw)
@@ -0,0 +1,198 @@
+"""
+Boot side of `superkit profile startup`.
+
+Runs in a fresh `python -X importtime` interpreter started by
+`collect_startup_profile`, boots the project like `superkit run` does
+and writes phases, module categories and side effects as JSON.
+"""
+
+import os
+import sys
+import json
+import time
+import sysconfig
+import threading
+from pathlib import Path
+from dataclasses import asdict
+
+STARTED = time.time()
+
+import superkit
+from superkit.runtime.profiling import phase, start_profile, stop_profile
+from superkit.runtime.project import get_project
+
+_STDLIB = (
+    os.path.realpath(sysconfig.get_paths()["stdlib"]) + os.sep,
+    os.path.realpath(sysconfig.get_paths()["platstdlib"]) + os.sep,
+)
+_FRAMEWORK = (
+    os.path.realpath(Path(__file__).parents[2]) + os.sep,
+    os.path.realpath(Path(superkit.__file__).parent) + os.sep,
+)
+
+
+def _is_stdlib(filename: str) -> bool:
+    if filename.startswith("<"):
+        # <frozen importlib._bootstrap>, <string>, ...
+        return True
+    path = os.path.realpath(filename)
+    return path.startswith(_STDLIB) and "site-packages" not in path
+
+
+def _origin(frame) -> tuple[str, str] | None:
+    """
+    (module being imported, "file:line" of the code responsible) for an
+    event raised at `frame`, or None when the framework caused it or no
+    module-level code is running.
+    """
+    location = None
+    while frame is not None:
+        code = frame.f_code
+        filename = code.co_filename
+        if not _is_stdlib(filename):
+            if os.path.realpath(filename).startswith(_FRAMEWORK):
+                return None
+            if location is None:
+                location = f"{os.path.relpath(filename)}:{frame.f_lineno}"
+        if code.co_name == "<module>":
+            module = frame.f_globals.get("__name__")
+            if location is None or module in (None, "__main__"):
+                return None
+            return module, location
+        frame = frame.f_back
+    return None
+
+
+class _Output:
+    """
+    Stream wrapper that reports writes made by module-level code.
+    """
+
+    def __init__(self, stream, effects: "SideEffects"):
+        self._stream = stream
+        self._effects = effects
+
+    def write(self, data):
+        text = data.decode(errors="replace") if isinstance(data, bytes) else data
+        self._effects.printed.append(text)
+        if text.strip():
+            self._effects.record("output", f"wrote {text.strip()[:60]!r}", sys._getframe(1))
+        return self._stream.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class SideEffects:
+    """
+    Output, threads, sockets, subprocesses and file writes that happen
+    while a module is being imported (audit hooks plus two wrappers).
+    """
+
+    def __init__(self):
+        self.found: list[dict] = []
+        # Everything written to stdout, for error messages
+        self.printed: list[str] = []
+        self._busy = False
+
+    def install(self) -> None:
+        sys.addaudithook(self._audit)
+
+        start = threading.Thread.start
+        effects = self
+
+        def start_thread(thread, *args, **kwargs):
+            effects.record("thread", f"started thread '{thread.name}'", sys._getframe(1))
+            return start(thread, *args, **kwargs)
+
+        threading.Thread.start = start_thread
+        sys.stdout = _Output(sys.stdout, self)
+
+    def record(self, kind: str, detail: str, frame) -> None:
+        if self._busy:
+            return
+        self._busy = True
+        try:
+            origin = _origin(frame)
+        finally:
+            self._busy = False
+        if origin is not None:
+            module, location = origin
+            self.found.append({"module": module, "kind": kind, "detail": detail, "location": location})
+
+    def _audit(self, event: str, args: tuple) -> None:
+        if self._busy:
+            return
+
+        if event == "socket.connect":
+            kind, detail = "network", f"connect to {args[1]}"
+        elif event == "socket.getaddrinfo":
+            kind, detail = "network", f"resolve {args[0]}:{args[1]}"
+        elif event in ("subprocess.Popen", "os.system", "os.posix_spawn"):
+            kind, detail = "subprocess", f"run {str(args[0])[:60]}"
+        elif event == "open":
+            path, mode, flags = args
+            if not isinstance(path, (str, bytes, os.PathLike)) or str(path).endswith(".pyc"):
+                return
+            writing = any(c in mode for c in "wax+") if mode else bool(flags & (os.O_WRONLY | os.O_RDWR))
+            if not writing:
+                return
+            kind, detail = "file", f"open {os.fsdecode(path)} for writing"
+        else:
+            return
+
+        self.record(kind, detail, sys._getframe(1))
+
+
+def _category(name: str, module, src: str) -> str:
+    top = name.partition(".")[0]
+    if top in sys.stdlib_module_names or top in sys.builtin_module_names or top.startswith("_sysconfigdata"):
+        return "stdlib"
+    if top in ("superkit", "superkit_cli"):
+        return "superkit"
+    # Namespace packages only have __path__
+    paths = [getattr(module, "__file__", None), *getattr(module, "__path__", ())]
+    if any(path and os.path.realpath(path).startswith(src) for path in paths):
+        return "project"
+    return "third-party"
+
+
+def main() -> None:
+    instance, output = sys.argv[1], Path(sys.argv[2])
+
+    effects = SideEffects()
+    effects.install()
+    profile = start_profile()
+    result = {"started": STARTED, "error": None, "apps": [], "lazy_apps": []}
+
+    try:
+        with phase("cli imports"):
+            from superkit_cli.bootstrap_loader import bootstrap_loader
+        bootstrap_loader()
+    except (Exception, SystemExit) as e:
+        # bootstrap_loader printed the reason; keep it for the report
+        printed = "".join(effects.printed).strip()
+        result["error"] = printed or f"{type(e).__name__}: {e}"
+
+    profile = stop_profile()
+    result["total_ms"] = profile.elapsed_ms()
+    result["phases"] = [asdict(p) for p in profile.phases]
+    result["side_effects"] = effects.found
+
+    main_module = sys.modules.get("main")
+    app = getattr(main_module, instance, None) if instance else None
+    if instance and main_module is not None and app is None and result["error"] is None:
+        result["error"] = f"App instance '{instance}' not found in main.py"
+    if app is not None:
+        state = app.state
+        result["apps"] = list(getattr(state, "installed_apps", None) or [])
+        lazy_apps = getattr(state, "lazy_apps", None)
+        result["lazy_apps"] = lazy_apps.pending if lazy_apps is not None else []
+
+    src = os.path.realpath(get_project().src) + os.sep
+    result["categories"] = {
+        name: _category(name, module, src)
+        for name, module in list(sys.modules.items())
+    }
+
+    output.write_text(json.dumps(result))
@@ -0,0 +1,8 @@
+import typer
+
+from superkit_cli.commands.profile.startup import profile_startup
+
+profile_app = typer.Typer()
+
+# Commands
+profile_app.command('startup', help="Profiles application startup: phases, imports and side effects")(profile_startup)
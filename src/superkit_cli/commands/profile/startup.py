@@ -0,0 +1,209 @@
+import os
+import sys
+import json
+import time
+import tempfile
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass, field
+
+import typer
+from rich.console import Console
+from rich.markup import escape
+
+from superkit.logging.aggregate import AGGREGATOR_ENV
+from superkit.runtime.project import get_project
+from superkit_cli.ui.runtime.startup_report import startup_report
+
+_CHILD = "from superkit_cli.commands.profile.child import main; main()"
+_IMPORTTIME = "import time:"
+
+
+class StartupProfileError(Exception):
+    """
+    The profiled boot failed; the message is what it printed.
+    """
+
+
+@dataclass
+class ImportNode:
+    module: str
+    self_ms: float
+    cumulative_ms: float
+    depth: int
+    children: list["ImportNode"] = field(default_factory=list)
+    parent: "ImportNode | None" = None
+
+
+def parse_importtime(text: str) -> list[ImportNode]:
+    """
+    Root nodes of the import tree in `-X importtime` output.
+
+    Lines come after a module finished importing, children first and
+    indented by two spaces per level.
+    """
+    pending: dict[int, list[ImportNode]] = {}
+    for line in text.splitlines():
+        if not line.startswith(_IMPORTTIME):
+            continue
+        try:
+            self_us, cumulative_us, name = line[len(_IMPORTTIME):].split("|", 2)
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            # Header line
+            continue
+
+        name = name[1:]
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        node = ImportNode(name.strip(), self_us / 1000, cumulative_us / 1000, depth)
+        node.children = pending.pop(depth + 1, [])
+        for child in node.children:
+            child.parent = node
+        pending.setdefault(depth, []).append(node)
+    return pending.get(0, [])
+
+
+def _walk(nodes: list[ImportNode]):
+    for node in nodes:
+        yield node
+        yield from _walk(node.children)
+
+
+def build_report(data: dict, roots: list[ImportNode], interpreter_ms: float, top: int, threshold: float) -> dict:
+    categories = data["categories"]
+
+    def category(module: str) -> str:
+        if module in categories:
+            return categories[module]
+        top_level = module.partition(".")[0]
+        if top_level in sys.stdlib_module_names:
+            return "stdlib"
+        # Not in sys.modules after boot: the import failed (optional dependency probes)
+        return "missing"
+
+    nodes = list(_walk(roots))
+    modules = sorted(
+        (
+            {
+                "module": node.module,
+                "category": category(node.module),
+                "self_ms": round(node.self_ms, 3),
+                "cumulative_ms": round(node.cumulative_ms, 3),
+                "imported_by": node.parent.module if node.parent else None,
+            }
+            for node in nodes
+        ),
+        key=lambda m: m["self_ms"],
+        reverse=True,
+    )
+
+    # Where each third-party package is first entered from other code
+    packages: dict[str, dict] = {}
+    subtrees: dict[str, list[ImportNode]] = {}
+    for node in nodes:
+        if category(node.module) != "third-party":
+            continue
+        if node.parent is not None and category(node.parent.module) == "third-party":
+            continue
+        name = node.module.partition(".")[0]
+        package = packages.setdefault(name, {
+            "package": name, "cumulative_ms": 0.0, "modules": 0, "imported_by": [],
+        })
+        package["cumulative_ms"] = round(package["cumulative_ms"] + node.cumulative_ms, 3)
+        package["imported_by"].append(node.parent.module if node.parent else "(interpreter)")
+        subtrees.setdefault(name, []).extend(_walk([node]))
+
+    for name, subtree in subtrees.items():
+        # Own modules only; cumulative time includes stdlib modules they pulled in
+        subtree = [n for n in subtree if n.module.partition(".")[0] == name]
+        packages[name]["modules"] = len(subtree)
+        packages[name]["heaviest"] = [
+            [n.module, round(n.self_ms, 3)]
+            for n in sorted(subtree, key=lambda n: n.self_ms, reverse=True)[:3]
+        ]
+
+    phases = [{"name": "interpreter startup", "depth": 0, "start_ms": 0.0, "duration_ms": round(interpreter_ms, 3)}]
+    phases += [{**p, "start_ms": round(p["start_ms"] + interpreter_ms, 3)} for p in data["phases"]]
+
+    offenders = [m for m in modules if m["category"] not in ("stdlib", "missing")][:top]
+    for entry in offenders:
+        entry["flagged"] = entry["self_ms"] >= threshold
+
+    return {
+        "total_ms": round(interpreter_ms + data["total_ms"], 3),
+        "interpreter_ms": round(interpreter_ms, 3),
+        "threshold_ms": threshold,
+        "phases": phases,
+        "apps": data["apps"],
+        "lazy_apps": data["lazy_apps"],
+        "offenders": offenders,
+        "third_party": sorted(packages.values(), key=lambda p: p["cumulative_ms"], reverse=True),
+        "side_effects": data["side_effects"],
+        "modules": modules,
+    }
+
+
+def collect_startup_profile(instance: str | None, *, top: int = 15, threshold: float = 20.0) -> dict:
+    """
+    Boot the project in a fresh interpreter with `-X importtime` and
+    return the startup report.
+    """
+    env = dict(os.environ)
+    env.pop(AGGREGATOR_ENV, None)
+
+    with tempfile.TemporaryDirectory(prefix="superkit-profile-") as directory:
+        output = Path(directory) / "profile.json"
+        spawned = time.time()
+        process = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _CHILD, instance or "", str(output)],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if not output.exists():
+            errors = [line for line in process.stderr.splitlines() if not line.startswith(_IMPORTTIME)]
+            raise StartupProfileError("\n".join(errors[-15:]) or f"profiler exited with {process.returncode}")
+        data = json.loads(output.read_text())
+
+    if data["error"]:
+        raise StartupProfileError(data["error"])
+
+    roots = parse_importtime(process.stderr)
+    return build_report(data, roots, (data["started"] - spawned) * 1000, top, threshold)
+
+
+def profile_startup(
+        instance: str | None = typer.Argument(
+            None,
+            help="App instance name defined in main.py (e.g. dev, prod)",
+        ),
+        output: Path | None = typer.Option(
+            None,
+            "--json",
+            help="Also write the full report (every module) to this file",
+        ),
+        top: int = typer.Option(15, "--top", "-n", help="Rows per table"),
+        threshold: float = typer.Option(
+            20.0,
+            "--threshold",
+            help="Flag modules whose own import time is at least this many ms",
+        ),
+):
+    console = Console()
+
+    if not (get_project().src / "main.py").exists():
+        console.print("[red]Error: src/main.py not found[/red]")
+        raise typer.Exit(1)
+
+    try:
+        report = collect_startup_profile(instance, top=top, threshold=threshold)
+    except StartupProfileError as e:
+        console.print(f"[red]Startup failed while profiling:[/red]\n{escape(str(e))}")
+        raise typer.Exit(1)
+
+    startup_report(report, console=console, top=top)
+
+    if output is not None:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report, indent=2) + "\n")
+        console.print(f"[dim]Report written to {output}[/dim]")
@@ -1,5 +1,5 @@
+import os
 import typer
-import uvicorn
 import importlib.util
 from pathlib import Path
 from rich.panel import Panel
@@ -8,7 +8,12 @@ from rich.text import Text
 
 from superkit_cli.bootstrap_loader import bootstrap_loader
 from superkit.runtime.registry import runtime
+from superkit.runtime.project import get_project
+from superkit.logging import shutdown_logging
+from superkit.logging.aggregate import AGGREGATOR_ENV, LogAggregator
 from superkit_cli.ui.runtime.server_info import server_info
+from superkit_cli.ui.runtime.startup_report import startup_report
+from superkit_cli.commands.profile.startup import StartupProfileError, collect_startup_profile
 
 run_app = typer.Typer()
 console = Console()
@@ -33,7 +38,7 @@ def validate_app_instance(instance: str) -> bool:
     Validate that the apps instance exists and is a FastAPI apps.
     Returns True if valid, False otherwise.
     """
-    main_path = Path("src/main.py")
+    main_path = get_project().src / "main.py"
 
     if not main_path.exists():
         show_error("src/main.py not found")
@@ -89,6 +94,16 @@ def run(
             "--reload/--no-reload",
             help="Override reload from settings",
         ),
+        workers: int | None = typer.Option(
+            None,
+            "--workers",
+            help="Override worker process count from settings",
+        ),
+        profile_startup: bool = typer.Option(
+            False,
+            "--profile-startup",
+            help="Profile a fresh boot (phases, imports, side effects) before serving",
+        ),
 ):
     # Bootstrap Loader
     bootstrap_loader()
@@ -99,6 +114,15 @@ def run(
     if not validate_app_instance(instance):
         raise typer.Exit(1)
 
+    # ─────────────────────────────────────────────
+    # Startup profile (separate interpreter, same boot)
+    # ─────────────────────────────────────────────
+    if profile_startup:
+        try:
+            startup_report(collect_startup_profile(instance), console=console)
+        except StartupProfileError as e:
+            show_error(f"Startup profiling failed: {e}")
+
     # ─────────────────────────────────────────────
     # Resolve server configuration
     # ─────────────────────────────────────────────
@@ -108,6 +132,10 @@ def run(
     resolved_host = host if host is not None else server["host"]
     resolved_port = port if port is not None else server["port"]
     resolved_reload = reload if reload is not None else server["reload"]
+    resolved_workers = workers if workers is not None else server.get("workers", 1)
+    if resolved_workers > 1:
+        # uvicorn cannot reload multiple workers
+        resolved_reload = False
     environment = server.get("environment", "development")
 
     # ─────────────────────────────────────────────
@@ -126,20 +154,40 @@ def run(
     # ─────────────────────────────────────────────
     # Configure uvicorn to show errors but hide logs
     # ─────────────────────────────────────────────
+    # Imported here so other commands (apps list, ...) start fast
+    import uvicorn
+
     log_config = uvicorn.config.LOGGING_CONFIG
     # Keep error logging enabled
     log_config["loggers"]["uvicorn.error"]["level"] = "ERROR"
-    # Disable access logging
+    # Disable access logging (SuperKit's AccessLogMiddleware logs requests)
     log_config["loggers"]["uvicorn.access"]["handlers"] = []
 
+    # ─────────────────────────────────────────────
+    # Multiple workers: they send records to one aggregator here,
+    # so their output never interleaves
+    # ─────────────────────────────────────────────
+    aggregator = None
+    if resolved_workers > 1:
+        aggregator = LogAggregator().start()
+        os.environ[AGGREGATOR_ENV] = aggregator.path
+
     # ─────────────────────────────────────────────
     # Run uvicorn
     # ─────────────────────────────────────────────
-    uvicorn.run(
-        f"main:{instance}",
-        app_dir="src",
-        host=resolved_host,
-        port=resolved_port,
-        reload=resolved_reload,
-        log_config=log_config,
-    )
\ No newline at end of file
+    try:
+        uvicorn.run(
+            f"main:{instance}",
+            app_dir=str(get_project().src),
+            host=resolved_host,
+            port=resolved_port,
+            reload=resolved_reload,
+            workers=resolved_workers,
+            log_config=log_config,
+            access_log=False,
+        )
+    finally:
+        if aggregator is not None:
+            os.environ.pop(AGGREGATOR_ENV, None)
+            aggregator.close()
+            shutdown_logging()
\ No newline at end of file
@@ -0,0 +1,113 @@
+from rich.console import Console
+from rich.markup import escape
+from rich.table import Table
+from rich.text import Text
+
+CATEGORY_STYLES = {
+    "project": "cyan",
+    "superkit": "green",
+    "third-party": "magenta",
+    "stdlib": "dim",
+    "missing": "dim",
+}
+
+
+def _ms(value: float) -> str:
+    return f"{value:,.1f}"
+
+
+def startup_report(report: dict, *, console: Console | None = None, top: int = 15) -> None:
+    """
+    Render a `collect_startup_profile` report: boot phases, slowest
+    modules, third-party packages and import-time side effects.
+    """
+    console = console or Console()
+    total = report["total_ms"] or 1.0
+    threshold = report["threshold_ms"]
+
+    console.print()
+    console.print(
+        f"[bold]Startup[/bold] {_ms(report['total_ms'])} ms  "
+        f"[dim](interpreter {_ms(report['interpreter_ms'])} ms, "
+        f"{len(report['modules'])} modules imported, "
+        f"{len(report['apps'])} apps)[/dim]"
+    )
+
+    # ---------- phases ----------
+    phases = Table(title="Boot phases", title_justify="left", header_style="bold cyan")
+    phases.add_column("Phase")
+    phases.add_column("ms", justify="right")
+    phases.add_column("%", justify="right")
+    phases.add_column("starts at", justify="right", style="dim")
+    for p in report["phases"]:
+        phases.add_row(
+            "  " * p["depth"] + escape(p["name"]),
+            _ms(p["duration_ms"]),
+            f"{p['duration_ms'] / total * 100:.0f}",
+            _ms(p["start_ms"]),
+        )
+    console.print(phases)
+
+    # ---------- slowest modules ----------
+    offenders = Table(
+        title=f"Slowest modules (own import time, ⚠ ≥ {threshold:g} ms)",
+        title_justify="left",
+        header_style="bold cyan",
+    )
+    offenders.add_column("")
+    offenders.add_column("Module")
+    offenders.add_column("Kind")
+    offenders.add_column("self ms", justify="right")
+    offenders.add_column("cumulative ms", justify="right")
+    offenders.add_column("Imported by", style="dim")
+    for m in report["offenders"][:top]:
+        offenders.add_row(
+            Text("⚠", style="bold red") if m["flagged"] else "",
+            Text(m["module"], style="bold red" if m["flagged"] else ""),
+            Text(m["category"], style=CATEGORY_STYLES.get(m["category"], "")),
+            _ms(m["self_ms"]),
+            _ms(m["cumulative_ms"]),
+            m["imported_by"] or "",
+        )
+    console.print(offenders)
+
+    # ---------- third-party ----------
+    if report["third_party"]:
+        packages = Table(title="Third-party imports", title_justify="left", header_style="bold cyan")
+        packages.add_column("Package")
+        packages.add_column("ms", justify="right")
+        packages.add_column("Modules", justify="right")
+        packages.add_column("Imported by", style="dim")
+        packages.add_column("Heaviest", style="dim")
+        for p in report["third_party"][:top]:
+            importers = sorted(set(p["imported_by"]))
+            packages.add_row(
+                p["package"],
+                _ms(p["cumulative_ms"]),
+                str(p["modules"]),
+                importers[0] + (f" +{len(importers) - 1}" if len(importers) > 1 else ""),
+                ", ".join(f"{name} {_ms(ms)}" for name, ms in p["heaviest"][:2]),
+            )
+        console.print(packages)
+
+    # ---------- side effects ----------
+    effects = report["side_effects"]
+    if effects:
+        table = Table(title="Import-time side effects", title_justify="left", header_style="bold yellow")
+        table.add_column("Module")
+        table.add_column("Effect")
+        table.add_column("Detail")
+        table.add_column("At", style="dim")
+        for effect in effects[:top]:
+            table.add_row(effect["module"], effect["kind"], escape(effect["detail"]), effect["location"])
+        console.print(table)
+        if len(effects) > top:
+            console.print(f"[dim]… {len(effects) - top} more in the JSON report[/dim]")
+    else:
+        console.print("[green]✔[/green] No import-time side effects found")
+
+    if report["lazy_apps"]:
+        console.print(
+            f"[dim]Mounted lazily (load on first request): {', '.join(report['lazy_apps'])}[/dim]"
+        )
+    console.print()
@@ -1,12 +1,20 @@
 from pathlib import Path
 
-def find_project_root(start: Path | None = None) -> Path:
-    current = start or Path.cwd()
+from superkit.runtime.project import ProjectContext, get_project, resolve_project
+
 
-    for parent in [current, *current.parents]:
-        if (parent / "apps").exists() or (parent / "src" / "apps").exists():
-            return parent
+def find_project(start: Path | None = None) -> ProjectContext:
+    """
+    The project around `start` (default: the current one, memoized).
+    Raises RuntimeError outside a project with an apps/ folder.
+    """
+    project = resolve_project(start) if start is not None else get_project()
+    if project.apps_path is None:
+        raise RuntimeError("Not inside a SuperKit project (apps/ folder not found)")
+    return project
 
-    raise RuntimeError("Not inside a SuperKit project (apps/ folder not found)")
+
+def find_project_root(start: Path | None = None) -> Path:
+    return find_project(start).root
 
 